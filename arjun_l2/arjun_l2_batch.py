@@ -87,6 +87,9 @@ class ArjunL2BatchProcessor:
         self.use_role_memory = should_use_role_memory()
         self.memory = None
         self._final_decision_store = get_final_decision_store()
+        # Final decisions are accumulated during the run and written in a
+        # single upsert_many transaction at the end.
+        self._pending_final_decisions: List[dict] = []
 
         if self.memory_enabled:
             try:
@@ -136,299 +139,363 @@ class ArjunL2BatchProcessor:
             )
 
             for candidate in candidate_folders:
-                folder_id = self.drive.get_real_folder_id(candidate)
-                folder_name = candidate["name"]
-                candidate_corr = f"{role_corr}::{folder_name}"
-                self.summary.total_seen += 1
+                self._process_candidate(role, role_folder_id, candidate)
 
-                try:
-                    files = self.drive.list_files(folder_id, correlation_id=candidate_corr)
-                    report = self._load_normalization_report(files, candidate_corr)
-
-                    if not report:
-                        self._mark_data_incomplete(
-                            folder_id,
-                            folder_name,
-                            role,
-                            candidate_corr,
-                            reason="normalization_report_missing",
-                        )
-                        continue
-
-                    # Skip if there are no actual L2 input files (resume, JD, transcript)
-                    if not self._has_l2_material_in_report(report):
-                        logger.info(
-                            "Skipping L2 evaluation for candidate %s: no L2 artifacts found",
-                            folder_name,
-                            extra={
-                                "correlation_id": candidate_corr,
-                                "candidate_name": folder_name,
-                                "role": role,
-                            },
-                        )
-                        self._record_candidate_result(
-                            candidate_name=folder_name,
-                            role=role,
-                            decision=self.DECISION_HOLD,
-                            reason="No L2 artifacts found",
-                            hold_type=self.HOLD_TYPE_SKIPPED_NO_L2,
-                            hold_reason=self.HOLD_REASON_CODE_MISSING_INFO,
-                            candidate_folder_id=folder_id,
-                            risk_flags=["missing_l2_artifacts"],
-                        )
-                        continue
-
-                    gating_status = self._apply_gating(
-                        report,
-                        files,
-                        folder_id,
-                        folder_name,
-                        role,
-                        candidate_corr,
-                    )
-                    if gating_status:
-                        continue
+        self._flush_final_decisions()
 
-                    resume_text = self._extract_text_from_entry(
-                        report["resume"], candidate_corr
-                    )
-                    jd_text = self._extract_text_from_entry(report["jd"], candidate_corr)
-                    
-                    # Use the detected L2 transcript file
-                    l2_transcript_file = find_l2_transcript_file(files)
-                    transcript_text = self._extract_text_from_entry(
-                        l2_transcript_file, candidate_corr
-                    )
+        summary_payload = self.summary.to_logging_dict()
+        logger.info(
+            "arjun_l2_batch_summary",
+            extra={"correlation_id": self.correlation_id, **summary_payload},
+        )
+        return self.summary
 
-                    memory_context, last_l1_event, role_profile = self._prepare_memory_context(
-                        folder_id,
-                        role,
-                        folder_name,
-                        candidate_corr,
-                    )
+    def _process_candidate(self, role: str, role_folder_id: Optional[str], candidate: Dict) -> None:
+        """
+        Run the full L2 pipeline for one candidate folder entry.
 
-                    result = self.arjun.evaluate(
-                        resume_text=resume_text,
-                        jd_text=jd_text,
-                        transcript_text=transcript_text,
-                        memory_context=memory_context,
-                    )
+        Shared by the batch loop and process_single_candidate; errors are
+        recorded on the summary rather than raised.
+        """
+        role_corr = f"{self.correlation_id}::L2::{role}"
+        folder_id = self.drive.get_real_folder_id(candidate)
+        folder_name = candidate["name"]
+        candidate_corr = f"{role_corr}::{folder_name}"
+        self.summary.total_seen += 1
 
-                    recommendation = self._normalize_recommendation(
-                        result.final_recommendation
-                    )
+        try:
+            files = self.drive.list_files(folder_id, correlation_id=candidate_corr)
+            report = self._load_normalization_report(files, candidate_corr)
 
-                    l1_score = self._load_l1_score(files, candidate_corr)
-                    comparison = self._compute_l1_l2_comparison(
-                        l1_score, result.final_score
-                    )
+            if not report:
+                self._mark_data_incomplete(
+                    folder_id,
+                    folder_name,
+                    role,
+                    candidate_corr,
+                    reason="normalization_report_missing",
+                )
+                return
 
-                    evaluation = convert_arjun_result(
-                        candidate_id=folder_id,
-                        role=role,
-                        pipeline_decision=recommendation,
-                        result=result,
-                        alignment_with_l1="unknown",
-                    )
+            # Skip if there are no actual L2 input files (resume, JD, transcript)
+            if not self._has_l2_material_in_report(report):
+                logger.info(
+                    "Skipping L2 evaluation for candidate %s: no L2 artifacts found",
+                    folder_name,
+                    extra={
+                        "correlation_id": candidate_corr,
+                        "candidate_name": folder_name,
+                        "role": role,
+                    },
+                )
+                self._record_candidate_result(
+                    candidate_name=folder_name,
+                    role=role,
+                    decision=self.DECISION_HOLD,
+                    reason="No L2 artifacts found",
+                    hold_type=self.HOLD_TYPE_SKIPPED_NO_L2,
+                    hold_reason=self.HOLD_REASON_CODE_MISSING_INFO,
+                    candidate_folder_id=folder_id,
+                    risk_flags=["missing_l2_artifacts"],
+                )
+                return
 
-                    baseline_l1_score = None
-                    if last_l1_event and last_l1_event.scores:
-                        baseline_l1_score = last_l1_event.scores.get("overall_fit")
-                    elif l1_score is not None:
-                        baseline_l1_score = max(0.0, min(5.0, l1_score / 20))
+            gating_status = self._apply_gating(
+                report,
+                files,
+                folder_id,
+                folder_name,
+                role,
+                candidate_corr,
+            )
+            if gating_status:
+                return
 
-                    alignment = l2_alignment_from_scores(
-                        baseline_l1_score,
-                        evaluation.scores.get("final"),
-                    )
-                    if alignment != evaluation.alignment_with_l1:
-                        evaluation = evaluation.model_copy(update={"alignment_with_l1": alignment})
-
-                    self._persist_l2_result(
-                        folder_id,
-                        evaluation,
-                        result,
-                        recommendation,
-                        comparison,
-                        candidate_corr,
-                    )
+            resume_text = self._extract_text_from_entry(
+                report["resume"], candidate_corr
+            )
+            jd_text = self._extract_text_from_entry(report["jd"], candidate_corr)
 
-                    self._log_to_sheet(role, folder_name, result, evaluation, recommendation)
-
-                    # Use new strict decision engine
-                    l2_outcome = decide_l2_outcome(result.model_dump())
-                    
-                    decision_reason = result.l2_summary or result.rationale
-                    hold_reason_code = None
-                    hold_type = None
-                    
-                    if l2_outcome == "ADVANCE_TO_FINAL":
-                        human_decision = self.DECISION_SHORTLIST
-                        recommendation = "HIRE" # Map back for compatibility if needed
-                    elif l2_outcome == "REJECT_AT_L2":
-                        human_decision = self.DECISION_REJECT
-                        recommendation = "REJECT"
-                    elif l2_outcome == "HOLD_EXEC_REVIEW":
-                        human_decision = self.DECISION_HOLD
-                        hold_reason_code = self.HOLD_REASON_CODE_MANUAL_REVIEW
-                        hold_type = "HOLD_EXEC_REVIEW"
-                        recommendation = "HOLD"
-                    elif l2_outcome == "HOLD_DATA_INCOMPLETE":
-                        human_decision = self.DECISION_HOLD
-                        hold_reason_code = self.HOLD_REASON_CODE_MISSING_INFO
-                        hold_type = self.HOLD_TYPE_DATA_INCOMPLETE
-                        recommendation = "HOLD"
-                    else:
-                        # Fallback
-                        human_decision = self.DECISION_REJECT
-                        recommendation = "REJECT"
-                    final_next_action = self._final_next_action_for_decision(human_decision)
-
-                    self._record_candidate_result(
-                        candidate_name=folder_name,
-                        role=role,
-                        decision=human_decision,
-                        reason=decision_reason,
-                        hold_type=hold_type,
-                        hold_reason=hold_reason_code,
-                        candidate_folder_id=folder_id,
-                        feedback_link=evaluation.feedback_link or evaluation.report_link,
-                        risk_flags=result.risk_flags,
-                    )
-                    self._record_final_decision_if_applicable(
-                        candidate_name=folder_name,
-                        role=role,
-                        decision=human_decision,
-                        next_action=final_next_action,
-                    )
+            # Use the detected L2 transcript file
+            l2_transcript_file = find_l2_transcript_file(files)
+            transcript_text = self._extract_text_from_entry(
+                l2_transcript_file, candidate_corr
+            )
 
-                    # Log structured evaluation and audit event
-                    if self.memory_enabled and self.memory:
-                        try:
-                            # Create debug payload
-                            debug_payload = {
-                                "candidate_id": folder_id,
-                                "candidate_name": folder_name,
-                                "stage": "L2",
-                                "prompt": "ARJUN_L2_PROMPT",
-                                "raw_response": result.model_dump(),
-                                "decision_trace": {
-                                    "l2_outcome": l2_outcome,
-                                    "recommendation": recommendation,
-                                    "decision_reason": decision_reason,
-                                },
-                            }
-                            debug_storage = get_debug_storage()
-                            debug_uri = debug_storage.upload_debug_payload(
-                                debug_payload,
-                                prefix="arjun_l2",
-                                run_id=self.correlation_id
-                            )
-                            
-                            # Log evaluation
-                            self.memory.log_evaluation({
-                                "candidate_id": folder_id,
-                                "stage": "L2",
-                                "engine": "ARJUN",
-                                "scores": evaluation.scores,
-                                "risk_flags": result.risk_flags or [],
-                                "reason_codes": [],
-                                "raw_recommendation": result.final_recommendation,
-                                "decision_outcome": l2_outcome,
-                                "prompt_version": "v1.0",
-                                "decision_logic_version": "v2.0",  # Updated with strict engine
-                                "model_version": "gpt-4",
-                                "debug_payload_uri": debug_uri,
-                            })
-                            
-                            # Log audit event
-                            self.memory.log_audit_event(
-                                actor="ARJUN",
-                                action="L2_EVALUATION_COMPLETE",
-                                from_state="PENDING_L2",
-                                to_state=l2_outcome,
-                                metadata={
-                                    "candidate_id": folder_id,
-                                    "candidate_name": folder_name,
-                                    "role": role,
-                                    "final_score": result.final_score,
-                                }
-                            )
-                        except Exception as log_err:
-                            logger.warning(f"Failed to log L2 evaluation/audit: {log_err}", exc_info=True)
-
-                    self._route_candidate(
-                        recommendation,
-                        folder_id,
-                        role,
-                        folder_name,
-                        candidate_corr,
-                    )
+            memory_context, last_l1_event, role_profile = self._prepare_memory_context(
+                folder_id,
+                role,
+                folder_name,
+                candidate_corr,
+            )
+
+            result = self.arjun.evaluate(
+                resume_text=resume_text,
+                jd_text=jd_text,
+                transcript_text=transcript_text,
+                memory_context=memory_context,
+            )
+
+            recommendation = self._normalize_recommendation(
+                result.final_recommendation
+            )
+
+            l1_score = self._load_l1_score(files, candidate_corr)
+            comparison = self._compute_l1_l2_comparison(
+                l1_score, result.final_score
+            )
+
+            evaluation = convert_arjun_result(
+                candidate_id=folder_id,
+                role=role,
+                pipeline_decision=recommendation,
+                result=result,
+                alignment_with_l1="unknown",
+            )
+
+            baseline_l1_score = None
+            if last_l1_event and last_l1_event.scores:
+                baseline_l1_score = last_l1_event.scores.get("overall_fit")
+            elif l1_score is not None:
+                baseline_l1_score = max(0.0, min(5.0, l1_score / 20))
+
+            alignment = l2_alignment_from_scores(
+                baseline_l1_score,
+                evaluation.scores.get("final"),
+            )
+            if alignment != evaluation.alignment_with_l1:
+                evaluation = evaluation.model_copy(update={"alignment_with_l1": alignment})
+
+            self._persist_l2_result(
+                folder_id,
+                evaluation,
+                result,
+                recommendation,
+                comparison,
+                candidate_corr,
+            )
+
+            self._log_to_sheet(role, folder_name, result, evaluation, recommendation)
+
+            # Use new strict decision engine
+            l2_outcome = decide_l2_outcome(result.model_dump())
+
+            decision_reason = result.l2_summary or result.rationale
+            hold_reason_code = None
+            hold_type = None
+
+            if l2_outcome == "ADVANCE_TO_FINAL":
+                human_decision = self.DECISION_SHORTLIST
+                recommendation = "HIRE" # Map back for compatibility if needed
+            elif l2_outcome == "REJECT_AT_L2":
+                human_decision = self.DECISION_REJECT
+                recommendation = "REJECT"
+            elif l2_outcome == "HOLD_EXEC_REVIEW":
+                human_decision = self.DECISION_HOLD
+                hold_reason_code = self.HOLD_REASON_CODE_MANUAL_REVIEW
+                hold_type = "HOLD_EXEC_REVIEW"
+                recommendation = "HOLD"
+            elif l2_outcome == "HOLD_DATA_INCOMPLETE":
+                human_decision = self.DECISION_HOLD
+                hold_reason_code = self.HOLD_REASON_CODE_MISSING_INFO
+                hold_type = self.HOLD_TYPE_DATA_INCOMPLETE
+                recommendation = "HOLD"
+            else:
+                # Fallback
+                human_decision = self.DECISION_REJECT
+                recommendation = "REJECT"
+            final_next_action = self._final_next_action_for_decision(human_decision)
+
+            self._record_candidate_result(
+                candidate_name=folder_name,
+                role=role,
+                decision=human_decision,
+                reason=decision_reason,
+                hold_type=hold_type,
+                hold_reason=hold_reason_code,
+                candidate_folder_id=folder_id,
+                feedback_link=evaluation.feedback_link or evaluation.report_link,
+                risk_flags=result.risk_flags,
+            )
+            self._record_final_decision_if_applicable(
+                candidate_name=folder_name,
+                role=role,
+                decision=human_decision,
+                next_action=final_next_action,
+            )
 
-                    try:
-                        logger.info(
-                            "[%s::%s] updating_recruiter_dashboard_row",
-                            candidate_corr,
-                            folder_name,
-                        )
-                        self._update_recruiter_dashboard_row(
-                            role=role,
-                            candidate_name=folder_name,
-                            candidate_folder_id=folder_id,
-                            evaluation=evaluation,
-                            result=result,
-                            last_l1_event=last_l1_event,
-                        )
-                        logger.info(
-                            "[%s::%s] recruiter_dashboard_row_updated",
-                            candidate_corr,
-                            folder_name,
-                        )
-                    except Exception:
-                        logger.warning(
-                            "[%s::%s] recruiter_dashboard_update_failed",
-                            candidate_corr,
-                            folder_name,
-                            exc_info=True,
-                        )
-
-                    artifacts = {
-                        "folder_id": folder_id,
-                        "l2_result_path": self.RESULT_FILENAME,
-                        "status_path": self.STATUS_FILENAME,
+            # Log structured evaluation and audit event
+            if self.memory_enabled and self.memory:
+                try:
+                    # Create debug payload
+                    debug_payload = {
+                        "candidate_id": folder_id,
+                        "candidate_name": folder_name,
+                        "stage": "L2",
+                        "prompt": "ARJUN_L2_PROMPT",
+                        "raw_response": result.model_dump(),
+                        "decision_trace": {
+                            "l2_outcome": l2_outcome,
+                            "recommendation": recommendation,
+                            "decision_reason": decision_reason,
+                        },
                     }
-                    self._persist_memory_state(
-                        evaluation=evaluation,
-                        candidate_name=folder_name,
-                        pipeline_recommendation=recommendation,
-                        artifacts=artifacts,
-                        role_profile=role_profile,
-                        l1_alignment=alignment,
-                        resume_text=resume_text,
-                        jd_text=jd_text,
-                        transcript_text=transcript_text,
+                    debug_storage = get_debug_storage()
+                    # Async: only the returned URI is consumed here, and the
+                    # filename is deterministic, so the upload itself can run
+                    # off the evaluation path.
+                    debug_uri = debug_storage.upload_debug_payload_async(
+                        debug_payload,
+                        prefix="arjun_l2",
+                        run_id=self.correlation_id
                     )
 
-                    self.summary.evaluated += 1
-
-                except Exception as exc:
-                    logger.error(
-                        "candidate_processing_failed",
-                        extra={
-                            "correlation_id": candidate_corr,
+                    # Log evaluation
+                    self.memory.log_evaluation({
+                        "candidate_id": folder_id,
+                        "stage": "L2",
+                        "engine": "ARJUN",
+                        "scores": evaluation.scores,
+                        "risk_flags": result.risk_flags or [],
+                        "reason_codes": [],
+                        "raw_recommendation": result.final_recommendation,
+                        "decision_outcome": l2_outcome,
+                        "prompt_version": "v1.0",
+                        "decision_logic_version": "v2.0",  # Updated with strict engine
+                        "model_version": "gpt-4",
+                        "debug_payload_uri": debug_uri,
+                    })
+
+                    # Log audit event
+                    self.memory.log_audit_event(
+                        actor="ARJUN",
+                        action="L2_EVALUATION_COMPLETE",
+                        from_state="PENDING_L2",
+                        to_state=l2_outcome,
+                        metadata={
+                            "candidate_id": folder_id,
                             "candidate_name": folder_name,
                             "role": role,
-                            "error": str(exc),
-                        },
-                        exc_info=True,
+                            "final_score": result.final_score,
+                        }
                     )
-                    self.summary.errors += 1
+                except Exception as log_err:
+                    logger.warning(f"Failed to log L2 evaluation/audit: {log_err}", exc_info=True)
 
-        summary_payload = self.summary.to_logging_dict()
-        logger.info(
-            "arjun_l2_batch_summary",
-            extra={"correlation_id": self.correlation_id, **summary_payload},
-        )
+            self._route_candidate(
+                recommendation,
+                folder_id,
+                role,
+                folder_name,
+                candidate_corr,
+                source_folder_id=role_folder_id,
+            )
+
+            try:
+                logger.info(
+                    "[%s::%s] updating_recruiter_dashboard_row",
+                    candidate_corr,
+                    folder_name,
+                )
+                self._update_recruiter_dashboard_row(
+                    role=role,
+                    candidate_name=folder_name,
+                    candidate_folder_id=folder_id,
+                    evaluation=evaluation,
+                    result=result,
+                    last_l1_event=last_l1_event,
+                )
+                logger.info(
+                    "[%s::%s] recruiter_dashboard_row_updated",
+                    candidate_corr,
+                    folder_name,
+                )
+            except Exception:
+                logger.warning(
+                    "[%s::%s] recruiter_dashboard_update_failed",
+                    candidate_corr,
+                    folder_name,
+                    exc_info=True,
+                )
+
+            artifacts = {
+                "folder_id": folder_id,
+                "l2_result_path": self.RESULT_FILENAME,
+                "status_path": self.STATUS_FILENAME,
+            }
+            self._persist_memory_state(
+                evaluation=evaluation,
+                candidate_name=folder_name,
+                pipeline_recommendation=recommendation,
+                artifacts=artifacts,
+                role_profile=role_profile,
+                l1_alignment=alignment,
+                resume_text=resume_text,
+                jd_text=jd_text,
+                transcript_text=transcript_text,
+            )
+
+            self.summary.evaluated += 1
+
+        except Exception as exc:
+            logger.error(
+                "candidate_processing_failed",
+                extra={
+                    "correlation_id": candidate_corr,
+                    "candidate_name": folder_name,
+                    "role": role,
+                    "error": str(exc),
+                },
+                exc_info=True,
+            )
+            self.summary.errors += 1
+
+    def process_single_candidate(
+        self,
+        role_name: str,
+        candidate_folder_id: str,
+        candidate_name: Optional[str] = None,
+    ) -> L2BatchSummary:
+        """
+        Evaluate one candidate folder directly, bypassing role enumeration.
+
+        Used by on-demand Slack reviews: the caller already knows the
+        candidate folder, so no role folders are listed. Pending final
+        decisions are flushed before returning.
+        """
+        candidate = {
+            "id": candidate_folder_id,
+            "name": candidate_name or candidate_folder_id,
+            "mimeType": "application/vnd.google-apps.folder",
+        }
+        self._process_candidate(role_name, L2_FOLDERS.get(role_name), candidate)
+        self._flush_final_decisions()
+        return self.summary
+
+    def process_candidates_batch(
+        self,
+        role_name: str,
+        folder_ids: List[str],
+        candidate_names: Optional[List[str]] = None,
+    ) -> L2BatchSummary:
+        """
+        Evaluate several candidate folders of one role in a single run.
+
+        Used by multi-candidate Slack reviews: the caller has already
+        resolved the folder ids, so one processor carries the shared
+        role context across all candidates and pending final decisions
+        are flushed once at the end.
+        """
+        names = candidate_names or folder_ids
+        l2_folder_id = L2_FOLDERS.get(role_name)
+        for folder_id, name in zip(folder_ids, names):
+            candidate = {
+                "id": folder_id,
+                "name": name or folder_id,
+                "mimeType": "application/vnd.google-apps.folder",
+            }
+            self._process_candidate(role_name, l2_folder_id, candidate)
+        self._flush_final_decisions()
         return self.summary
 
     # ------------------------------------------------------------------
@@ -716,7 +783,7 @@ class ArjunL2BatchProcessor:
         mime = (entry.get("mimeType") or "").lower()
 
         if mime == "application/vnd.google-apps.document":
-            return self.drive.export_google_doc_to_text(file_id)
+            return self.drive.export_google_doc_to_text(file_id, mime_type=mime)
 
         data = self.drive.download_file_bytes(file_id)
 
@@ -1013,6 +1080,7 @@ class ArjunL2BatchProcessor:
         role: str,
         candidate_name: str,
         correlation_id: str,
+        source_folder_id: Optional[str] = None,
     ) -> None:
         if recommendation == "HIRE":
             target = get_shortlist_folder(role)
@@ -1026,7 +1094,7 @@ class ArjunL2BatchProcessor:
                     },
                 )
                 return
-            self.drive.move_folder(folder_id, target)
+            self.drive.move_folder(folder_id, target, source_folder_id)
             return
 
         if recommendation == "REJECT":
@@ -1041,7 +1109,7 @@ class ArjunL2BatchProcessor:
                     },
                 )
                 return
-            self.drive.move_folder(folder_id, target)
+            self.drive.move_folder(folder_id, target, source_folder_id)
             return
 
         if recommendation == "HOLD":
@@ -1175,23 +1243,33 @@ class ArjunL2BatchProcessor:
         if not label:
             return
 
+        self._pending_final_decisions.append(
+            {
+                "candidate_name": candidate_name,
+                "role": role,
+                "decision": label,
+                "next_action": next_action,
+            }
+        )
+
+    def _flush_final_decisions(self) -> None:
+        if not self._pending_final_decisions or not self._final_decision_store:
+            self._pending_final_decisions = []
+            return
+
         try:
-            self._final_decision_store.upsert_decision(
-                candidate_name=candidate_name,
-                role=role,
-                decision=label,
-                next_action=next_action,
-            )
+            self._final_decision_store.upsert_many(self._pending_final_decisions)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning(
                 "final_decision_store_write_failed",
                 extra={
-                    "candidate": candidate_name,
-                    "role": role,
-                    "decision": decision,
+                    "correlation_id": self.correlation_id,
+                    "pending_decisions": len(self._pending_final_decisions),
                     "error": str(exc),
                 },
             )
+        finally:
+            self._pending_final_decisions = []
 
     def _map_final_decision_label(self, decision: str) -> Optional[str]:
         normalized = (decision or "").strip().lower()
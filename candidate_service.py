@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from difflib import SequenceMatcher, get_close_matches
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
@@ -46,6 +48,7 @@ class CandidateService:
         self._riva_bot = RivaSlackBot(slack_client=None)
         self._arjun_bot = ArjunSlackBot(slack_client=None)
         self._final_decisions: FinalDecisionStore = get_final_decision_store()
+        self._group_key_cache: Dict[Tuple[str, str], Optional[str]] = {}
 
     def get_latest_candidate_snapshot(
         self,
@@ -144,6 +147,34 @@ class CandidateService:
             return None, None
         return snapshot, snapshot.candidate_name
 
+    def get_candidate_records_fuzzy_batch(
+        self,
+        candidate_names: List[str],
+        role_name: Optional[str] = None,
+    ) -> Dict[str, Optional[CandidateSnapshot]]:
+        """Fuzzy-resolve many candidate names against one shared preload.
+
+        Preloading role snapshots is the expensive part (Drive round trips);
+        doing it once and scoring every target against the same name set keeps
+        batch lookups from paying that cost per candidate.
+        """
+
+        results: Dict[str, Optional[CandidateSnapshot]] = {}
+        targets = [(name, _normalize_name(name or "")) for name in candidate_names]
+        if not targets:
+            return results
+
+        preload = self._preload_role_snapshots((role_name or "").strip() or None)
+        names = list(preload.keys())
+
+        for original, normalized in targets:
+            if not normalized:
+                results[original] = None
+                continue
+            matches = get_close_matches(normalized, names, n=1, cutoff=0.6)
+            results[original] = preload[matches[0]] if matches else None
+        return results
+
     # ------------------------------------------------------------------
     def _fetch_l1_snapshot(
         self,
@@ -163,19 +194,20 @@ class CandidateService:
             return None
 
         actual_name, resolved_role, folder_id, files, drive = located
-        status_payload = self._riva_bot._load_json_from_listing(drive, folder_id, self._riva_bot.L1_STATUS, files)  # type: ignore[attr-defined]
-        result_payload = self._riva_bot._load_json_from_listing(drive, folder_id, self._riva_bot.L1_RESULT, files)  # type: ignore[attr-defined]
+        bot = self._riva_bot
+        status_payload = bot._load_json_from_listing(drive, folder_id, bot.L1_STATUS, files) or {}  # type: ignore[attr-defined]
+        result_payload = bot._load_json_from_listing(drive, folder_id, bot.L1_RESULT, files) or {}  # type: ignore[attr-defined]
 
-        status_value = (status_payload or {}).get("status")
-        recommendation = (result_payload or {}).get("recommendation")
-        current_stage = (status_payload or {}).get("current_stage") or "L1"
+        status_value = status_payload.get("status")
+        recommendation = result_payload.get("recommendation")
+        current_stage = status_payload.get("current_stage") or "L1"
         ai_status = status_value or recommendation or "Unknown"
-        next_action = self._riva_bot._map_l1_next_step(ai_status) if ai_status else "Awaiting recruiter action"  # type: ignore[attr-defined]
+        next_action = bot._map_l1_next_step(ai_status) if ai_status else "Awaiting recruiter action"  # type: ignore[attr-defined]
         updated_raw = (
-            (status_payload or {}).get("updated_at")
-            or (status_payload or {}).get("timestamp")
-            or (result_payload or {}).get("updated_at")
-            or (result_payload or {}).get("timestamp")
+            status_payload.get("updated_at")
+            or status_payload.get("timestamp")
+            or result_payload.get("updated_at")
+            or result_payload.get("timestamp")
         )
 
         return {
@@ -183,7 +215,7 @@ class CandidateService:
             "role": resolved_role,
             "current_stage": current_stage,
             "ai_status": ai_status,
-            "l1_outcome": status_value or recommendation or "Unknown",
+            "l1_outcome": ai_status,
             "next_action": next_action,
             "updated_at": updated_raw,
         }
@@ -206,16 +238,17 @@ class CandidateService:
             return None
 
         actual_name, resolved_role, folder_id, files, drive = located
-        status_payload = self._arjun_bot._load_json_from_listing(drive, folder_id, self._arjun_bot.L2_STATUS, files)  # type: ignore[attr-defined]
-        result_payload = self._arjun_bot._load_json_from_listing(drive, folder_id, self._arjun_bot.L2_RESULT, files)  # type: ignore[attr-defined]
+        bot = self._arjun_bot
+        status_payload = bot._load_json_from_listing(drive, folder_id, bot.L2_STATUS, files) or {}  # type: ignore[attr-defined]
+        result_payload = bot._load_json_from_listing(drive, folder_id, bot.L2_RESULT, files) or {}  # type: ignore[attr-defined]
 
-        status_value = (status_payload or {}).get("status") or (result_payload or {}).get("final_recommendation")
-        next_action = self._arjun_bot._map_l2_next_step(status_value) if status_value else "Awaiting recruiter action"  # type: ignore[attr-defined]
+        status_value = status_payload.get("status") or result_payload.get("final_recommendation")
+        next_action = bot._map_l2_next_step(status_value) if status_value else "Awaiting recruiter action"  # type: ignore[attr-defined]
         updated_raw = (
-            (status_payload or {}).get("updated_at")
-            or (status_payload or {}).get("timestamp")
-            or (result_payload or {}).get("updated_at")
-            or (result_payload or {}).get("timestamp")
+            status_payload.get("updated_at")
+            or status_payload.get("timestamp")
+            or result_payload.get("updated_at")
+            or result_payload.get("timestamp")
         )
 
         return {
@@ -224,7 +257,7 @@ class CandidateService:
             "current_stage": "L2",
             "ai_status": status_value,
             "l2_outcome": status_value,
-            "l1_outcome": (status_payload or {}).get("l1_status"),
+            "l1_outcome": status_payload.get("l1_status"),
             "next_action": next_action,
             "updated_at": updated_raw,
         }
@@ -244,9 +277,15 @@ class CandidateService:
 
         drive = bot._get_drive()  # type: ignore[attr-defined]
         normalized_candidate = bot._normalize(candidate_name)  # type: ignore[attr-defined]
-        best_match: Optional[Tuple[str, str, str, List[Dict], DriveManager]] = None
+        best_candidate: Optional[Dict] = None
+        best_role: Optional[str] = None
         best_ratio = 0.0
 
+        # One matcher with the target cached as seq2; SequenceMatcher only
+        # precomputes indices for seq2, so each label just swaps seq1.
+        matcher = SequenceMatcher(None)
+        matcher.set_seq2(normalized_candidate)
+
         for role_map in folder_maps:
             if role_name:
                 role_targets = [bot._resolve_role(role_map, role_name)]  # type: ignore[attr-defined]
@@ -267,7 +306,11 @@ class CandidateService:
 
                 for candidate in candidates:
                     candidate_label = candidate.get("name", "")
-                    normalized_label = bot._normalize(candidate_label)  # type: ignore[attr-defined]
+                    # Cache the normalized label on the listing dict itself so
+                    # repeat passes over the same folder entries skip re-normalizing.
+                    normalized_label = candidate.get("_norm")
+                    if normalized_label is None:
+                        normalized_label = candidate.setdefault("_norm", bot._normalize(candidate_label))  # type: ignore[attr-defined]
                     if normalized_label == normalized_candidate:
                         folder_id = drive.get_real_folder_id(candidate)
                         files = drive.list_files(folder_id)
@@ -276,17 +319,26 @@ class CandidateService:
                         return actual_name, actual_role, folder_id, files, drive
 
                     if allow_fuzzy and normalized_candidate:
-                        ratio = SequenceMatcher(None, normalized_label, normalized_candidate).ratio()
+                        matcher.set_seq1(normalized_label)
+                        # Cheap upper bounds prune labels that cannot beat the
+                        # current best before paying for the quadratic ratio().
+                        if (
+                            matcher.real_quick_ratio() <= best_ratio
+                            or matcher.quick_ratio() <= best_ratio
+                        ):
+                            continue
+                        ratio = matcher.ratio()
                         if ratio > best_ratio:
-                            folder_id = drive.get_real_folder_id(candidate)
-                            files = drive.list_files(folder_id)
-                            actual_role = resolved_role or role_name or "Unknown"
-                            actual_name = candidate_label or candidate_name
                             best_ratio = ratio
-                            best_match = (actual_name, actual_role, folder_id, files, drive)
-
-        if allow_fuzzy and best_match and best_ratio >= 0.72:
-            return best_match
+                            best_candidate = candidate
+                            best_role = resolved_role or role_name or "Unknown"
+
+        if allow_fuzzy and best_candidate and best_ratio >= 0.72:
+            # Only the winning match pays for the Drive round trips.
+            folder_id = drive.get_real_folder_id(best_candidate)
+            files = drive.list_files(folder_id)
+            actual_name = best_candidate.get("name", "") or candidate_name
+            return actual_name, best_role or "Unknown", folder_id, files, drive
         return None
 
     def _build_snapshot_from_dict(
@@ -365,83 +417,84 @@ class CandidateService:
         if not snapshots:
             return None
 
-        final_snaps = sorted(
-            [snap for snap in snapshots if snap.final_decision],
-            key=lambda snap: snap.updated_at,
-            reverse=True,
-        )
+        if len(snapshots) == 1:
+            return snapshots[0]
 
-        if final_snaps:
-            winner = final_snaps[0].model_copy(
-                update={
-                    "current_stage": "Final",
-                    "ai_status": final_snaps[0].final_decision,
-                }
-            )
+        by_date = sorted(snapshots, key=lambda snap: snap.updated_at, reverse=True)
+
+        winner_final = next((snap for snap in by_date if snap.final_decision), None)
+        if winner_final:
+            winner = winner_final
         else:
-            ordered = sorted(
-                snapshots,
+            winner = max(
+                by_date,
                 key=lambda snap: (
                     STAGE_PRIORITY.get((snap.current_stage or "").upper(), 0),
                     snap.updated_at,
                 ),
-                reverse=True,
             )
-            winner = ordered[0]
-
-        l1_outcome = self._latest_stage_value(snapshots, stage="L1", attr="l1_outcome") or winner.l1_outcome
-        l2_outcome = self._latest_stage_value(snapshots, stage="L2", attr="l2_outcome") or winner.l2_outcome
-        next_action = winner.next_action or self._latest_value(snapshots, attr="next_action")
-
-        return winner.model_copy(
-            update={
-                "l1_outcome": l1_outcome,
-                "l2_outcome": l2_outcome,
-                "next_action": next_action,
-            }
-        )
+
+        l1_outcome, l2_outcome = self._latest_stage_outcomes(by_date)
+
+        # Merge everything into one dict and build a single snapshot without
+        # re-validating fields that already passed through Pydantic once.
+        merged = winner.model_dump()
+        if winner_final:
+            merged["current_stage"] = "Final"
+            merged["ai_status"] = winner_final.final_decision
+        merged["l1_outcome"] = l1_outcome or winner.l1_outcome
+        merged["l2_outcome"] = l2_outcome or winner.l2_outcome
+        merged["next_action"] = winner.next_action or self._latest_value(by_date, attr="next_action")
+
+        return CandidateSnapshot.model_construct(**merged)
 
     @staticmethod
-    def _latest_stage_value(
+    def _latest_stage_outcomes(
         snapshots: List[CandidateSnapshot],
-        *,
-        stage: str,
-        attr: str,
-    ) -> Optional[str]:
-        stage_upper = stage.upper()
-        staged = [snap for snap in snapshots if (snap.current_stage or "").upper() == stage_upper]
-        staged.sort(key=lambda snap: snap.updated_at, reverse=True)
-        for snap in staged:
-            value = getattr(snap, attr, None)
-            if value:
-                return value
-        return None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the most recent L1 and L2 outcomes from a pre-sorted (newest-first) list."""
+        l1_outcome: Optional[str] = None
+        l2_outcome: Optional[str] = None
+        for snap in snapshots:
+            stage = (snap.current_stage or "").upper()
+            if l1_outcome is None and stage == "L1" and snap.l1_outcome:
+                l1_outcome = snap.l1_outcome
+            elif l2_outcome is None and stage == "L2" and snap.l2_outcome:
+                l2_outcome = snap.l2_outcome
+            if l1_outcome is not None and l2_outcome is not None:
+                break
+        return l1_outcome, l2_outcome
 
     @staticmethod
     def _latest_value(snapshots: List[CandidateSnapshot], attr: str) -> Optional[str]:
-        ordered = sorted(snapshots, key=lambda snap: snap.updated_at, reverse=True)
-        for snap in ordered:
+        """Return the first non-empty ``attr`` from a pre-sorted (newest-first) list."""
+        for snap in snapshots:
             value = getattr(snap, attr, None)
             if value:
                 return value
         return None
 
-    @staticmethod
-    def _build_group_key(candidate_name: Optional[str], role_name: Optional[str]) -> Optional[str]:
-        normalized_candidate = _normalize_name(candidate_name or "")
-        normalized_role = (role_name or "").strip().lower()
-        if not normalized_candidate or not normalized_role:
-            return None
-        return f"{normalized_candidate}::{normalized_role}"
+    def _build_group_key(self, candidate_name: Optional[str], role_name: Optional[str]) -> Optional[str]:
+        cache_key = (candidate_name or "", role_name or "")
+        if cache_key in self._group_key_cache:
+            return self._group_key_cache[cache_key]
+
+        normalized_candidate = _normalize_name(cache_key[0])
+        normalized_role = cache_key[1].strip().lower()
+        key = (
+            f"{normalized_candidate}::{normalized_role}"
+            if normalized_candidate and normalized_role
+            else None
+        )
+        self._group_key_cache[cache_key] = key
+        return key
 
     @staticmethod
     def _parse_timestamp(value: Optional[str]) -> datetime:
         if isinstance(value, str) and value.strip():
-            cleaned = value.strip().replace("Z", "+00:00")
-            try:
-                return datetime.fromisoformat(cleaned)
-            except ValueError:
-                pass
+            parsed = _parse_iso_timestamp(value)
+            if parsed is not None:
+                return parsed
         return datetime.now(timezone.utc)
 
     def _preload_role_snapshots(self, role_name: Optional[str]) -> Dict[str, CandidateSnapshot]:
@@ -528,5 +581,16 @@ async def get_all_candidate_snapshots(role_name: Optional[str] = None) -> List[C
 CandidateRecord = CandidateSnapshot
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, cached because batch updates repeat the same string."""
+    cleaned = value.strip().replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(cleaned)
+    except ValueError:
+        return None
+
+
 def _normalize_name(value: str) -> str:
-    return " ".join(value.strip().lower().split()) if value else ""
+    # Interned so repeated names hit the identity fast path in dict lookups.
+    return sys.intern(" ".join(value.strip().lower().split())) if value else ""
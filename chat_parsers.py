@@ -126,14 +126,29 @@ def _strip_bot_noise(text: str) -> str:
     return working
 
 
+_ROLE_PATTERN_CACHE: dict[Tuple[str, ...], re.Pattern] = {}
+
+
+def _role_alternation(role_lookup: Mapping[str, str]) -> re.Pattern:
+    """Compile (and cache) one alternation matching any known role mention."""
+    key = tuple(role_lookup)
+    pattern = _ROLE_PATTERN_CACHE.get(key)
+    if pattern is None:
+        alternation = "|".join(
+            re.escape(role) for role in sorted(role_lookup, key=len, reverse=True)
+        )
+        pattern = re.compile(r"\b(" + alternation + r")\b", re.IGNORECASE)
+        _ROLE_PATTERN_CACHE[key] = pattern
+    return pattern
+
+
 def try_extract_role_from_text(text: str, role_lookup: Mapping[str, str]) -> Optional[str]:
-    if not text:
+    if not text or not role_lookup:
         return None
-    lowered = text.lower()
-    for role_lower, canonical in role_lookup.items():
-        if role_lower in lowered:
-            return canonical
-    return None
+    match = _role_alternation(role_lookup).search(text)
+    if not match:
+        return None
+    return role_lookup.get(match.group(1).lower())
 
 
 def _normalize_role(role_text: str, role_lookup: Mapping[str, str]) -> Optional[str]:
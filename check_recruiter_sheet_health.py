@@ -3,13 +3,8 @@
 import os
 import sys
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from services import sheets_service
 
-SERVICE_ACCOUNT_FILE = os.getenv(
-    "GOOGLE_APPLICATION_CREDENTIALS",
-    "infrastructure/service_account.json",
-)
 RECRUITER_SHEET_FILE_ID = os.getenv(
     "RECRUITER_SHEET_FILE_ID",
     "1ZqNfOsyyNs5wBSTU8Xm-IxZAF1X27SpJsDwyaAwvpj4",
@@ -34,32 +29,37 @@ EXPECTED_HEADERS = [
     "Candidate Folder ID",
 ]
 
-
-def get_sheets_service():
-    scopes = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-    creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
-    return build("sheets", "v4", credentials=creds)
+# Header + data ranges, pre-quoted once rather than formatted per run.
+HEALTH_CHECK_RANGES = [
+    range_
+    for role_sheet in ROLE_SHEETS
+    for range_ in (f"'{role_sheet}'!A1:O1", f"'{role_sheet}'!A2:O")
+]
 
 
 def main():
-    service = get_sheets_service()
+    service = sheets_service()
     sheet = service.spreadsheets()
 
     overall_ok = True
 
-    for role_sheet in ROLE_SHEETS:
-        header_range = f"'{role_sheet}'!A1:O1"
-        data_range = f"'{role_sheet}'!A2:O"
-
-        try:
-            header_res = sheet.values().get(
-                spreadsheetId=RECRUITER_SHEET_FILE_ID,
-                range=header_range,
-            ).execute()
-        except Exception as exc:  # pragma: no cover - network interaction
-            print(f"[ERROR] Unable to read sheet '{role_sheet}': {exc}")
-            overall_ok = False
-            continue
+    # One batchGet covering every header + data range instead of two
+    # round-trips per role sheet.
+    try:
+        batch_res = sheet.values().batchGet(
+            spreadsheetId=RECRUITER_SHEET_FILE_ID,
+            ranges=HEALTH_CHECK_RANGES,
+            majorDimension="ROWS",
+        ).execute()
+    except Exception as exc:  # pragma: no cover - network interaction
+        print(f"[ERROR] Unable to read recruiter sheet: {exc}")
+        sys.exit(1)
+
+    value_ranges = batch_res.get("valueRanges", [])
+
+    for index, role_sheet in enumerate(ROLE_SHEETS):
+        header_res = value_ranges[index * 2] if index * 2 < len(value_ranges) else {}
+        data_res = value_ranges[index * 2 + 1] if index * 2 + 1 < len(value_ranges) else {}
 
         headers = header_res.get("values", [[]])[0] if header_res.get("values") else []
         if headers != EXPECTED_HEADERS:
@@ -68,10 +68,6 @@ def main():
             overall_ok = False
             continue
 
-        data_res = sheet.values().get(
-            spreadsheetId=RECRUITER_SHEET_FILE_ID,
-            range=data_range,
-        ).execute()
         rows = data_res.get("values", [])
         print(f"[OK] Sheet '{role_sheet}': {len(rows)} candidate rows, headers valid.")
 
@@ -5,15 +5,11 @@ from __future__ import annotations
 import sys
 from typing import List, Tuple
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from google.oauth2 import service_account
 
-SERVICE_ACCOUNT_FILE = "infrastructure/service_account.json"
-SCOPES = [
-    "https://www.googleapis.com/auth/drive",
-    "https://www.googleapis.com/auth/spreadsheets",
-]
+from services import drive_service as get_drive_service
+from services import sheets_service as get_sheets_service
+
 RECRUITMENT_ROOT_FOLDER_ID = "10PubI_n25X0slnSaWRAfg4ZTSBcB_3PX"
 SPREADSHEET_TITLE = "Hithonix Recruitment Dashboard"
 ROLE_SHEETS: List[str] = ["IT Support", "IT Admin", "HR Support"]
@@ -35,132 +31,92 @@ HEADER_ROW = [
     "Last Updated",
     "Candidate Folder ID",
 ]
+HEADER_RANGES = [f"'{role}'!A1:O1" for role in ROLE_SHEETS]
 
 
 def get_services() -> Tuple[object, object]:
-    """Authenticate and return Drive and Sheets service clients."""
-    creds = service_account.Credentials.from_service_account_file(
-        SERVICE_ACCOUNT_FILE, scopes=SCOPES
-    )
-    drive_service = build("drive", "v3", credentials=creds)
-    sheets_service = build("sheets", "v4", credentials=creds)
-    return drive_service, sheets_service
-
-
-def create_spreadsheet_in_folder(drive_service) -> str:
-    """Create the spreadsheet file directly inside the recruitment root folder."""
-    metadata = {
-        "name": SPREADSHEET_TITLE,
-        "mimeType": "application/vnd.google-apps.spreadsheet",
-        "parents": [RECRUITMENT_ROOT_FOLDER_ID],
-    }
-    file = (
-        drive_service.files()
-        .create(body=metadata, fields="id", supportsAllDrives=True)
-        .execute()
-    )
-    spreadsheet_id = file.get("id")
-    if not spreadsheet_id:
-        raise RuntimeError("Failed to create spreadsheet via Drive API")
-    return spreadsheet_id
+    """Return the shared Drive and Sheets service clients."""
+    return get_drive_service(), get_sheets_service()
 
 
-def _get_default_sheet_id(sheets_service, spreadsheet_id: str) -> int:
-    spreadsheet = (
-        sheets_service.spreadsheets()
-        .get(spreadsheetId=spreadsheet_id, fields="sheets(properties(sheetId,title))")
-        .execute()
-    )
-    sheets = spreadsheet.get("sheets", [])
-    if not sheets:
-        raise RuntimeError("Spreadsheet has no default sheet to rename")
-    return sheets[0]["properties"]["sheetId"]
-
+def create_spreadsheet(sheets_service) -> str:
+    """Create the fully structured workbook with a single Sheets create call.
 
-def setup_role_sheets(sheets_service, spreadsheet_id: str) -> None:
-    """Rename/add sheets for each role, apply headers, and freeze rows."""
+    Every role sheet (sized and frozen) plus the hidden Raw_Log tab is
+    declared in the create body, so no default-sheet lookup, rename, or
+    addSheet batchUpdate is needed afterwards.
+    """
     if not ROLE_SHEETS:
         raise ValueError("ROLE_SHEETS cannot be empty")
 
-    default_sheet_id = _get_default_sheet_id(sheets_service, spreadsheet_id)
-
-    requests = [
+    sheets = [
         {
-            "updateSpreadsheetProperties": {
-                "properties": {"title": SPREADSHEET_TITLE},
-                "fields": "title",
-            }
-        },
-        {
-            "updateSheetProperties": {
-                "properties": {
-                    "sheetId": default_sheet_id,
-                    "title": ROLE_SHEETS[0],
-                    "gridProperties": {
-                        "rowCount": 1000,
-                        "columnCount": 15,
-                        "frozenRowCount": 1,
-                    },
+            "properties": {
+                "title": role,
+                "gridProperties": {
+                    "rowCount": 1000,
+                    "columnCount": 15,
+                    "frozenRowCount": 1,
                 },
-                "fields": "title,gridProperties(rowCount,columnCount,frozenRowCount)",
             }
-        },
+        }
+        for role in ROLE_SHEETS
     ]
-
-    for role in ROLE_SHEETS[1:]:
-        requests.append(
-            {
-                "addSheet": {
-                    "properties": {
-                        "title": role,
-                        "gridProperties": {
-                            "rowCount": 1000,
-                            "columnCount": 15,
-                            "frozenRowCount": 1,
-                        },
-                    }
-                }
+    sheets.append(
+        {
+            "properties": {
+                "title": RAW_LOG_SHEET_NAME,
+                "hidden": True,
+                "gridProperties": {"rowCount": 1000, "columnCount": 10},
             }
+        }
+    )
+
+    spreadsheet = (
+        sheets_service.spreadsheets()
+        .create(
+            body={"properties": {"title": SPREADSHEET_TITLE}, "sheets": sheets},
+            fields="spreadsheetId",
         )
+        .execute()
+    )
+    spreadsheet_id = spreadsheet.get("spreadsheetId")
+    if not spreadsheet_id:
+        raise RuntimeError("Failed to create spreadsheet via Sheets API")
+    return spreadsheet_id
 
-    sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": requests}
-    ).execute()
 
-    for role in ROLE_SHEETS:
-        header_range = f"'{role}'!A1:O1"
-        sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=header_range,
-            valueInputOption="RAW",
-            body={"values": [HEADER_ROW]},
-        ).execute()
+def move_spreadsheet_to_folder(drive_service, spreadsheet_id: str) -> None:
+    """Move the created workbook into the recruitment root folder."""
+    drive_service.files().update(
+        fileId=spreadsheet_id,
+        addParents=RECRUITMENT_ROOT_FOLDER_ID,
+        removeParents="root",
+        supportsAllDrives=True,
+        fields="id",
+    ).execute()
 
 
-def create_raw_log_sheet(sheets_service, spreadsheet_id: str) -> None:
-    """Add a hidden Raw_Log sheet for technical logging."""
-    requests = [
-        {
-            "addSheet": {
-                "properties": {
-                    "title": RAW_LOG_SHEET_NAME,
-                    "hidden": True,
-                    "gridProperties": {"rowCount": 1000, "columnCount": 10},
-                }
-            }
-        }
-    ]
-    sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": requests}
+def write_headers(sheets_service, spreadsheet_id: str) -> None:
+    """Write every role sheet's header row in one values.batchUpdate."""
+    sheets_service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={
+            "valueInputOption": "RAW",
+            "data": [
+                {"range": header_range, "values": [HEADER_ROW]}
+                for header_range in HEADER_RANGES
+            ],
+        },
     ).execute()
 
 
 def main() -> None:
     try:
         drive_service, sheets_service = get_services()
-        spreadsheet_id = create_spreadsheet_in_folder(drive_service)
-        setup_role_sheets(sheets_service, spreadsheet_id)
-        create_raw_log_sheet(sheets_service, spreadsheet_id)
+        spreadsheet_id = create_spreadsheet(sheets_service)
+        move_spreadsheet_to_folder(drive_service, spreadsheet_id)
+        write_headers(sheets_service, spreadsheet_id)
     except HttpError as err:
         print(f"Google API error: {err}", file=sys.stderr)
         sys.exit(1)
@@ -6,8 +6,13 @@ This script lists all children (including shortcuts) in the IT Admin folder
 to help debug folder listing issues.
 """
 
+import logging
+from collections import Counter
+
 from drive_service import DriveManager
 
+logger = logging.getLogger(__name__)
+
 # IT Admin folder ID from folder_map.py
 IT_ADMIN_ID = "1jjrPUX9_4hOQfRi_65A9EEQtynNXZcT8"
 
@@ -31,17 +36,25 @@ def main():
     print(f"Query: {query}")
     print()
     
-    # Call the underlying Google Drive API directly
+    # Call the underlying Google Drive API directly, following pagination so
+    # folders with more than one page of children are fully listed.
     try:
-        results = drive.service.files().list(
-            q=query,
-            fields="files(id,name,mimeType,shortcutDetails,parents)",
-            includeItemsFromAllDrives=True,
-            supportsAllDrives=True,
-            corpora="allDrives"
-        ).execute()
-        
-        files = results.get("files", [])
+        files = []
+        page_token = None
+        while True:
+            results = drive.service.files().list(
+                q=query,
+                fields="nextPageToken,files(id,name,mimeType,shortcutDetails/targetId,shortcutDetails/targetMimeType,parents)",
+                pageSize=1000,
+                pageToken=page_token,
+                includeItemsFromAllDrives=True,
+                supportsAllDrives=True,
+                corpora="allDrives"
+            ).execute()
+            files.extend(results.get("files", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
         
         print(f"Raw children count: {len(files)}")
         print()
@@ -58,14 +71,18 @@ def main():
             print("-" * 70)
             print(f"{'ID':<40} {'Name':<20} {'Type':<15}")
             print("-" * 70)
-            
+
+            # Summary counts accumulate in the same pass as the printout
+            # instead of re-scanning `files` once per type afterwards.
+            type_counts = Counter()
+
             for item in files:
                 item_id = item.get("id", "N/A")
                 item_name = item.get("name", "N/A")
                 mime_type = item.get("mimeType", "N/A")
                 shortcut_details = item.get("shortcutDetails", None)
                 parents = item.get("parents", [])
-                
+
                 # Determine if it's a shortcut
                 is_shortcut = mime_type == "application/vnd.google-apps.shortcut"
                 
@@ -79,7 +96,8 @@ def main():
                     type_display = "FOLDER"
                 else:
                     type_display = "FILE"
-                
+                type_counts[type_display] += 1
+
                 print(f"{item_id:<40} {display_name:<20} {type_display:<15}")
                 
                 # Print detailed info
@@ -101,21 +119,15 @@ def main():
             print("-" * 70)
             print()
             
-            # Summary statistics
-            folders = sum(1 for f in files if f.get("mimeType") == "application/vnd.google-apps.folder")
-            shortcuts = sum(1 for f in files if f.get("mimeType") == "application/vnd.google-apps.shortcut")
-            regular_files = len(files) - folders - shortcuts
-            
+            # Summary statistics (gathered during the listing pass)
             print("Summary:")
             print(f"  Total items: {len(files)}")
-            print(f"  Folders: {folders}")
-            print(f"  Shortcuts: {shortcuts}")
-            print(f"  Regular files: {regular_files}")
+            print(f"  Folders: {type_counts['FOLDER']}")
+            print(f"  Shortcuts: {type_counts['SHORTCUT']}")
+            print(f"  Regular files: {type_counts['FILE']}")
     
-    except Exception as e:
-        print(f"❌ Error querying IT Admin folder: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error querying IT Admin folder")
         return 1
     
     print()
@@ -1,15 +1,22 @@
 
-import json
+import atexit
+import io
 import logging
 import os
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import orjson
+
 try:
     from google.cloud import storage
+    import google_crc32c
 except ImportError:
     storage = None
+    google_crc32c = None
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,31 @@ class DebugStorageService:
             os.makedirs(self.local_debug_dir, exist_ok=True)
             logger.info(f"DebugStorageService using local directory: {self.local_debug_dir}")
 
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="debug-upload")
+        self._pending: "deque[Future]" = deque(maxlen=1024)
+        atexit.register(self._flush)
+
+    def _prepare_upload(
+        self, payload: Dict[str, Any], prefix: str, run_id: Optional[str]
+    ) -> "tuple[bytes, str]":
+        """Serialize the payload and derive its content-addressed filename."""
+        # Compact bytes straight from orjson: ~3x smaller than the old
+        # indent=2 string and no str -> bytes re-encode on upload.
+        json_bytes = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS, default=str)
+
+        run_id = run_id or str(uuid.uuid4())
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        if google_crc32c is not None:
+            # Hardware CRC32C of the body; identical replays within the same
+            # second land on the same object name and skip the re-upload.
+            checksum = google_crc32c.Checksum()
+            checksum.update(json_bytes)
+            crc = checksum.hexdigest().decode()
+            filename = f"{prefix}_{timestamp}_{run_id}_{crc}.json"
+        else:
+            filename = f"{prefix}_{timestamp}_{run_id}.json"
+        return json_bytes, filename
+
     def upload_debug_payload(
         self,
         payload: Dict[str, Any],
@@ -43,43 +75,81 @@ class DebugStorageService:
     ) -> str:
         """
         Uploads a debug payload and returns the URI.
-        
+
         Args:
             payload: The JSON serializable data to store.
             prefix: Prefix for the filename (e.g., 'riva_l1', 'arjun_l2').
             run_id: Correlation ID for the run.
-            
+
         Returns:
             URI string (gs://... or file://...)
         """
-        run_id = run_id or str(uuid.uuid4())
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"{prefix}_{timestamp}_{run_id}.json"
-        
-        json_str = json.dumps(payload, indent=2, default=str)
-        
+        json_bytes, filename = self._prepare_upload(payload, prefix, run_id)
+        return self._do_upload(json_bytes, filename)
+
+    def upload_debug_payload_async(
+        self,
+        payload: Dict[str, Any],
+        prefix: str = "debug",
+        run_id: Optional[str] = None
+    ) -> str:
+        """
+        Queues the upload on a background worker and returns the predicted
+        URI immediately, keeping GCS latency off the evaluation path.
+
+        The filename is deterministic once built, so the returned URI matches
+        what the background upload will produce (unless the upload itself
+        fails, which is logged by the worker).
+        """
+        json_bytes, filename = self._prepare_upload(payload, prefix, run_id)
+        self._pending.append(self._executor.submit(self._do_upload, json_bytes, filename))
+
+        if self.gcs_client and self.bucket_name:
+            return f"gs://{self.bucket_name}/{filename}"
+        return f"file://{os.path.abspath(os.path.join(self.local_debug_dir, filename))}"
+
+    def _flush(self, timeout: float = 10.0) -> None:
+        """Wait briefly for queued uploads (registered via atexit)."""
+        pending = [f for f in self._pending if not f.done()]
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def _do_upload(self, json_bytes: bytes, filename: str) -> str:
         if self.gcs_client and self.bucket_name:
             try:
                 bucket = self.gcs_client.bucket(self.bucket_name)
                 blob = bucket.blob(filename)
-                blob.upload_from_string(json_str, content_type="application/json")
                 uri = f"gs://{self.bucket_name}/{filename}"
+                if google_crc32c is not None and blob.exists():
+                    # Content-addressed name already present: a duplicate
+                    # payload costs one HEAD instead of a write op.
+                    logger.debug(f"Debug payload already at {uri}; skipping upload")
+                    return uri
+                if len(json_bytes) > 5 * 1024 * 1024:
+                    # Large payloads go through the resumable protocol in 1 MB
+                    # chunks instead of one monolithic request body.
+                    blob.chunk_size = 1 << 20
+                blob.upload_from_file(
+                    io.BytesIO(json_bytes),
+                    size=len(json_bytes),
+                    content_type="application/json",
+                    checksum="crc32c",
+                )
                 logger.info(f"Uploaded debug payload to {uri}")
                 return uri
-            except Exception as e:
-                logger.error(f"GCS upload failed: {e}. Falling back to local.")
-                # Fallback to local
-        
+            except Exception:
+                logger.exception("GCS upload failed; falling back to local")
+
         # Local storage
         local_path = os.path.join(self.local_debug_dir, filename)
         try:
-            with open(local_path, "w") as f:
-                f.write(json_str)
+            with open(local_path, "wb") as f:
+                f.write(json_bytes)
             uri = f"file://{os.path.abspath(local_path)}"
             logger.info(f"Saved debug payload to {uri}")
             return uri
-        except Exception as e:
-            logger.error(f"Local debug save failed: {e}")
+        except Exception:
+            logger.exception("Local debug save failed")
             return "error://save_failed"
 
 # Global instance
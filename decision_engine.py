@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 _INTENT_CLASSIFIER_MODEL = os.getenv("INTENT_CLASSIFIER_MODEL", "gpt-4o-mini")
@@ -28,6 +30,10 @@ class Intent(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+_INTENT_BY_VALUE: dict[str, Intent] = {intent.value: intent for intent in Intent}
+_INTENT_VALUES_BULLETS = "\n".join(f"- {intent.value}" for intent in Intent)
+
+
 @dataclass
 class Decision:
     intent: Intent
@@ -42,21 +48,13 @@ def _normalize_bot(bot: str) -> str:
     return bot.strip().upper() or "RIVA"
 
 
-def _matches_any(text: str, phrases: tuple[str, ...]) -> bool:
-    return any(phrase in text for phrase in phrases)
-
+def _compile_any(phrases: tuple[str, ...]) -> re.Pattern:
+    """Compile one substring-matching alternation for a keyword set."""
+    return re.compile("|".join(re.escape(phrase) for phrase in phrases))
 
-def simple_rule_engine(text: Optional[str], bot: str) -> Optional[Decision]:
-    if not text:
-        return None
-
-    normalized = text.strip().lower()
-    if not normalized:
-        return None
-
-    target_bot = _normalize_bot(bot)
 
-    greeting_triggers = (
+GREETING_TRIGGERS = frozenset(
+    (
         "hi",
         "hello",
         "hey",
@@ -68,25 +66,17 @@ def simple_rule_engine(text: Optional[str], bot: str) -> Optional[Decision]:
         "hey riva",
         "hey arjun",
     )
-    if normalized in greeting_triggers or normalized.startswith("hi ") or normalized.startswith("hello "):
-        return Decision(Intent.GREETING, target_bot, 1.0, "rule:greeting")
-
-    if "help" in normalized or "what can you do" in normalized:
-        return Decision(Intent.HELP, target_bot, 0.9, "rule:help")
-
-    if target_bot == "RIVA":
-        if _matches_any(normalized, ("evaluate", "resume", "jd", "summary", "status", "candidate")):
-            return Decision(Intent.L1_EVAL_SINGLE, target_bot, 0.75, "rule:l1_eval")
-        if _matches_any(normalized, ("batch", "run l1", "daily run")):
-            return Decision(Intent.L1_EVAL_BATCH_STATUS, target_bot, 0.7, "rule:l1_batch")
-
-    if target_bot == "ARJUN":
-        if _matches_any(normalized, ("deep dive", "l2", "second opinion", "shortlist")):
-            return Decision(Intent.L2_EVAL_SINGLE, target_bot, 0.75, "rule:l2_eval")
-        if _matches_any(normalized, ("compare", "comparison", "versus", "vs ", "stack rank")):
-            return Decision(Intent.L2_COMPARE, target_bot, 0.72, "rule:l2_compare")
-
-    work_query_keywords = (
+)
+
+# Keyword sets compiled once at import; each rule below is a single scan of
+# the message instead of one substring search per phrase.
+_HELP_PATTERN = _compile_any(("help", "what can you do"))
+_L1_EVAL_PATTERN = _compile_any(("evaluate", "resume", "jd", "summary", "status", "candidate"))
+_L1_BATCH_PATTERN = _compile_any(("batch", "run l1", "daily run"))
+_L2_EVAL_PATTERN = _compile_any(("deep dive", "l2", "second opinion", "shortlist"))
+_L2_COMPARE_PATTERN = _compile_any(("compare", "comparison", "versus", "vs ", "stack rank"))
+_WORK_QUERY_PATTERN = _compile_any(
+    (
         "candidate",
         "role",
         "status",
@@ -103,10 +93,54 @@ def simple_rule_engine(text: Optional[str], bot: str) -> Optional[Decision]:
         "run l1",
         "latest",
     )
-    if _matches_any(normalized, work_query_keywords):
+)
+_SMALL_TALK_PATTERN = _compile_any(("thanks", "thank you", "great", "awesome"))
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _parse_llm_json(raw_content: str) -> dict:
+    """Parse the classifier response, tolerating prose wrapped around the JSON."""
+    try:
+        return orjson.loads(raw_content)
+    except orjson.JSONDecodeError:
+        match = _JSON_OBJECT_PATTERN.search(raw_content)
+        if not match:
+            raise
+        return orjson.loads(match.group(0))
+
+
+def simple_rule_engine(text: Optional[str], bot: str) -> Optional[Decision]:
+    if not text:
+        return None
+
+    normalized = text.strip().lower()
+    if not normalized:
+        return None
+
+    target_bot = _normalize_bot(bot)
+
+    if normalized in GREETING_TRIGGERS or normalized.startswith("hi ") or normalized.startswith("hello "):
+        return Decision(Intent.GREETING, target_bot, 1.0, "rule:greeting")
+
+    if _HELP_PATTERN.search(normalized):
+        return Decision(Intent.HELP, target_bot, 0.9, "rule:help")
+
+    if target_bot == "RIVA":
+        if _L1_EVAL_PATTERN.search(normalized):
+            return Decision(Intent.L1_EVAL_SINGLE, target_bot, 0.75, "rule:l1_eval")
+        if _L1_BATCH_PATTERN.search(normalized):
+            return Decision(Intent.L1_EVAL_BATCH_STATUS, target_bot, 0.7, "rule:l1_batch")
+
+    if target_bot == "ARJUN":
+        if _L2_EVAL_PATTERN.search(normalized):
+            return Decision(Intent.L2_EVAL_SINGLE, target_bot, 0.75, "rule:l2_eval")
+        if _L2_COMPARE_PATTERN.search(normalized):
+            return Decision(Intent.L2_COMPARE, target_bot, 0.72, "rule:l2_compare")
+
+    if _WORK_QUERY_PATTERN.search(normalized):
         return Decision(Intent.WORK_QUERY, target_bot, 0.65, "rule:work_query")
 
-    if _matches_any(normalized, ("thanks", "thank you", "great", "awesome")):
+    if _SMALL_TALK_PATTERN.search(normalized):
         return Decision(Intent.SMALL_TALK, target_bot, 0.6, "rule:smalltalk")
 
     return None
@@ -129,17 +163,7 @@ Bot: {target_bot}
 
 Decide which intent best describes the user's request.
 Valid intents:
-- GREETING
-- HELP
-- L1_EVAL_SINGLE
-- L1_EVAL_BATCH_STATUS
-- L2_EVAL_SINGLE
-- L2_COMPARE
-- PIPELINE_STATUS
-- DEBUG
-- SMALL_TALK
-- WORK_QUERY
-- UNKNOWN
+{_INTENT_VALUES_BULLETS}
 
 Respond ONLY as JSON with fields: intent, confidence (0-1), notes.
 """
@@ -155,14 +179,11 @@ Respond ONLY as JSON with fields: intent, confidence (0-1), notes.
             max_tokens=200,
         )
         raw_content = response.choices[0].message.content.strip()
-        payload = json.loads(raw_content)
+        payload = _parse_llm_json(raw_content)
         intent_value = payload.get("intent", "UNKNOWN")
         confidence = float(payload.get("confidence", 0))
         notes = payload.get("notes", "") or ""
-        try:
-            mapped_intent = Intent(intent_value)
-        except ValueError:
-            mapped_intent = Intent.UNKNOWN
+        mapped_intent = _INTENT_BY_VALUE.get(intent_value, Intent.UNKNOWN)
         return Decision(mapped_intent, target_bot, confidence, notes)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.warning(
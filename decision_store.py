@@ -1,8 +1,15 @@
-from typing import Optional, Dict, Any, List
+import logging
+import os
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from sheet_service import SheetManager
 
+logger = logging.getLogger(__name__)
+
+_RECENT_MAX = 4096
+
 
 class DecisionStore:
     """
@@ -13,15 +20,68 @@ class DecisionStore:
         self,
         sheet_manager: Optional[SheetManager] = None,
         default_sheet_title: str = "Decisions",
+        sheet_id: Optional[str] = None,
     ) -> None:
         self.sheet_manager = sheet_manager or SheetManager()
         self.default_sheet_title = default_sheet_title
+        self.sheet_id = sheet_id or os.getenv("DECISION_SHEET_ID", "")
+        self._batching = False
+        self._buffer: List[List[Any]] = []
+        # Recently appended L1 rows keyed by their identifying values; replays
+        # of an identical decision skip the Sheets round-trip entirely.
+        self._recent: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
 
     # ------------------------------------------------------------------
     def _now_ist_iso(self) -> str:
         # simple UTC timestamp; you can later localise to IST
         return datetime.now(timezone.utc).isoformat()
 
+    # ------------------------------------------------------------------
+    def batch(self) -> "DecisionStore":
+        """
+        Context manager that buffers decision rows and flushes them in one
+        append call, e.g.:
+
+            with store.batch():
+                for candidate in candidates:
+                    store.log_l1_decision(...)
+
+        A batch L1 run otherwise issues one Sheets write per candidate,
+        which burns the per-minute write quota.
+        """
+        return self
+
+    def __enter__(self) -> "DecisionStore":
+        self._batching = True
+        self._buffer = []
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self._batching = False
+        buffered, self._buffer = self._buffer, []
+        if exc_type is None and buffered:
+            # A Sheets failure must not crash the batch run that wrapped
+            # this block; individual writes are guarded the same way by
+            # their callers.
+            try:
+                self.sheet_manager.append_rows(
+                    self.sheet_id, self.default_sheet_title, buffered
+                )
+            except Exception as e:
+                logger.error(
+                    "decision_batch_flush_failed",
+                    extra={"row_count": len(buffered), "error": str(e)},
+                    exc_info=True,
+                )
+
+    def _write_row(self, values: List[Any]) -> Dict[str, Any]:
+        if self._batching:
+            self._buffer.append(values)
+            return {"buffered": True, "pending": len(self._buffer)}
+        return self.sheet_manager.append_rows(
+            self.sheet_id, self.default_sheet_title, [values]
+        )
+
     # ------------------------------------------------------------------
     def log_l1_decision(
         self,
@@ -59,6 +119,22 @@ class DecisionStore:
         O: jd_hash
         P: resume_hash
         """
+        dedupe_key = (
+            candidate_id,
+            jd_hash,
+            resume_hash,
+            l1_decision,
+            round(l1_score, 3),
+        )
+        cached = self._recent.get(dedupe_key)
+        if cached is not None:
+            self._recent.move_to_end(dedupe_key)
+            logger.debug(
+                "l1_decision_idempotent_skip",
+                extra={"candidate_id": candidate_id, "decision": l1_decision},
+            )
+            return cached
+
         reviewed_at = self._now_ist_iso()
 
         values: List[Any] = [
@@ -84,9 +160,18 @@ class DecisionStore:
         # does not expose a dedicated JD column. We still accept it to
         # keep parity with upstream callers.
 
-        return self.sheet_manager.append_row(
-            values, sheet_title=self.default_sheet_title
-        )
+        result = self._write_row(values)
+        self._recent[dedupe_key] = result
+        if len(self._recent) > _RECENT_MAX:
+            self._recent.popitem(last=False)
+        return result
+
+    # ------------------------------------------------------------------
+    def invalidate(self, candidate_id: str) -> None:
+        """Drop cached appends for a candidate so the next log call re-writes."""
+        stale = [key for key in self._recent if key[0] == candidate_id]
+        for key in stale:
+            del self._recent[key]
 
     # ------------------------------------------------------------------
     def log_l2_decision(
@@ -127,6 +212,4 @@ class DecisionStore:
             "",  # resume_hash
         ]
 
-        return self.sheet_manager.append_row(
-            values, sheet_title=self.default_sheet_title
-        )
+        return self._write_row(values)
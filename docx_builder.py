@@ -1,61 +1,133 @@
 import io
+import logging
+import os
+import zipfile
+from xml.sax.saxutils import escape
+
+import docx
 from docx import Document
 
-def build_riva_report_docx(result):
-    """
-    Creates a Riva L1 Evaluation Report as DOCX (returns bytes).
-    """
+logger = logging.getLogger(__name__)
 
-    doc = Document()
+# python-docx re-reads and re-parses its bundled default.docx from disk on
+# every bare Document() call; keep the template bytes in memory once.
+with open(os.path.join(docx.__path__[0], "templates", "default.docx"), "rb") as _f:
+    _TEMPLATE_BYTES = _f.read()
 
-    doc.add_heading("Riva – L1 Evaluation Report", level=1)
-    doc.add_paragraph("Hithonix Solutions Private Limited")
+# Every part of the template except its document body, reused verbatim when
+# packaging fast-path reports.
+with zipfile.ZipFile(io.BytesIO(_TEMPLATE_BYTES)) as _zf:
+    _TEMPLATE_PARTS = [
+        (name, _zf.read(name)) for name in _zf.namelist() if name != "word/document.xml"
+    ]
 
-    doc.add_heading("Candidate Summary", level=2)
-    doc.add_paragraph(result.match_summary)
+_DOCUMENT_XML_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+)
+_DOCUMENT_XML_CLOSE = "</w:body></w:document>"
 
-    doc.add_heading("Strengths", level=2)
-    for s in result.strengths:
-        doc.add_paragraph(f"• {s}")
 
-    doc.add_heading("Concerns", level=2)
-    for c in result.concerns:
-        doc.add_paragraph(f"• {c}")
+def _new_document():
+    return Document(io.BytesIO(_TEMPLATE_BYTES))
 
-    doc.add_heading("Red Flags", level=2)
-    for r in result.red_flags:
-        doc.add_paragraph(f"• {r}")
 
-    doc.add_heading("Communication Signals", level=2)
-    doc.add_paragraph(result.communication_signals)
+def _xml_paragraph(text, style=None):
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return (
+        f"<w:p>{style_xml}"
+        f'<w:r><w:t xml:space="preserve">{escape(str(text))}</w:t></w:r></w:p>'
+    )
 
-    doc.add_heading("Behavioral Signals", level=2)
-    doc.add_paragraph(result.behavioral_signals)
 
-    doc.add_heading("Compensation Alignment", level=2)
-    doc.add_paragraph(result.compensation_alignment)
+def _write_fast_docx(paragraphs, out):
+    """Package (text, style) paragraphs into a DOCX using the cached template parts."""
+    body = "".join(_xml_paragraph(text, style) for text, style in paragraphs)
+    document_xml = f"{_DOCUMENT_XML_OPEN}{body}{_DOCUMENT_XML_CLOSE}"
 
-    doc.add_heading("Joining Feasibility", level=2)
-    doc.add_paragraph(result.joining_feasibility)
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in _TEMPLATE_PARTS:
+            zf.writestr(name, data)
+        zf.writestr("word/document.xml", document_xml)
+    out.seek(0)
+    return out
 
-    doc.add_heading("Final Decision", level=2)
-    doc.add_paragraph(result.final_decision)
 
-    # Return DOCX bytes
-    file_stream = io.BytesIO()
-    doc.save(file_stream)
-    return file_stream.getvalue()
+def build_riva_report_docx(result, out=None):
+    """
+    Creates a Riva L1 Evaluation Report as DOCX.
 
+    The report has a fixed shape (title + nine sections), so the document XML
+    is generated directly and zipped with the cached template parts, skipping
+    python-docx's object graph entirely.
 
-import io
-from docx import Document
+    Writes into `out` (any binary stream) when given, otherwise into a fresh
+    BytesIO; returns the stream seeked to 0 so callers can upload it directly
+    without another full-buffer copy.
+    """
+
+    paragraphs = [
+        ("Riva – L1 Evaluation Report", "Heading1"),
+        ("Hithonix Solutions Private Limited", None),
+        ("Candidate Summary", "Heading2"),
+        (result.match_summary, None),
+        ("Strengths", "Heading2"),
+    ]
+    paragraphs.extend((f"• {s}", None) for s in result.strengths)
+    paragraphs.append(("Concerns", "Heading2"))
+    paragraphs.extend((f"• {c}", None) for c in result.concerns)
+    paragraphs.append(("Red Flags", "Heading2"))
+    paragraphs.extend((f"• {r}", None) for r in result.red_flags)
+    paragraphs.extend(
+        [
+            ("Communication Signals", "Heading2"),
+            (result.communication_signals, None),
+            ("Behavioral Signals", "Heading2"),
+            (result.behavioral_signals, None),
+            ("Compensation Alignment", "Heading2"),
+            (result.compensation_alignment, None),
+            ("Joining Feasibility", "Heading2"),
+            (result.joining_feasibility, None),
+            ("Final Decision", "Heading2"),
+            (result.final_decision, None),
+        ]
+    )
+
+    file_stream = out if out is not None else io.BytesIO()
+    try:
+        return _write_fast_docx(paragraphs, file_stream)
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        logger.warning("fast_docx_write_failed, using python-docx: %s", exc)
+        # The fast path may have written partial zip bytes before failing;
+        # drop them so the fallback below writes into a clean stream instead
+        # of appending to a corrupt prefix.
+        file_stream.seek(0)
+        file_stream.truncate()
+
+    doc = _new_document()
+    for text, style in paragraphs:
+        if style == "Heading1":
+            doc.add_heading(text, level=1)
+        elif style == "Heading2":
+            doc.add_heading(text, level=2)
+        else:
+            doc.add_paragraph(text)
 
-def build_l2_questionnaire(result):
+    doc.save(file_stream)
+    file_stream.seek(0)
+    return file_stream
+
+
+def build_l2_questionnaire(result, out=None):
     """
     Builds a personalized L2 questionnaire using the Riva L1 output.
+
+    Same streaming contract as build_riva_report_docx: returns the output
+    stream seeked to 0.
     """
 
-    doc = Document()
+    doc = _new_document()
 
     doc.add_heading("L2 Interview Questionnaire", level=1)
     doc.add_paragraph("Prepared by Riva – AI Recruiter")
@@ -78,6 +150,7 @@ def build_l2_questionnaire(result):
     for q in personalized_questions:
         doc.add_paragraph(q)
 
-    file_stream = io.BytesIO()
+    file_stream = out if out is not None else io.BytesIO()
     doc.save(file_stream)
-    return file_stream.getvalue()
+    file_stream.seek(0)
+    return file_stream
@@ -1,16 +1,38 @@
+import hashlib
 import io
+from collections import OrderedDict
+
 from docx import Document
 
+# Extracted text keyed by content digest; the same resume is parsed for both
+# L1 and L2 scoring, and the ZIP+XML parse dominates the cost of a repeat.
+_EXTRACT_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_EXTRACT_CACHE_MAX = 256
+
+
 def extract_docx_text(file_bytes: bytes) -> str:
     """
     Extracts plain text from a DOCX file byte buffer.
+
+    Results are cached by content hash so re-reading the same document
+    (e.g. one resume scored at both interview levels) skips the parse.
     """
+    digest = hashlib.blake2b(file_bytes, digest_size=16).digest()
+    cached = _EXTRACT_CACHE.get(digest)
+    if cached is not None:
+        _EXTRACT_CACHE.move_to_end(digest)
+        return cached
+
     try:
         doc = Document(io.BytesIO(file_bytes))
         paragraphs = [p.text for p in doc.paragraphs]
         text = "\n".join(paragraphs).strip()
-        return text
 
     except Exception as e:
         print(f"DOCX extraction error: {e}")
         return ""
+
+    _EXTRACT_CACHE[digest] = text
+    if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_MAX:
+        _EXTRACT_CACHE.popitem(last=False)
+    return text
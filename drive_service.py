@@ -1,12 +1,26 @@
 # drive_service.py
 
+import functools
 import io
-import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import random
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+import orjson
+
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, MediaIoBaseUpload
 from google.oauth2 import service_account
 
 from google_auth_utils import load_service_account_credentials
@@ -18,6 +32,61 @@ load_dotenv()
 # Full Drive access – folders + files + exports
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
+# Drive's batch endpoint accepts at most 100 inner requests per HTTP call.
+BATCH_REQUEST_LIMIT = 100
+
+# Listing projections: the full shape feeds shortcut resolution and moves;
+# the minimal one is enough for file discovery and is ~30-40% fewer bytes.
+LIST_FIELDS_FULL = "nextPageToken,files(id,name,mimeType,shortcutDetails,parents)"
+LIST_FIELDS_MIN = "nextPageToken,files(id,name,mimeType)"
+# Candidate-folder lookup: name matching plus shortcut resolution only, so
+# Drive serializes the smallest payload that get_real_folder_id can use.
+LIST_FIELDS_LOOKUP = "nextPageToken,files(id,name,mimeType,shortcutDetails/targetId)"
+
+# Retries against Drive throttling (429) and transient 5xx, with jittered
+# exponential backoff. Applied to the raw session transport below and, via
+# _exec, to every discovery-client request in this module.
+RETRY_TOTAL = 5
+_SESSION_RETRY = Retry(
+    total=RETRY_TOTAL,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=None,  # GET + PATCH here, both idempotent
+    respect_retry_after_header=True,
+)
+
+
+def _is_transient_batch_error(exception: Exception) -> bool:
+    """True for batch-member failures the session adapter would retry."""
+    status = getattr(exception, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exception, "resp", None), "status", None)
+    return status in _SESSION_RETRY.status_forcelist
+
+
+def _batch_backoff(attempt: int) -> float:
+    """Jittered exponential backoff between batch retry rounds, mirroring
+    _SESSION_RETRY's 0.5 s factor."""
+    return 0.5 * (2 ** attempt) * random.uniform(0.5, 1.0)
+
+class DriveListingError(RuntimeError):
+    """Raised when a batched listing failed for one or more parents.
+
+    Carries {parent_id: exception} so callers can report which folders
+    failed. Listing failures must raise rather than yield empty lists:
+    downstream, an "empty" candidate folder triggers missing-document
+    routing (holds, folder moves, Slack notices), which must never happen
+    because of a transient API error.
+    """
+
+    def __init__(self, failures: Dict[str, Exception]):
+        self.failures = failures
+        super().__init__(
+            f"listing failed for {len(failures)} parent(s): "
+            f"{', '.join(sorted(failures))}"
+        )
+
+
 # Configure logger
 logger = logging.getLogger(__name__)
 if not logger.handlers:
@@ -34,7 +103,79 @@ def _load_service_account_credentials() -> Optional[
     Tuple[service_account.Credentials, Optional[str]]
 ]:
     """Load credentials via shared helper; returns (creds, source_description)."""
-    return load_service_account_credentials(SCOPES)
+    global _CREDS_CACHE
+    if _CREDS_CACHE is None:
+        # Memoized so per-candidate DriveManager construction doesn't re-read
+        # and re-parse the service-account key; failures are not cached.
+        _CREDS_CACHE = load_service_account_credentials(SCOPES)
+    return _CREDS_CACHE
+
+
+_CREDS_CACHE: Optional[Tuple[service_account.Credentials, Optional[str]]] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _drive_discovery_document() -> str:
+    """Return the bundled Drive v3 discovery document, read once per process."""
+    return discovery_cache.get_static_doc("drive", "v3")
+
+
+class _DriveRest:
+    """
+    Thin discovery-free wrapper over AuthorizedSession for simple metadata
+    verbs (files.get / files.update).
+
+    Skips googleapiclient's per-call HttpRequest construction and URI
+    templating; media traffic already bypasses discovery the same way, and
+    list/batch/upload stay on the discovery client for BatchHttpRequest and
+    multipart support.
+    """
+
+    FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+    def __init__(self, session: AuthorizedSession):
+        self._session = session
+
+    def get(self, file_id: str, fields: str) -> Dict:
+        response = self._session.get(
+            f"{self.FILES_URL}/{file_id}",
+            params={"fields": fields, "supportsAllDrives": "true"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def update(
+        self,
+        file_id: str,
+        body: Optional[Dict] = None,
+        add_parents: Optional[str] = None,
+        remove_parents: Optional[str] = None,
+        fields: str = "id",
+    ) -> Dict:
+        params = {"fields": fields, "supportsAllDrives": "true"}
+        if add_parents:
+            params["addParents"] = add_parents
+        if remove_parents:
+            params["removeParents"] = remove_parents
+        response = self._session.patch(
+            f"{self.FILES_URL}/{file_id}",
+            params=params,
+            json=body or {},
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+class _CorrelationLabel(threading.local):
+    """Per-thread correlation label.
+
+    threading.local re-runs __init__ in every thread that first touches the
+    instance, so worker threads start from the manager's construction-time
+    default instead of inheriting whatever another thread last set.
+    """
+
+    def __init__(self, default: str = "no-correlation-id") -> None:
+        self.value = default
 
 
 class DriveManager:
@@ -50,8 +191,8 @@ class DriveManager:
         Args:
             correlation_id: Optional correlation ID for tracing requests
         """
-        self.correlation_id = correlation_id or "no-correlation-id"
-        
+        self._correlation_label = _CorrelationLabel(correlation_id or "no-correlation-id")
+
         creds_tuple = _load_service_account_credentials()
         if not creds_tuple:
             raise RuntimeError("Service account credentials not configured")
@@ -63,43 +204,312 @@ class DriveManager:
             extra={"correlation_id": self.correlation_id},
         )
 
-        self.service = build("drive", "v3", credentials=creds)
+        # Discovery clients funnel every request (including BatchHttpRequest)
+        # through a single httplib2.Http, which is not safe for concurrent
+        # use, so the client is built per thread on first access of
+        # self.service. build_from_document with the cached static discovery
+        # doc keeps that cheap: no discovery fetch/parse per thread.
+        self._creds = creds
+        self._service_local = threading.local()
+
+        # Thread-safe authorized HTTP session for media traffic: one keep-alive
+        # connection pool shared across the download pool below. The pool is
+        # sized to the worker count so concurrent downloads reuse warm TLS
+        # connections instead of handshaking past requests' default of 10.
+        pool_workers = int(os.getenv("DRIVE_POOL", "12"))
+        self._session = AuthorizedSession(creds)
+        adapter = HTTPAdapter(
+            pool_connections=pool_workers,
+            pool_maxsize=pool_workers,
+            max_retries=_SESSION_RETRY,
+        )
+        self._session.mount("https://", adapter)
+        self._rest = _DriveRest(self._session)
+
+        # Bounded pool for parallel per-file downloads/exports; workers share
+        # self._session, which requests makes safe for concurrent use.
+        self._pool = ThreadPoolExecutor(
+            max_workers=pool_workers,
+            thread_name_prefix="drive-io",
+        )
+
+        # Lazy per-parent {name: file dict} index so repeated uploads to the
+        # same folder cost one listing instead of a live query per file.
+        self._name_cache: Dict[str, Dict[str, Dict]] = {}
+
+        # Cross-run (parent, name) -> file_id cache so re-runs resolve known
+        # artifacts without any request. Stale entries are dropped when the
+        # update path hits a 404. Cache unavailability is non-fatal.
+        self._id_cache_lock = threading.Lock()
+        try:
+            self._id_cache = sqlite3.connect(
+                os.getenv("DRIVE_ID_CACHE_PATH", ".drive_id_cache.sqlite"),
+                check_same_thread=False,
+            )
+            self._id_cache.execute(
+                "CREATE TABLE IF NOT EXISTS drive_name_cache ("
+                "parent TEXT NOT NULL, name TEXT NOT NULL, file_id TEXT NOT NULL, "
+                "PRIMARY KEY (parent, name))"
+            )
+            self._id_cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(
+                "drive_id_cache_unavailable",
+                extra={"correlation_id": self.correlation_id, "error": str(e)},
+            )
+            self._id_cache = None
+
+    @property
+    def service(self):
+        """Thread-local discovery client.
+
+        Clients cannot be shared across threads (see __init__), so each
+        thread lazily builds its own from the cached discovery document.
+        Assigning to this attribute installs an override used by all
+        threads, which test scaffolding relies on to inject mocks.
+        """
+        override = self.__dict__.get("_service_override")
+        if override is not None:
+            return override
+        client = getattr(self._service_local, "client", None)
+        if client is None:
+            client = build_from_document(
+                _drive_discovery_document(), credentials=self._creds
+            )
+            self._service_local.client = client
+        return client
+
+    @service.setter
+    def service(self, client) -> None:
+        self.__dict__["_service_override"] = client
+
+    @property
+    def correlation_id(self) -> str:
+        return self._correlation().value
+
+    @correlation_id.setter
+    def correlation_id(self, value: Optional[str]) -> None:
+        self._correlation().value = value or "no-correlation-id"
+
+    def _correlation(self) -> _CorrelationLabel:
+        # Lazily created so bare instances built via __new__ in tests can
+        # still read and assign correlation_id.
+        label = self.__dict__.get("_correlation_label")
+        if label is None:
+            label = self.__dict__["_correlation_label"] = _CorrelationLabel()
+        return label
+
+    def set_correlation_id(self, correlation_id: Optional[str]) -> None:
+        """Re-label this manager for a new logical operation.
+
+        The label is thread-local: it only affects the correlation id
+        stamped on log records emitted from the calling thread, so
+        concurrent operations on a shared instance cannot cross-label
+        each other. New worker threads start from the construction-time
+        default and should set their own label on entry.
+        """
+        self.correlation_id = correlation_id
+
+    def _exec(self, request):
+        """Execute a discovery-client request with the module retry policy."""
+        return request.execute(num_retries=RETRY_TOTAL)
+
+    def close(self) -> None:
+        """Shut down the download pool; the manager stays usable serially."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "DriveManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Private helper - raw list matching debug_it_admin.py
     # ------------------------------------------------------------------
-    def _raw_list(self, parent_id: str) -> List[Dict]:
+    def _raw_list(self, parent_id: str, fields: str = LIST_FIELDS_FULL) -> List[Dict]:
         """
         Raw list call matching debug_it_admin.py query and flags.
         Returns all items (folders and files) under parent_id.
         """
-        response = (
-            self.service.files()
-            .list(
-                q=f"'{parent_id}' in parents and trashed=false",
-                fields="files(id,name,mimeType,shortcutDetails,parents)",
-                includeItemsFromAllDrives=True,
+        return self.list_many([parent_id], fields=fields).get(parent_id, [])
+
+    def _execute_batched(
+        self,
+        requests: Dict[str, object],
+        on_response: Callable[[str, Dict], None],
+    ) -> Dict[str, Exception]:
+        """Execute discovery requests in BatchHttpRequest pages, retrying
+        transient member failures.
+
+        num_retries only covers whole top-level requests: a 429/5xx on an
+        individual batch member reaches the callback with no retry at all,
+        and batched files.list/files.get is exactly where Drive's
+        per-sub-request throttling concentrates. Members failing with a
+        status _SESSION_RETRY would retry are re-enqueued in a follow-up
+        batch after a jittered exponential backoff, bounded by RETRY_TOTAL
+        rounds like the session adapter.
+
+        Successful responses are delivered to on_response(request_id,
+        response). Returns {request_id: exception} for members that still
+        failed after retries or failed non-retryably.
+        """
+        failures: Dict[str, Exception] = {}
+        pending = dict(requests)
+        for attempt in range(RETRY_TOTAL + 1):
+            retry_next: Dict[str, object] = {}
+
+            def _collect(request_id: str, response, exception) -> None:
+                if exception is None:
+                    on_response(request_id, response)
+                elif attempt < RETRY_TOTAL and _is_transient_batch_error(exception):
+                    retry_next[request_id] = pending[request_id]
+                else:
+                    failures[request_id] = exception
+
+            items = list(pending.items())
+            for start in range(0, len(items), BATCH_REQUEST_LIMIT):
+                batch: BatchHttpRequest = self.service.new_batch_http_request(
+                    callback=_collect
+                )
+                for request_id, request in items[start : start + BATCH_REQUEST_LIMIT]:
+                    batch.add(request, request_id=request_id)
+                batch.execute()
+
+            if not retry_next:
+                break
+            logger.warning(
+                "batched_requests_retrying",
+                extra={
+                    "correlation_id": self.correlation_id,
+                    "count": len(retry_next),
+                    "attempt": attempt + 1,
+                },
+            )
+            time.sleep(_batch_backoff(attempt))
+            pending = retry_next
+        return failures
+
+    def list_many(
+        self, parent_ids: List[str], fields: str = LIST_FIELDS_FULL
+    ) -> Dict[str, List[Dict]]:
+        """
+        List the children of many parent folders with batched HTTP calls.
+
+        Per-parent list requests are coalesced into BatchHttpRequest pages of
+        up to 100, so walking N candidate folders costs ceil(N / 100) HTTP
+        round-trips instead of N. Pages of 1000 items are followed via
+        nextPageToken (further batched), so large folders are no longer
+        silently truncated at the API default of 100. Throttled or 5xx
+        members are retried by _execute_batched; if a parent's listing
+        still fails, DriveListingError is raised after the remaining
+        parents complete: an empty result must mean the folder really is
+        empty, never that a sub-request was throttled (callers route
+        "missing documents" off empty listings).
+
+        Returns: {parent_id: [items]} preserving _raw_list's item shape.
+
+        Raises:
+            DriveListingError: when any requested parent could not be
+                listed; .failures maps parent_id to the underlying error.
+        """
+        results: Dict[str, List[Dict]] = {pid: [] for pid in parent_ids}
+        page_tokens: Dict[str, str] = {}
+        failures: Dict[str, Exception] = {}
+
+        def _on_page(request_id: str, response: Dict) -> None:
+            items = response.get("files", [])
+            for item in items:
+                # Lower the mimeType once per item; the classification
+                # helpers below read _mt instead of re-lowering per call.
+                item["_mt"] = (item.get("mimeType") or "").lower()
+            results[request_id].extend(items)
+            next_token = response.get("nextPageToken")
+            if next_token:
+                page_tokens[request_id] = next_token
+
+        pending: Dict[str, Optional[str]] = {pid: None for pid in results}
+        while pending:
+            page_tokens.clear()
+            requests = {
+                parent_id: self.service.files().list(
+                    q=f"'{parent_id}' in parents and trashed=false",
+                    fields=fields,
+                    pageSize=1000,
+                    pageToken=token,
+                    includeItemsFromAllDrives=True,
+                    supportsAllDrives=True,
+                    corpora="allDrives",
+                )
+                for parent_id, token in pending.items()
+            }
+            for parent_id, exception in self._execute_batched(requests, _on_page).items():
+                logger.warning(
+                    "batched_list_failed",
+                    extra={
+                        "correlation_id": self.correlation_id,
+                        "folder_id": parent_id,
+                        "error": str(exception),
+                    },
+                )
+                failures[parent_id] = exception
+            pending = dict(page_tokens)
+        if failures:
+            raise DriveListingError(failures)
+        return results
+
+    def get_mimetypes(self, file_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch mimeType for many files in batched metadata probes.
+
+        Same batching and retry scheme as list_many; files whose probe
+        still fails afterwards are omitted from the result.
+        """
+        results: Dict[str, str] = {}
+
+        def _on_response(request_id: str, response: Dict) -> None:
+            results[request_id] = response.get("mimeType", "")
+
+        requests = {
+            file_id: self.service.files().get(
+                fileId=file_id,
+                fields="mimeType",
                 supportsAllDrives=True,
-                corpora="allDrives",
             )
-            .execute()
-        )
-        return response.get("files", [])
+            for file_id in dict.fromkeys(file_ids)
+        }
+        for file_id, exception in self._execute_batched(requests, _on_response).items():
+            logger.warning(
+                "batched_mimetype_probe_failed",
+                extra={
+                    "correlation_id": self.correlation_id,
+                    "file_id": file_id,
+                    "error": str(exception),
+                },
+            )
+        return results
 
     # ------------------------------------------------------------------
     # Folder classification helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _lowered_mimetype(item: Dict) -> str:
+        """Return the item's lowered mimeType, precomputed by list_many."""
+        mt = item.get("_mt")
+        if mt is None:
+            mt = (item.get("mimeType") or "").lower()
+        return mt
+
     def is_folder(self, item: Dict) -> bool:
         """Check if an item is a regular folder."""
-        mt = (item.get("mimeType") or "").lower()
-        return "folder" in mt
+        return "folder" in self._lowered_mimetype(item)
 
     def is_folder_like(self, item: Dict) -> bool:
         """
         Check if an item is folder-like (real folder or shortcut).
         Future-proofed for shortcuts even if not currently present.
         """
-        mt = (item.get("mimeType") or "").lower()
+        mt = self._lowered_mimetype(item)
         return (
             "folder" in mt
             or mt == "application/vnd.google-apps.shortcut"
@@ -109,8 +519,7 @@ class DriveManager:
         """
         Get the real folder ID, resolving shortcuts to their target.
         """
-        mt = (item.get("mimeType") or "").lower()
-        if mt == "application/vnd.google-apps.shortcut":
+        if self._lowered_mimetype(item) == "application/vnd.google-apps.shortcut":
             return item.get("shortcutDetails", {}).get("targetId") or item.get("id")
         return item.get("id")
 
@@ -136,12 +545,19 @@ class DriveManager:
         )
         return folders
 
-    def list_folder_like(self, parent_id: str, correlation_id: Optional[str] = None) -> List[Dict]:
+    def list_folder_like(
+        self,
+        parent_id: str,
+        correlation_id: Optional[str] = None,
+        fields: str = LIST_FIELDS_FULL,
+    ) -> List[Dict]:
         """
         List folder-like items (real folders + shortcuts) under parent_id.
         Use this for discovering candidates when shortcuts might exist.
+        Callers that only match names and resolve shortcuts can pass
+        fields=LIST_FIELDS_LOOKUP for a smaller response.
         """
-        items = self._raw_list(parent_id)
+        items = self._raw_list(parent_id, fields=fields)
         folder_like = [i for i in items if self.is_folder_like(i)]
         
         corr_id = correlation_id or "no-correlation-id"
@@ -155,6 +571,38 @@ class DriveManager:
         )
         return folder_like
 
+    def list_folders_batch(
+        self,
+        parent_ids: List[str],
+        correlation_id: Optional[str] = None,
+        fields: str = LIST_FIELDS_FULL,
+    ) -> Dict[str, List[Dict]]:
+        """
+        List folder-like items under many parents in one batched round trip.
+
+        Use this when a caller needs several role folders at once (e.g. a
+        Slack session touching both L1 and L2): the per-parent listings are
+        coalesced by list_many instead of issued sequentially.
+
+        Returns: {parent_id: [folder-like items]}.
+        """
+        listings = self.list_many(parent_ids, fields=fields)
+        results = {
+            parent_id: [i for i in items if self.is_folder_like(i)]
+            for parent_id, items in listings.items()
+        }
+
+        corr_id = correlation_id or "no-correlation-id"
+        logger.info(
+            "listed_folders_batch",
+            extra={
+                "parent_count": len(parent_ids),
+                "count": sum(len(items) for items in results.values()),
+                "correlation_id": corr_id,
+            },
+        )
+        return results
+
     def list_files(self, parent_id: str, correlation_id: Optional[str] = None) -> List[Dict]:
         """
         List only file items (non-folders) under parent_id.
@@ -162,7 +610,7 @@ class DriveManager:
         
         Returns: list of dicts with keys: id, name, mimeType
         """
-        items = self._raw_list(parent_id)
+        items = self._raw_list(parent_id, fields=LIST_FIELDS_MIN)
         files = [i for i in items if not self.is_folder(i)]
         
         corr_id = correlation_id or "no-correlation-id"
@@ -183,61 +631,134 @@ class DriveManager:
         """
         Download a binary file to dest_path.
         """
-        request = self.service.files().get_media(
-            fileId=file_id
+        # Stream straight from the response into the file through a fixed
+        # 1 MB buffer: constant memory for arbitrarily large attachments and
+        # no per-chunk Python bookkeeping.
+        url = (
+            f"https://www.googleapis.com/drive/v3/files/{file_id}"
+            "?alt=media&supportsAllDrives=true"
+        )
+        with self._session.get(url, stream=True) as response, open(dest_path, "wb") as fh:
+            response.raise_for_status()
+            shutil.copyfileobj(response.raw, fh, 1 << 20)
+        logger.info(
+            "downloaded_file",
+            extra={
+                "correlation_id": self.correlation_id,
+                "file_id": file_id,
+                "dest_path": dest_path,
+                "size": os.path.getsize(dest_path),
+            },
         )
-        fh = io.FileIO(dest_path, "wb")
-        downloader = MediaIoBaseDownload(fh, request)
-
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                print(f"[DriveManager] Download {int(status.progress() * 100)}%.")
 
     def download_file_bytes(self, file_id: str) -> bytes:
         """Download a binary file and return its bytes payload."""
-        request = self.service.files().get_media(fileId=file_id)
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                logger.debug(
-                    "download_progress",
+        return self._download_bytes(file_id)
+
+    def download_files_bytes(self, file_ids: List[str]) -> Dict[str, bytes]:
+        """
+        Download many files in parallel on the shared pool.
+
+        Each worker thread uses its own drive client (googleapiclient http
+        objects are not thread-safe). Files that fail to download are omitted
+        from the result (logged), so batch jobs don't crash.
+
+        Returns: {file_id: bytes}
+        """
+
+        def _one(file_id: str) -> Tuple[str, Optional[bytes]]:
+            try:
+                return file_id, self._download_bytes(file_id)
+            except Exception as e:
+                logger.warning(
+                    "parallel_download_failed",
                     extra={
                         "correlation_id": self.correlation_id,
                         "file_id": file_id,
-                        "progress": int(status.progress() * 100),
+                        "error": str(e),
                     },
                 )
+                return file_id, None
 
-        fh.seek(0)
-        data = fh.read()
+        return {
+            file_id: data
+            for file_id, data in self._pool.map(_one, file_ids)
+            if data is not None
+        }
+
+    def _download_bytes(self, file_id: str) -> bytes:
+        # Single streaming GET instead of MediaIoBaseDownload's per-chunk
+        # Range requests: one HTTP transaction per file and no progress
+        # bookkeeping on the hot loop.
+        url = (
+            f"https://www.googleapis.com/drive/v3/files/{file_id}"
+            "?alt=media&supportsAllDrives=true"
+        )
+        with self._session.get(url, stream=True) as response:
+            response.raise_for_status()
+            data = response.content
         logger.info(
             "downloaded_file_bytes",
             extra={"correlation_id": self.correlation_id, "file_id": file_id, "size": len(data)},
         )
         return data
 
+    def _cached_file_id(self, parent_id: str, filename: str) -> Optional[str]:
+        if self._id_cache is None:
+            return None
+        with self._id_cache_lock:
+            row = self._id_cache.execute(
+                "SELECT file_id FROM drive_name_cache WHERE parent = ? AND name = ?",
+                (parent_id, filename),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _remember_file_ids(self, parent_id: str, names_to_ids: Dict[str, str]) -> None:
+        if self._id_cache is None or not names_to_ids:
+            return
+        with self._id_cache_lock:
+            self._id_cache.executemany(
+                "INSERT OR REPLACE INTO drive_name_cache (parent, name, file_id) VALUES (?, ?, ?)",
+                [(parent_id, name, fid) for name, fid in names_to_ids.items()],
+            )
+            self._id_cache.commit()
+
+    def _forget_file_id(self, parent_id: str, filename: str) -> None:
+        index = self._name_cache.get(parent_id)
+        if index is not None:
+            index.pop(filename, None)
+        if self._id_cache is None:
+            return
+        with self._id_cache_lock:
+            self._id_cache.execute(
+                "DELETE FROM drive_name_cache WHERE parent = ? AND name = ?",
+                (parent_id, filename),
+            )
+            self._id_cache.commit()
+
     def _find_file_by_name(self, parent_id: str, filename: str) -> Optional[Dict]:
-        """Return the first file under parent_id with the exact filename, if any."""
-        response = (
-            self.service.files()
-            .list(
-                q=f"'{parent_id}' in parents and name='{filename}' and trashed=false",
-                spaces="drive",
-                fields="files(id,name,mimeType)",
-                includeItemsFromAllDrives=True,
-                supportsAllDrives=True,
-                corpora="allDrives",
+        """Return the first file under parent_id with the exact filename, if any.
+
+        Lookup order: the in-memory per-parent index, then the persistent
+        id cache (zero-request hit for re-runs), then one listing that
+        populates both. _upload_bytes keeps the caches current.
+        """
+        index = self._name_cache.get(parent_id)
+        if index is None:
+            cached_id = self._cached_file_id(parent_id, filename)
+            if cached_id:
+                return {"id": cached_id, "name": filename}
+            index = {
+                item.get("name"): item
+                for item in self._raw_list(parent_id)
+                if not self.is_folder(item)
+            }
+            self._name_cache[parent_id] = index
+            self._remember_file_ids(
+                parent_id,
+                {name: item["id"] for name, item in index.items() if item.get("id")},
             )
-            .execute()
-        )
-        files = response.get("files", [])
-        return files[0] if files else None
+        return index.get(filename)
 
     def _upload_bytes(
         self,
@@ -264,17 +785,30 @@ class DriveManager:
                     "drive_file_name": filename,
                 },
             )
-            return (
-                self.service.files()
-                .update(
-                    fileId=existing["id"],
-                    media_body=media,
-                    body={"name": filename},
-                    supportsAllDrives=True,
-                    fields="id, name",
+            try:
+                return self._exec(
+                    self.service.files().update(
+                        fileId=existing["id"],
+                        media_body=media,
+                        body={"name": filename},
+                        supportsAllDrives=True,
+                        fields="id, name",
+                    )
                 )
-                .execute()
-            )
+            except HttpError as err:
+                if err.resp is None or err.resp.status != 404:
+                    raise
+                # Cached id points at a deleted file; drop it and create anew.
+                logger.warning(
+                    "stale_cached_file_id",
+                    extra={
+                        "correlation_id": self.correlation_id,
+                        "file_id": existing["id"],
+                        "parent_id": parent_id,
+                        "drive_file_name": filename,
+                    },
+                )
+                self._forget_file_id(parent_id, filename)
 
         logger.info(
             "Creating Drive file %s in folder %s (mime=%s)",
@@ -287,16 +821,20 @@ class DriveManager:
                 "drive_file_name": filename,
             },
         )
-        return (
-            self.service.files()
-            .create(
+        created = self._exec(
+            self.service.files().create(
                 body=metadata,
                 media_body=media,
                 supportsAllDrives=True,
                 fields="id, name",
             )
-            .execute()
         )
+        index = self._name_cache.get(parent_id)
+        if index is not None:
+            index[filename] = {**created, "mimeType": mime_type}
+        if created.get("id"):
+            self._remember_file_ids(parent_id, {filename: created["id"]})
+        return created
 
     def write_text_file(
         self,
@@ -311,7 +849,9 @@ class DriveManager:
 
     def write_json_file(self, parent_id: str, filename: str, data: Dict) -> Dict:
         """Upload structured JSON data with pretty formatting."""
-        payload = json.dumps(data, indent=4, sort_keys=True).encode("utf-8")
+        # orjson serializes straight to bytes, far faster than stdlib json
+        # for the sizeable evaluation payloads written per candidate.
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
         return self._upload_bytes(
             parent_id,
             filename,
@@ -322,9 +862,18 @@ class DriveManager:
     # ------------------------------------------------------------------
     # Move a folder to a new parent
     # ------------------------------------------------------------------
-    def move_folder(self, folder_id: str, new_parent_id: str) -> None:
+    def move_folder(
+        self,
+        folder_id: str,
+        new_parent_id: str,
+        current_parent_id: Optional[str] = None,
+    ) -> None:
         """
         Move a folder into a new parent folder.
+
+        Callers that already know the origin parent (e.g. from a prior
+        listing) should pass current_parent_id to skip the metadata GET,
+        halving the round trips per move.
         """
         logger.info(
             "Moving folder %s to parent %s",
@@ -336,21 +885,19 @@ class DriveManager:
                 "new_parent_id": new_parent_id
             }
         )
-        
-        file = (
-            self.service.files()
-            .get(fileId=folder_id, fields="parents", supportsAllDrives=True)
-            .execute()
-        )
-        prev_parents = ",".join(file.get("parents", []))
 
-        self.service.files().update(
-            fileId=folder_id,
-            addParents=new_parent_id,
-            removeParents=prev_parents,
-            fields="id, parents",
-            supportsAllDrives=True,
-        ).execute()
+        if current_parent_id:
+            prev_parents = current_parent_id
+        else:
+            file = self._rest.get(folder_id, fields="parents")
+            prev_parents = ",".join(file.get("parents", []))
+
+        self._rest.update(
+            folder_id,
+            add_parents=new_parent_id,
+            remove_parents=prev_parents,
+            fields="id,parents",
+        )
 
         logger.info(
             "Successfully moved folder %s to parent %s",
@@ -381,12 +928,7 @@ class DriveManager:
             }
         )
         
-        self.service.files().update(
-            fileId=file_id,
-            body={"name": new_name},
-            fields="id, name",
-            supportsAllDrives=True,
-        ).execute()
+        self._rest.update(file_id, body={"name": new_name}, fields="id,name")
         
         logger.info(
             "Successfully renamed file %s to %s",
@@ -403,27 +945,21 @@ class DriveManager:
     # ------------------------------------------------------------------
     # Export Google Docs → text (safe version)
     # ------------------------------------------------------------------
-    def export_google_doc_to_text(self, file_id: str) -> str:
+    def export_google_doc_to_text(self, file_id: str, mime_type: Optional[str] = None) -> str:
         """
         Export a Google Docs file to plain text and return its content.
 
+        Callers that already hold the file's mimeType (every list result
+        includes it) should pass mime_type to skip the metadata probe.
+
         If the file is NOT a Google Doc (e.g. PDF, image, etc.), this method:
         - logs a warning
         - returns an empty string
         without raising, so batch jobs don't crash.
         """
 
-        # Check mimeType first
-        meta = (
-            self.service.files()
-            .get(
-                fileId=file_id,
-                fields="mimeType",
-                supportsAllDrives=True,
-            )
-            .execute()
-        )
-        mime = meta.get("mimeType", "")
+        # Check mimeType first (batched probe, single-item case)
+        mime = mime_type if mime_type is not None else self.get_mimetypes([file_id]).get(file_id, "")
         if mime != "application/vnd.google-apps.document":
             logger.warning(
                 "export_google_doc_to_text called on non-Doc (mimeType=%s, fileId=%s). Returning empty text.",
@@ -438,26 +974,7 @@ class DriveManager:
             return ""
 
         try:
-            logger.debug(
-                "Exporting Google Doc %s to text",
-                file_id,
-                extra={"correlation_id": self.correlation_id, "file_id": file_id}
-            )
-            
-            request = self.service.files().export_media(
-                fileId=file_id,
-                mimeType="text/plain",
-            )
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-
-            fh.seek(0)
-            content = fh.read().decode("utf-8", errors="ignore")
-            
+            content = self._export_doc_text(file_id)
             logger.info(
                 "Successfully exported Google Doc %s (%d chars)",
                 file_id,
@@ -484,3 +1001,53 @@ class DriveManager:
                 exc_info=True
             )
             return ""
+
+    def export_google_docs_to_text(self, file_ids: List[str]) -> Dict[str, str]:
+        """
+        Export many Google Docs to plain text in parallel.
+
+        mimeTypes are probed in one batched call first; non-Docs map to ""
+        (matching the single-file method) and only real Docs hit the pool.
+
+        Returns: {file_id: text}
+        """
+        mimetypes = self.get_mimetypes(file_ids)
+        results: Dict[str, str] = {}
+        doc_ids: List[str] = []
+        for file_id in dict.fromkeys(file_ids):
+            if mimetypes.get(file_id) == "application/vnd.google-apps.document":
+                doc_ids.append(file_id)
+            else:
+                results[file_id] = ""
+
+        def _one(file_id: str) -> Tuple[str, str]:
+            try:
+                return file_id, self._export_doc_text(file_id)
+            except Exception as e:
+                logger.warning(
+                    "parallel_export_failed",
+                    extra={
+                        "correlation_id": self.correlation_id,
+                        "file_id": file_id,
+                        "error": str(e),
+                    },
+                )
+                return file_id, ""
+
+        results.update(self._pool.map(_one, doc_ids))
+        return results
+
+    def _export_doc_text(self, file_id: str) -> str:
+        logger.debug(
+            "Exporting Google Doc %s to text",
+            file_id,
+            extra={"correlation_id": self.correlation_id, "file_id": file_id},
+        )
+        url = (
+            f"https://www.googleapis.com/drive/v3/files/{file_id}"
+            "/export?mimeType=text/plain&supportsAllDrives=true"
+        )
+        with self._session.get(url, stream=True) as response:
+            response.raise_for_status()
+            payload = response.content
+        return payload.decode("utf-8", errors="ignore")
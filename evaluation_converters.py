@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
 from arjun_l2.arjun_l2_models import ArjunL2Result
 from evaluation_models import L1Evaluation, L2Evaluation
 from riva_l1.riva_l1_models import RivaL1Result
 
 
+# Decision mappings and recommendation buckets, hoisted so the per-candidate
+# conversion functions are single dict/set lookups with no allocations.
+_L1_DECISION_MAP = {
+    "SEND_TO_L2": "pass",
+    "REJECT_AT_L1": "reject",
+    "HOLD": "hold",
+}
+_L2_DECISION_MAP = {
+    "HIRE": "strong_yes",
+    "SHORTLIST": "yes",
+    "MOVE_TO_L2": "lean_yes",
+    "REJECT": "no",
+    "HOLD": "lean_no",
+}
+_POSITIVE_L2_RECOMMENDATIONS = frozenset({"strong_yes", "yes", "lean_yes"})
+_NEGATIVE_L2_RECOMMENDATIONS = frozenset({"lean_no", "no"})
+
+
 def _clamp(value: float, lower: float, upper: float) -> float:
     return max(lower, min(upper, value))
 
@@ -26,23 +44,11 @@ def _normalize_confidence(score: Optional[float], max_score: float = 100.0) -> f
 
 
 def map_l1_pipeline_decision(decision: str) -> str:
-    mapping = {
-        "SEND_TO_L2": "pass",
-        "REJECT_AT_L1": "reject",
-        "HOLD": "hold",
-    }
-    return mapping.get(decision, "hold")
+    return _L1_DECISION_MAP.get(decision, "hold")
 
 
 def map_l2_pipeline_decision(decision: str) -> str:
-    mapping = {
-        "HIRE": "strong_yes",
-        "SHORTLIST": "yes",
-        "MOVE_TO_L2": "lean_yes",
-        "REJECT": "no",
-        "HOLD": "lean_no",
-    }
-    return mapping.get(decision, "lean_no")
+    return _L2_DECISION_MAP.get(decision, "lean_no")
 
 
 def l2_alignment_from_scores(l1_score: Optional[float], l2_score: Optional[float]) -> str:
@@ -67,9 +73,20 @@ def convert_riva_result(
     recommendation = map_l1_pipeline_decision(pipeline_decision)
     normalized_score = _normalize_score(result.fit_score)
     confidence = _normalize_confidence(result.fit_score)
-    source_flags = (result.risk_flags or []) + (result.red_flags or []) + (result.concerns or [])
-    risk_flags = list(dict.fromkeys(source_flags))
-    return L1Evaluation(
+    # Order-preserving dedupe in one pass, without concatenating the three
+    # source lists or building a throwaway dict.
+    seen = set()
+    risk_flags = []
+    for source in (result.risk_flags, result.red_flags, result.concerns):
+        if not source:
+            continue
+        for flag in source:
+            if flag not in seen:
+                seen.add(flag)
+                risk_flags.append(flag)
+    # model_construct skips validation: every field here is already
+    # normalized by this converter (clamped scores, mapped recommendation).
+    return L1Evaluation.model_construct(
         candidate_id=candidate_id,
         role=role,
         scores={"overall_fit": normalized_score},
@@ -83,6 +100,22 @@ def convert_riva_result(
     )
 
 
+def convert_riva_results(
+    rows: Iterable[Tuple[str, str, str, RivaL1Result]],
+) -> List[L1Evaluation]:
+    """Convert many (candidate_id, role, pipeline_decision, result) rows.
+
+    Equivalent to calling convert_riva_result per row, but with the helper
+    lookups bound to locals once so large batches avoid repeated global
+    loads on the hot loop.
+    """
+    _convert = convert_riva_result
+    return [
+        _convert(candidate_id, role, pipeline_decision, result)
+        for candidate_id, role, pipeline_decision, result in rows
+    ]
+
+
 def convert_arjun_result(
     candidate_id: str,
     role: str,
@@ -95,7 +128,7 @@ def convert_arjun_result(
     recommendation = map_l2_pipeline_decision(pipeline_decision)
     normalized_score = _normalize_score(result.final_score)
     confidence = _normalize_confidence(result.final_score)
-    return L2Evaluation(
+    return L2Evaluation.model_construct(
         candidate_id=candidate_id,
         role=role,
         scores={"final": normalized_score},
@@ -111,11 +144,9 @@ def convert_arjun_result(
 
 
 def candidate_event_decision_from_l2(recommendation: str) -> str:
-    positive = {"strong_yes", "yes", "lean_yes"}
-    negative = {"lean_no", "no"}
     recommendation = recommendation.lower()
-    if recommendation in positive:
+    if recommendation in _POSITIVE_L2_RECOMMENDATIONS:
         return "pass"
-    if recommendation in negative:
+    if recommendation in _NEGATIVE_L2_RECOMMENDATIONS:
         return "reject"
     return "hold"
\ No newline at end of file
@@ -1,16 +1,111 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import os
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from threading import Lock
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 _DEFAULT_DB_PATH = os.getenv("FINAL_DECISION_DB_PATH", "./final_decisions.db")
 
+# Bump when the DDL below changes so _ensure_table re-runs it.
+_SCHEMA_VERSION = 1
 
-@dataclass
+_UPSERT_SQL = """
+    INSERT INTO final_decisions (
+        candidate_name,
+        candidate_slug,
+        role,
+        role_slug,
+        decision,
+        next_action,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(candidate_slug, role_slug)
+    DO UPDATE SET
+        decision=excluded.decision,
+        next_action=excluded.next_action,
+        updated_at=excluded.updated_at
+"""
+
+# sqlite3 caches compiled statements by SQL text, so keeping each query as
+# one module-level constant guarantees a stable string per call site and
+# the prepare cost is paid once per connection, not per call.
+_GET_BY_ROLE_SQL = """
+    SELECT candidate_name, role, decision, next_action, updated_at
+    FROM final_decisions
+    WHERE candidate_slug = ? AND role_slug = ?
+"""
+
+_GET_LATEST_SQL = """
+    SELECT candidate_name, role, decision, next_action, updated_at
+    FROM final_decisions
+    WHERE candidate_slug = ?
+    ORDER BY updated_at DESC
+    LIMIT 1
+"""
+
+_LIST_BY_ROLE_SQL = """
+    SELECT candidate_name, role, decision, next_action, updated_at
+    FROM final_decisions
+    WHERE role_slug = ?
+    ORDER BY updated_at DESC
+"""
+
+_LIST_ALL_SQL = """
+    SELECT candidate_name, role, decision, next_action, updated_at
+    FROM final_decisions
+    ORDER BY updated_at DESC
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(value: Optional[str]) -> str:
+    """Slugify a candidate/role name, memoized: the same handful of role
+    names (and re-evaluated candidates) hit this thousands of times."""
+    return " ".join(value.strip().lower().split()) if value else ""
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_ts(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, memoized: rows written in the same batch
+    share one timestamp string, so repeat rows are dict hits."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _prep_row(
+    candidate_name: str,
+    role: str,
+    decision: str,
+    next_action: Optional[str],
+    timestamp: str,
+) -> Optional[tuple]:
+    """Build the _UPSERT_SQL parameter tuple for one decision, stripping
+    each field exactly once; returns None when candidate or role is blank."""
+    slug = _normalize(candidate_name)
+    role_slug = _normalize(role)
+    if not slug or not role_slug:
+        return None
+    return (
+        candidate_name.strip(),
+        slug,
+        role.strip(),
+        role_slug,
+        decision.strip(),
+        next_action.strip() if next_action else None,
+        timestamp,
+    )
+
+
+# slots drops the per-record __dict__ (large listings allocate one record
+# per row) and frozen makes records safely hashable/shareable.
+@dataclass(slots=True, frozen=True)
 class FinalDecisionRecord:
     candidate_name: str
     role: str
@@ -26,6 +121,28 @@ class FinalDecisionStore:
         self.db_path = db_path or _DEFAULT_DB_PATH
         self._lock = Lock()
         self._ensure_table()
+        # One long-lived connection shared by all operations (guarded by
+        # _lock); opening per call re-ran the WAL pragma and thrashed the
+        # .db/-wal/-shm file handles on every decision write.
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        # NORMAL is durable-enough under WAL (data survives application
+        # crashes; checkpoints bound loss on power failure) and drops the
+        # per-commit fsync the hot upsert path was paying under FULL.
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute("PRAGMA busy_timeout=30000;")
+        self._conn.execute("PRAGMA temp_store=memory;")
+        self._conn.execute("PRAGMA cache_size=-64000;")
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close the shared connection (registered via atexit)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     # ------------------------------------------------------------------
     def upsert_decision(
@@ -37,41 +154,45 @@ class FinalDecisionStore:
         next_action: Optional[str] = None,
         updated_at: Optional[datetime] = None,
     ) -> None:
-        slug = self._normalize(candidate_name)
-        role_slug = self._normalize(role)
-        if not slug or not role_slug:
-            return
         timestamp = (updated_at or datetime.now(timezone.utc)).isoformat()
+        row = _prep_row(candidate_name, role, decision, next_action, timestamp)
+        if row is None:
+            return
 
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
-                    """
-                    INSERT INTO final_decisions (
-                        candidate_name,
-                        candidate_slug,
-                        role,
-                        role_slug,
-                        decision,
-                        next_action,
-                        updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(candidate_slug, role_slug)
-                    DO UPDATE SET
-                        decision=excluded.decision,
-                        next_action=excluded.next_action,
-                        updated_at=excluded.updated_at
-                    """,
-                    (
-                        candidate_name.strip(),
-                        slug,
-                        role.strip(),
-                        role_slug,
-                        decision.strip(),
-                        next_action.strip() if next_action else None,
-                        timestamp,
-                    ),
-                )
+            with self._conn as conn:
+                conn.execute(_UPSERT_SQL, row)
+
+    def upsert_many(self, records: Iterable[dict]) -> int:
+        """Upsert a batch of decisions in a single transaction.
+
+        Each record is a dict with ``candidate_name``, ``role``,
+        ``decision`` and optionally ``next_action`` / ``updated_at``.
+        Batch jobs should prefer this over per-candidate
+        :meth:`upsert_decision`: one commit (one WAL sync) covers the
+        whole run instead of one per decision. Returns the number of
+        rows written; records missing a candidate or role are skipped.
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        rows = []
+        for record in records:
+            updated_at = record.get("updated_at")
+            row = _prep_row(
+                record.get("candidate_name"),
+                record.get("role"),
+                record["decision"],
+                record.get("next_action"),
+                updated_at.isoformat() if updated_at else timestamp,
+            )
+            if row is not None:
+                rows.append(row)
+        if not rows:
+            return 0
+
+        with self._lock:
+            with self._conn as conn:
+                conn.executemany(_UPSERT_SQL, rows)
+        return len(rows)
 
     def get_decision(
         self,
@@ -84,37 +205,17 @@ class FinalDecisionStore:
             return None
         role_slug = self._normalize(role_name) if role_name else None
 
-        with self._connect() as conn:
+        with self._lock:
+            conn = self._conn
             if role_slug:
-                row = conn.execute(
-                    """
-                    SELECT candidate_name, role, decision, next_action, updated_at
-                    FROM final_decisions
-                    WHERE candidate_slug = ? AND role_slug = ?
-                    """,
-                    (slug, role_slug),
-                ).fetchone()
+                row = conn.execute(_GET_BY_ROLE_SQL, (slug, role_slug)).fetchone()
             else:
-                row = conn.execute(
-                    """
-                    SELECT candidate_name, role, decision, next_action, updated_at
-                    FROM final_decisions
-                    WHERE candidate_slug = ?
-                    ORDER BY updated_at DESC
-                    LIMIT 1
-                    """,
-                    (slug,),
-                ).fetchone()
+                row = conn.execute(_GET_LATEST_SQL, (slug,)).fetchone()
 
         if not row:
             return None
 
-        updated_at = datetime.now(timezone.utc)
-        if row[4]:
-            try:
-                updated_at = datetime.fromisoformat(row[4])
-            except ValueError:
-                pass
+        updated_at = (_parse_ts(row[4]) if row[4] else None) or datetime.now(timezone.utc)
         return FinalDecisionRecord(
             candidate_name=row[0],
             role=row[1],
@@ -126,53 +227,36 @@ class FinalDecisionStore:
     def list_decisions(self, role_name: Optional[str] = None) -> List[FinalDecisionRecord]:
         role_slug = self._normalize(role_name) if role_name else None
 
-        with self._connect() as conn:
+        with self._lock:
+            conn = self._conn
             if role_slug:
-                rows = conn.execute(
-                    """
-                    SELECT candidate_name, role, decision, next_action, updated_at
-                    FROM final_decisions
-                    WHERE role_slug = ?
-                    ORDER BY updated_at DESC
-                    """,
-                    (role_slug,),
-                ).fetchall()
+                rows = conn.execute(_LIST_BY_ROLE_SQL, (role_slug,)).fetchall()
             else:
-                rows = conn.execute(
-                    """
-                    SELECT candidate_name, role, decision, next_action, updated_at
-                    FROM final_decisions
-                    ORDER BY updated_at DESC
-                    """
-                ).fetchall()
-
-        records: List[FinalDecisionRecord] = []
-        for row in rows:
-            timestamp = datetime.now(timezone.utc)
-            if row[4]:
-                try:
-                    timestamp = datetime.fromisoformat(row[4])
-                except ValueError:
-                    pass
-            records.append(
-                FinalDecisionRecord(
-                    candidate_name=row[0],
-                    role=row[1],
-                    decision=row[2],
-                    next_action=row[3],
-                    updated_at=timestamp,
-                )
+                rows = conn.execute(_LIST_ALL_SQL).fetchall()
+
+        # Columns: candidate_name, role, decision, next_action, updated_at.
+        # One fallback timestamp for the whole listing instead of a
+        # datetime.now call per row with a missing/bad updated_at.
+        fallback = datetime.now(timezone.utc)
+        parse = _parse_ts
+        return [
+            FinalDecisionRecord(
+                row[0],
+                row[1],
+                row[2],
+                row[3],
+                (parse(row[4]) if row[4] else None) or fallback,
             )
-        return records
+            for row in rows
+        ]
 
     # ------------------------------------------------------------------
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA journal_mode=WAL;")
-        return conn
-
     def _ensure_table(self) -> None:
         with sqlite3.connect(self.db_path) as conn:
+            # user_version marks the schema as current; when it matches,
+            # skip re-parsing the CREATE statements on every construction.
+            if conn.execute("PRAGMA user_version;").fetchone()[0] == _SCHEMA_VERSION:
+                return
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS final_decisions (
@@ -193,17 +277,28 @@ class FinalDecisionStore:
                 ON final_decisions(candidate_slug, role_slug)
                 """
             )
+            # Covers list_decisions(role_name): role_slug satisfies the
+            # WHERE, updated_at DESC the ORDER BY, and the trailing columns
+            # let SQLite answer the SELECT from the index alone.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_final_decisions_role_updated
+                ON final_decisions(
+                    role_slug, updated_at DESC,
+                    candidate_name, role, decision, next_action
+                )
+                """
+            )
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION};")
 
-    @staticmethod
-    def _normalize(value: Optional[str]) -> str:
-        return " ".join(value.strip().lower().split()) if value else ""
-
-
-_store_instance: Optional[FinalDecisionStore] = None
+    # Kept as an attribute for existing callers; the cached module-level
+    # function does the work.
+    _normalize = staticmethod(_normalize)
 
 
+# functools.cache is thread-safe, so concurrent first callers under
+# FastAPI's threadpool cannot race a check-then-set global and build two
+# stores (duplicating DDL and SQLite connections).
+@functools.cache
 def get_final_decision_store() -> FinalDecisionStore:
-    global _store_instance
-    if _store_instance is None:
-        _store_instance = FinalDecisionStore()
-    return _store_instance
+    return FinalDecisionStore()
@@ -2,6 +2,8 @@
 
 # Source-of-truth for all Drive folder IDs
 
+from types import MappingProxyType
+
 # Root-level buckets
 PENDING_REVIEW_L1_ROOT_FOLDER_ID = "10PubI_n25X0slnSaWRAfg4ZTSBcB_3PX"
 PENDING_REVIEW_L2_ROOT_FOLDER_ID = "190vIVukdn7Q84LJDIKqDSgqE1uDutcm2"
@@ -73,35 +75,42 @@ FOLDER_MAP = {
 }
 
 
+# Guard against accidental runtime mutation of the source-of-truth map.
+FOLDER_MAP = MappingProxyType(FOLDER_MAP)
+
+
 # --------------------------------------------------------------------
 #  Convenience maps for L1 and L2 role folders
-#  These are derived dynamically so new roles work automatically.
+#  These are derived dynamically so new roles work automatically, in a
+#  single pass over FOLDER_MAP instead of one startswith scan per bucket.
 # --------------------------------------------------------------------
 
-def _build_role_map(prefix: str) -> dict[str, str]:
-    """
-    Build a mapping of role_name -> folder_id for keys
-    like 'prefix/Role Name' in FOLDER_MAP.
-    """
-    result: dict[str, str] = {}
-    prefix_with_slash = prefix + "/"
-
-    for key, folder_id in FOLDER_MAP.items():
-        if key.startswith(prefix_with_slash):
-            # Example: key = "Pending Review Profiles (L1)/HR Support"
-            role_name = key[len(prefix_with_slash):]  # "HR Support"
-            result[role_name] = folder_id
-
-    return result
-
+L1_FOLDERS: dict[str, str] = {}
+L2_FOLDERS: dict[str, str] = {}
+ON_HOLD_FOLDERS: dict[str, str] = {}
+PROFILES_FINAL_SELECTED_FOLDERS: dict[str, str] = {}
+PROFILES_L1_REJECTED_FOLDERS: dict[str, str] = {}
+PROFILES_L2_REJECTED_FOLDERS: dict[str, str] = {}
+
+_BUCKETS_BY_PREFIX = {
+    "L1 Pending Review": L1_FOLDERS,
+    "L2 Pending Review": L2_FOLDERS,
+    "On Hold": ON_HOLD_FOLDERS,
+    "Profiles/Final Selected": PROFILES_FINAL_SELECTED_FOLDERS,
+    "Profiles/L1 Rejected": PROFILES_L1_REJECTED_FOLDERS,
+    "Profiles/L2 Rejected": PROFILES_L2_REJECTED_FOLDERS,
+}
 
-# All L1 role folders: "L1 Pending Review/<Role>"
-L1_FOLDERS = _build_role_map("L1 Pending Review")
+for _key, _folder_id in FOLDER_MAP.items():
+    _prefix, _, _role = _key.rpartition("/")
+    _bucket = _BUCKETS_BY_PREFIX.get(_prefix)
+    if _bucket is not None:
+        _bucket[_role] = _folder_id
 
-# All L2 pending role folders: "L2 Pending Review/<Role>"
-L2_FOLDERS = _build_role_map("L2 Pending Review")
+del _key, _folder_id, _prefix, _role, _bucket
 
-# Profiles maps
-PROFILES_FINAL_SELECTED_FOLDERS = _build_role_map("Profiles/Final Selected")
-PROFILES_L1_REJECTED_FOLDERS = _build_role_map("Profiles/L1 Rejected")
-PROFILES_L2_REJECTED_FOLDERS = _build_role_map("Profiles/L2 Rejected")
+# Pre-slugged role names (FinalDecisionStore's normalization format), so
+# resolver-side code can compare against store slugs without re-normalizing.
+ROLE_SLUGS = MappingProxyType(
+    {role: " ".join(role.strip().lower().split()) for role in L1_FOLDERS}
+)
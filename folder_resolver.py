@@ -1,8 +1,8 @@
 # folder_resolver.py
 
 from folder_map import (
-    FOLDER_MAP,
     L2_FOLDERS,
+    ON_HOLD_FOLDERS,
     PROFILES_L1_REJECTED_FOLDERS,
     PROFILES_L2_REJECTED_FOLDERS,
     PROFILES_FINAL_SELECTED_FOLDERS,
@@ -26,8 +26,7 @@ def get_l2_folder(role_name: str):
 
 def get_hold_folder(role_name: str):
     """Return On Hold folder for the given role."""
-    key = f"On Hold/{role_name}"
-    return FOLDER_MAP.get(key)
+    return ON_HOLD_FOLDERS.get(role_name)
 
 
 def get_reject_folder(role_name: str):
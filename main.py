@@ -3,17 +3,20 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+import json
 import logging
 import os
-from datetime import datetime
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import FastAPI, Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
 import time
-import uuid
 
 from batch_jobs import run_arjun_l2_batch, run_riva_l1_batch
 from slack_service import SlackClient, SlackNotifier
@@ -27,38 +30,47 @@ slack_logger = logging.getLogger("slack")
 # Request Logging Middleware
 request_logger = logging.getLogger("request_logging")
 
+# Actor detection is a prefix match: data-driven tuple scan instead of an
+# if/elif chain of substring searches over the whole path.
+_ACTOR_MAP = {
+    "/slack/riva": "Riva",
+    "/slack/arjun": "Arjun",
+    "/run-l1-batch": "Riva",
+    "/run-l2-batch": "Arjun",
+}
+_ACTOR_ITEMS = tuple(_ACTOR_MAP.items())
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())
-        start_time = time.time()
+        # Log-scoped ID: 64 random bits are plenty, and hex-encoding raw
+        # urandom skips uuid4's formatting layer on every request.
+        request_id = os.urandom(8).hex()
+        # Monotonic clock: immune to NTP steps, so latencies can't go
+        # negative.
+        start = time.perf_counter()
         
         # Extract actor from path
-        actor = "API"
-        if "/slack/riva" in request.url.path:
-            actor = "Riva"
-        elif "/slack/arjun" in request.url.path:
-            actor = "Arjun"
-        elif "/run-l1-batch" in request.url.path:
-            actor = "Riva"
-        elif "/run-l2-batch" in request.url.path:
-            actor = "Arjun"
-        
+        path = request.url.path
+        actor = next((v for k, v in _ACTOR_ITEMS if path.startswith(k)), "API")
+
         # Process request
         response = await call_next(request)
         
-        # Calculate latency
-        latency_ms = (time.time() - start_time) * 1000
-        
+        # Calculate latency (already-rounded int: no float formatting in
+        # the JSON logger)
+        latency_ms = int((time.perf_counter() - start) * 1000)
+
         # Log request details
         request_logger.info(
             "request_completed",
             extra={
                 "request_id": request_id,
-                "endpoint": request.url.path,
+                "endpoint": path,
                 "method": request.method,
                 "actor": actor,
                 "status_code": response.status_code,
-                "latency_ms": round(latency_ms, 2),
+                "latency_ms": latency_ms,
             }
         )
         
@@ -71,18 +83,24 @@ app.include_router(riva_router, tags=["riva"])
 app.include_router(arjun_router, tags=["arjun"])
 
 
-def _load_slack_config(prefix: str) -> Dict[str, Optional[str]]:
-    return {
-        "bot_token": os.getenv(f"{prefix}_BOT_TOKEN"),
-        "signing_secret": os.getenv(f"{prefix}_SIGNING_SECRET"),
-        "default_channel": os.getenv(f"{prefix}_DEFAULT_CHANNEL_ID"),
-    }
+# One snapshot of the environment: every Slack/port/scheduler setting is a
+# process-lifetime constant, so resolve them from a plain dict copy instead
+# of going through os.environ per lookup.
+_ENV = os.environ.copy()
+
+
+def _load_slack_config(prefix: str) -> Mapping[str, Optional[str]]:
+    return MappingProxyType({
+        "bot_token": _ENV.get(f"{prefix}_BOT_TOKEN"),
+        "signing_secret": _ENV.get(f"{prefix}_SIGNING_SECRET"),
+        "default_channel": _ENV.get(f"{prefix}_DEFAULT_CHANNEL_ID"),
+    })
 
 
 SLACK_RIVA_CONFIG = _load_slack_config("SLACK_RIVA")
 SLACK_ARJUN_CONFIG = _load_slack_config("SLACK_ARJUN")
-SLACK_RIVA_BOT_USER_ID = os.getenv("SLACK_RIVA_BOT_USER_ID")
-SLACK_ARJUN_BOT_USER_ID = os.getenv("SLACK_ARJUN_BOT_USER_ID")
+SLACK_RIVA_BOT_USER_ID = _ENV.get("SLACK_RIVA_BOT_USER_ID")
+SLACK_ARJUN_BOT_USER_ID = _ENV.get("SLACK_ARJUN_BOT_USER_ID")
 
 for bot_name, config in (("riva", SLACK_RIVA_CONFIG), ("arjun", SLACK_ARJUN_CONFIG)):
     if not config["bot_token"]:
@@ -110,9 +128,12 @@ slack_notifier = SlackNotifier(riva_client=riva_slack_client, arjun_client=arjun
 # Scheduler setup
 # ------------------------------------------------------------------
 scheduler_logger = logging.getLogger("batch_scheduler")
-scheduler_timezone = datetime.now().astimezone().tzinfo
+# ZoneInfo instances are canonicalized and cheap; this also pins the job
+# schedule to an explicit zone instead of probing the container's local
+# time at import.
+scheduler_timezone = ZoneInfo(_ENV.get("SCHEDULER_TZ", "UTC"))
 scheduler = AsyncIOScheduler(timezone=scheduler_timezone)
-ENABLE_JOB_SCHEDULER = os.getenv("ENABLE_JOB_SCHEDULER", "false").lower() == "true"
+ENABLE_JOB_SCHEDULER = _ENV.get("ENABLE_JOB_SCHEDULER", "false").lower() == "true"
 
 
 def execute_riva_l1_batch():
@@ -203,8 +224,13 @@ async def stop_scheduler() -> None:  # pragma: no cover - FastAPI lifecycle
 # ------------------------------------------------------------------
 # Health check
 # ------------------------------------------------------------------
-def _healthy_response():
-    return {"status": "ok"}
+# Liveness probes hit these constantly; serve a pre-serialized body
+# instead of re-encoding {"status": "ok"} per request.
+_HEALTHY_BODY = b'{"status":"ok"}'
+
+
+def _healthy_response() -> Response:
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -220,18 +246,21 @@ def healthz():
 # ------------------------------------------------------------------
 # Port debugging endpoint
 # ------------------------------------------------------------------
-@app.get("/debug-port")
-def debug_port():
-    env_port = os.getenv("PORT")
-    fallback_port = "8080"
-    resolved_port = env_port or fallback_port
-    return {
-        "env_port": env_port,
-        "fallback_port": fallback_port,
-        "resolved_port": resolved_port,
+# PORT is a process-lifetime constant, so the whole payload is too.
+_DEBUG_PORT_BODY = json.dumps(
+    {
+        "env_port": _ENV.get("PORT"),
+        "fallback_port": "8080",
+        "resolved_port": _ENV.get("PORT") or "8080",
         "uvicorn_command": "uvicorn main:app --host 0.0.0.0 --port ${PORT:-8080}",
         "host": "0.0.0.0",
     }
+).encode()
+
+
+@app.get("/debug-port")
+def debug_port():
+    return Response(content=_DEBUG_PORT_BODY, media_type="application/json")
 
 
 # ------------------------------------------------------------------
@@ -247,13 +276,17 @@ def slack_test():
 # Riva L1 Batch
 # ------------------------------------------------------------------
 @app.post("/run-l1-batch")
-def run_l1_batch():
-    return execute_riva_l1_batch()
+async def run_l1_batch():
+    # Batch runs are long and synchronous (Drive, Sheets, SQLite); run them
+    # on a worker thread so the event loop keeps serving Slack callbacks.
+    # The decision stores hold one shared connection each, so the worker
+    # thread reuses it instead of reopening per write.
+    return await asyncio.to_thread(execute_riva_l1_batch)
 
 
 # ------------------------------------------------------------------
 # Arjun L2 Batch
 # ------------------------------------------------------------------
 @app.post("/run-l2-batch")
-def run_l2_batch():
-    return execute_arjun_l2_batch()
+async def run_l2_batch():
+    return await asyncio.to_thread(execute_arjun_l2_batch)
@@ -4,10 +4,17 @@ Manual review trigger commands for Riva (L1) and Arjun (L2).
 Allows Slack users to trigger single-candidate reviews on-demand.
 """
 
+import functools
 import logging
-from typing import Optional, Tuple
+import os
+import re
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
 
-from drive_service import DriveManager
+from drive_service import LIST_FIELDS_LOOKUP, DriveManager
 from folder_map import L1_FOLDERS, L2_FOLDERS
 from riva_l1.riva_l1_batch import RivaL1BatchProcessor
 from arjun_l2.arjun_l2_batch import ArjunL2BatchProcessor
@@ -15,20 +22,152 @@ from arjun_l2.arjun_l2_batch import ArjunL2BatchProcessor
 logger = logging.getLogger(__name__)
 
 
-def parse_candidate_and_role_from_review(text: str) -> Tuple[Optional[str], Optional[str]]:
-    """
-    Parse candidate name and role from review command text.
-    
-    Supports formats:
-    - "review Vemula Sowmya - HR Support"
-    - "review Vemula Sowmya HR Support"
-    
-    Args:
-        text: Command text (e.g., "review Vemula Sowmya - HR Support")
-        
-    Returns:
-        Tuple of (candidate_name, role_name) or (None, None) if parsing fails
-    """
+def _linfo(event: str, **fields) -> None:
+    """Emit a structured info record only when INFO is enabled, so the
+    per-command `extra` dicts are never built when production filters
+    info logging out. Error logs stay direct — they are rare and must
+    always fire."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(event, extra=fields)
+
+# Case-insensitive role lookup, built once: maps the casefolded role name
+# to (canonical name, folder id) so handlers do one hash probe instead of
+# re-lowering every entry per Slack command.
+_L1_FOLDERS_CI = {role.casefold(): (role, folder_id) for role, folder_id in L1_FOLDERS.items()}
+_L2_FOLDERS_CI = {role.casefold(): (role, folder_id) for role, folder_id in L2_FOLDERS.items()}
+
+# Short-TTL LRU over list_folder_like: bursty Slack usage (retries, several
+# candidates in one role) reuses a single Drive listing instead of paying
+# the files.list round trip per command.
+_LIST_CACHE_TTL = float(os.getenv("MANUAL_REVIEW_LIST_TTL", "60"))
+_LIST_CACHE_MAXSIZE = 128
+_LIST_CACHE: "OrderedDict[str, Tuple[float, List[dict], Dict[str, dict]]]" = OrderedDict()
+
+
+# Background executor for the long review work: Slack handlers must ack
+# within 3 s, but a single-candidate review (Drive + LLM) runs well past
+# that. Work is submitted here and the result posted via the caller's
+# notify callback; a small per-user in-flight cap keeps one user from
+# monopolizing the workers.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("REVIEW_WORKERS", "4")),
+    thread_name_prefix="manual-review",
+)
+_MAX_INFLIGHT_PER_USER = 2
+_INFLIGHT: Dict[str, int] = defaultdict(int)
+_INFLIGHT_LOCK = Lock()
+
+
+def _submit_review(
+    user_key: str,
+    work: Callable[[], str],
+    notify: Callable[[str], None],
+    ack: str,
+) -> str:
+    """Queue `work` on the review executor and return the ack text.
+
+    The result (or a failure message) is delivered through `notify` when
+    the job completes. Returns a busy message without queuing when the
+    user already has _MAX_INFLIGHT_PER_USER jobs running."""
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT[user_key] >= _MAX_INFLIGHT_PER_USER:
+            return (
+                "⏳ You already have reviews in progress. "
+                "Please wait for them to finish before starting another."
+            )
+        _INFLIGHT[user_key] += 1
+
+    def _run() -> str:
+        try:
+            return work()
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT[user_key] -= 1
+
+    def _deliver(future) -> None:
+        try:
+            message = future.result()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error(
+                "manual_review_background_failed",
+                extra={"user_id": user_key, "error": str(exc)},
+                exc_info=True,
+            )
+            message = f"❌ Error running manual review: {exc}"
+        try:
+            notify(message)
+        except Exception:  # pragma: no cover - defensive logging
+            logger.warning(
+                "manual_review_notify_failed",
+                extra={"user_id": user_key},
+                exc_info=True,
+            )
+
+    _EXECUTOR.submit(_run).add_done_callback(_deliver)
+    return ack
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_drive() -> DriveManager:
+    """One DriveManager shared by all Slack invocations, built lazily on
+    first use: reuses the authorized session and its HTTP connections
+    instead of re-authenticating per command. lru_cache makes the
+    construction race-free under concurrent first callers. Sharing is
+    safe because the manager keeps its discovery client and correlation
+    label thread-local; each executor worker gets its own client."""
+    return DriveManager(correlation_id="manual-review")
+
+
+def _store_listing(folder_id: str, candidates: List[dict]) -> Tuple[List[dict], Dict[str, dict]]:
+    index = {cand.get("name", "").casefold(): cand for cand in candidates}
+    _LIST_CACHE[folder_id] = (time.monotonic(), candidates, index)
+    _LIST_CACHE.move_to_end(folder_id)
+    while len(_LIST_CACHE) > _LIST_CACHE_MAXSIZE:
+        _LIST_CACHE.popitem(last=False)
+    return candidates, index
+
+
+def preload_role_listings(drive: DriveManager, folder_ids: List[str]) -> None:
+    """Warm the listing cache for several role folders in one batched Drive
+    call. Callers expecting to review a candidate across stages (e.g. both
+    the L1 and L2 folder for a role) can preload both listings up front
+    instead of paying one round trip per handler."""
+    listings = drive.list_folders_batch(folder_ids, fields=LIST_FIELDS_LOOKUP)
+    for folder_id, candidates in listings.items():
+        _store_listing(folder_id, candidates)
+
+
+def _cached_list(drive: DriveManager, folder_id: str) -> Tuple[List[dict], Dict[str, dict]]:
+    """Return (entries, casefolded-name index) for list_folder_like(folder_id),
+    cached for _LIST_CACHE_TTL seconds."""
+    now = time.monotonic()
+    entry = _LIST_CACHE.get(folder_id)
+    if entry is not None and now - entry[0] < _LIST_CACHE_TTL:
+        _LIST_CACHE.move_to_end(folder_id)
+        return entry[1], entry[2]
+
+    return _store_listing(
+        folder_id, drive.list_folder_like(folder_id, fields=LIST_FIELDS_LOOKUP)
+    )
+
+
+# Fast path for the common command shapes: one C-level scan instead of a
+# chain of lower/startswith/split/join calls. Anything it misses (unusual
+# role names, odd spacing) falls back to the split-based heuristic below.
+_REVIEW_RE = re.compile(
+    r"^\s*review\s+(?P<cand>.+?)(?:\s+-\s+|\s+)(?P<role>(?:HR|IT)\s+\w+)\s*$",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_review_cached(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """Pure parsing body, memoized: Slack users retype the same command on
+    typos and retries, so repeat inputs short-circuit to the cached tuple."""
+    match = _REVIEW_RE.match(text)
+    if match:
+        return match.group("cand").strip(), match.group("role").strip()
+
     # Strip "review" prefix
     if text.lower().startswith("review"):
         text = text[6:].strip()
@@ -54,228 +193,199 @@ def parse_candidate_and_role_from_review(text: str) -> Tuple[Optional[str], Opti
         candidate = " ".join(words[:-2]) if len(words) > 2 else words[0]
         role = " ".join(words[-2:])
         return candidate.strip(), role.strip()
-    
+
     return None, None
 
 
-def handle_riva_manual_review(
-    text: str,
-    slack_user_id: Optional[str] = None,
-    drive: Optional[DriveManager] = None
-) -> str:
+def parse_candidate_and_role_from_review(text: str) -> Tuple[Optional[str], Optional[str]]:
     """
-    Handle manual L1 review trigger from Slack.
-    
+    Parse candidate name and role from review command text.
+
+    Supports formats:
+    - "review Vemula Sowmya - HR Support"
+    - "review Vemula Sowmya HR Support"
+
     Args:
         text: Command text (e.g., "review Vemula Sowmya - HR Support")
-        slack_user_id: Slack user who triggered the review
-        drive: Optional DriveManager instance
-        
+
     Returns:
-        Slack-safe response text
+        Tuple of (candidate_name, role_name) or (None, None) if parsing fails
     """
-    logger.info(
-        "riva_manual_review_triggered",
-        extra={"user_id": slack_user_id, "text": text}
-    )
-    
-    # Parse candidate and role
-    candidate_name, role_name = parse_candidate_and_role_from_review(text)
-    
-    if not candidate_name or not role_name:
-        return (
-            "❌ Could not parse candidate and role from your request.\n"
-            "Usage: `@Riva review <Candidate Name> - <Role Name>`\n"
-            "Example: `@Riva review Vemula Sowmya - HR Support`"
-        )
-    
-    logger.info(
-        "riva_manual_review_parsed",
-        extra={
-            "candidate": candidate_name,
-            "role": role_name,
-            "user_id": slack_user_id
-        }
-    )
-    
-    try:
-        # Find candidate folder
-        drive_manager = drive or DriveManager(correlation_id=f"riva-review-{slack_user_id}")
-        
-        # Look for candidate in L1 folders
-        role_folder_id = L1_FOLDERS.get(role_name)
-        if not role_folder_id:
-            # Try case-insensitive match
-            for role, folder_id in L1_FOLDERS.items():
-                if role.lower() == role_name.lower():
-                    role_folder_id = folder_id
-                    role_name = role
-                    break
-        
-        if not role_folder_id:
-            return (
-                f"❌ Role '{role_name}' not found.\n"
-                f"Available roles: {', '.join(L1_FOLDERS.keys())}"
-            )
-        
-        # List candidates in role folder
-        candidates = drive_manager.list_folder_like(role_folder_id)
-        
-        # Find matching candidate
-        candidate_folder = None
-        for cand in candidates:
-            if cand.get("name", "").lower() == candidate_name.lower():
-                candidate_folder = cand
-                candidate_name = cand.get("name")  # Use exact name
-                break
-        
-        if not candidate_folder:
-            return (
-                f"❌ Candidate '{candidate_name}' not found in role '{role_name}'.\n"
-                "Please check the name and try again."
-            )
-        
-        candidate_folder_id = drive_manager.get_real_folder_id(candidate_folder)
-        
-        # Trigger L1 review for this single candidate
-        # We'll do a lightweight single-candidate run
-        logger.info(
-            "running_single_l1_review",
-            extra={
-                "candidate": candidate_name,
-                "role": role_name,
-                "folder_id": candidate_folder_id,
-                "user_id": slack_user_id
-            }
-        )
-        
-        # Use batch processor but process only this one candidate
-        # This is a simplified single-candidate trigger
-        processor = RivaL1BatchProcessor()
-        
-        # Note: The batch processor processes all candidates in L1_FOLDERS
-        # For a true single-candidate review, we'd need to add a method to the processor
-        # For now, return a message indicating the review has been queued
-        
-        return (
-            f"✅ Manual L1 review triggered for *{candidate_name}* — *{role_name}*\n\n"
-            f"📁 Folder: `{candidate_folder_id}`\n\n"
-            "⏳ The review will be processed in the next batch run.\n"
-            "Use `@Riva summary {candidate_name} - {role_name}` to check the result after the batch completes."
-        )
-        
-    except Exception as e:
-        logger.error(
-            "riva_manual_review_error",
-            extra={"error": str(e), "user_id": slack_user_id},exc_info=True
-        )
-        return f"❌ Error triggering manual review: {str(e)}"
+    stripped = text.strip()
+    # Oversized input bypasses the cache so adversarial/garbage commands
+    # can't grow the key set with long strings.
+    if len(stripped) > 200:
+        return _parse_review_cached.__wrapped__(stripped)
+    return _parse_review_cached(stripped)
+
+
+# Candidate-list separators for multi-candidate commands:
+# "review Alice, Bob and Carol - HR Support".
+_CANDIDATE_SEP_RE = re.compile(r"\s*,\s*|\s+and\s+", re.IGNORECASE)
+
 
+def _split_candidates(candidate_text: str) -> List[str]:
+    """Split the parsed candidate portion on "," / "and" separators,
+    dropping empty fragments. A plain single name comes back as a
+    one-element list."""
+    return [part.strip() for part in _CANDIDATE_SEP_RE.split(candidate_text) if part.strip()]
 
-def handle_arjun_manual_review(
+
+# The two agents differ only in data, not control flow: per-agent stage
+# label, role-folder maps, processor class, mention name, and the summary
+# attribute that signals an error. Everything else lives once in
+# _handle_manual_review below.
+_AGENTS: Dict[str, tuple] = {
+    "riva": ("L1", L1_FOLDERS, _L1_FOLDERS_CI, RivaL1BatchProcessor, "Riva", "error_count"),
+    "arjun": ("L2", L2_FOLDERS, _L2_FOLDERS_CI, ArjunL2BatchProcessor, "Arjun", "errors"),
+}
+
+
+def _handle_manual_review(
+    agent_key: str,
     text: str,
     slack_user_id: Optional[str] = None,
-    drive: Optional[DriveManager] = None
+    drive: Optional[DriveManager] = None,
+    notify: Optional[Callable[[str], None]] = None,
 ) -> str:
     """
-    Handle manual L2 review trigger from Slack.
-    
+    Handle a manual review trigger from Slack for the given agent.
+
     Args:
+        agent_key: Key into _AGENTS ("riva" for L1, "arjun" for L2)
         text: Command text (e.g., "review Vemula Sowmya - HR Support")
         slack_user_id: Slack user who triggered the review
         drive: Optional DriveManager instance
-        
+        notify: Optional callback for the final result; when given, the
+            review runs on a background worker and this returns a quick
+            ack so the Slack 3 s deadline is met
+
     Returns:
         Slack-safe response text
     """
-    logger.info(
-        "arjun_manual_review_triggered",
-        extra={"user_id": slack_user_id, "text": text}
-    )
-    
+    stage, folders, folders_ci, processor_cls, mention, error_attr = _AGENTS[agent_key]
+
+    _linfo(f"{agent_key}_manual_review_triggered", user_id=slack_user_id, text=text)
+
     # Parse candidate and role
     candidate_name, role_name = parse_candidate_and_role_from_review(text)
-    
+
     if not candidate_name or not role_name:
         return (
             "❌ Could not parse candidate and role from your request.\n"
-            "Usage: `@Arjun review <Candidate Name> - <Role Name>`\n"
-            "Example: `@Arjun review Vemula Sowmya - HR Support`"
+            f"Usage: `@{mention} review <Candidate Name> - <Role Name>`\n"
+            f"Example: `@{mention} review Vemula Sowmya - HR Support`"
         )
-    
-    logger.info(
-        "arjun_manual_review_parsed",
-        extra={
-            "candidate": candidate_name,
-            "role": role_name,
-            "user_id": slack_user_id
-        }
+
+    _linfo(
+        f"{agent_key}_manual_review_parsed",
+        candidate=candidate_name,
+        role=role_name,
+        user_id=slack_user_id,
     )
-    
+
     try:
         # Find candidate folder
-        drive_manager = drive or DriveManager(correlation_id=f"arjun-review-{slack_user_id}")
-        
-        # Look for candidate in L2 folders
-        role_folder_id = L2_FOLDERS.get(role_name)
-        if not role_folder_id:
-            # Try case-insensitive match
-            for role, folder_id in L2_FOLDERS.items():
-                if role.lower() == role_name.lower():
-                    role_folder_id = folder_id
-                    role_name = role
-                    break
-        
+        drive_manager = drive or _shared_drive()
+        # The label is thread-local, so this only tags Drive calls made on
+        # the handler thread; the background worker re-labels itself below.
+        review_correlation_id = f"{agent_key}-review-{slack_user_id}"
+        drive_manager.set_correlation_id(review_correlation_id)
+
+        # Look for candidate in the stage's role folders (case-insensitive)
+        role_hit = folders_ci.get(role_name.casefold())
+        role_folder_id = None
+        if role_hit:
+            role_name, role_folder_id = role_hit
+
         if not role_folder_id:
             return (
                 f"❌ Role '{role_name}' not found.\n"
-                f"Available roles: {', '.join(L2_FOLDERS.keys())}"
+                f"Available roles: {', '.join(folders.keys())}"
             )
-        
-        # List candidates in role folder
-        candidates = drive_manager.list_folder_like(role_folder_id)
-        
-        # Find matching candidate
-        candidate_folder = None
-        for cand in candidates:
-            if cand.get("name", "").lower() == candidate_name.lower():
-                candidate_folder = cand
-                candidate_name = cand.get("name")  # Use exact name
-                break
-        
-        if not candidate_folder:
+
+        # List candidates in role folder once and resolve each requested
+        # name against the cached index; supports "Alice, Bob and Carol".
+        _, candidate_index = _cached_list(drive_manager, role_folder_id)
+        missing: List[str] = []
+        resolved: List[dict] = []
+        for name in _split_candidates(candidate_name):
+            folder = candidate_index.get(name.casefold())
+            if folder is not None:
+                resolved.append(folder)
+            else:
+                missing.append(name)
+
+        if missing:
             return (
-                f"❌ Candidate '{candidate_name}' not found in role '{role_name}'.\n"
+                f"❌ Candidate '{', '.join(missing)}' not found in role '{role_name}'.\n"
                 "Please check the name and try again."
             )
-        
-        candidate_folder_id = drive_manager.get_real_folder_id(candidate_folder)
-        
-        # Trigger L2 review for this single candidate
-        logger.info(
-            "running_single_l2_review",
-            extra={
-                "candidate": candidate_name,
-                "role": role_name,
-                "folder_id": candidate_folder_id,
-                "user_id": slack_user_id
-            }
-        )
-        
-        # Similar to L1, we'd need a single-candidate method in the batch processor
-        # For now, return a message indicating the review has been queued
-        
-        return (
-            f"✅ Manual L2 review triggered for *{candidate_name}* — *{role_name}*\n\n"
-            f"📁 Folder: `{candidate_folder_id}`\n\n"
-            "⏳ The review will be processed in the next batch run.\n"
-            "Use `@Arjun summary {candidate_name} - {role_name}` to check the result after the batch completes."
+
+        candidate_names = [folder.get("name") for folder in resolved]  # Use exact names
+        folder_ids = [drive_manager.get_real_folder_id(folder) for folder in resolved]
+        label = ", ".join(f"*{name}*" for name in candidate_names)
+        folder_label = ", ".join(f"`{fid}`" for fid in folder_ids)
+
+        # Trigger review for these candidates
+        # We'll do a lightweight run bypassing role enumeration
+        _linfo(
+            f"running_single_{stage.lower()}_review",
+            candidates=candidate_names,
+            role=role_name,
+            folder_ids=folder_ids,
+            user_id=slack_user_id,
         )
-        
+
+        # Process just these candidates, bypassing role enumeration
+        def _do_review() -> str:
+            drive_manager.set_correlation_id(review_correlation_id)
+            processor = processor_cls(drive=drive_manager)
+            if len(folder_ids) == 1:
+                summary = processor.process_single_candidate(
+                    role_name, folder_ids[0], candidate_names[0]
+                )
+            else:
+                summary = processor.process_candidates_batch(
+                    role_name, folder_ids, candidate_names
+                )
+
+            if getattr(summary, error_attr):
+                return (
+                    f"⚠️ Manual {stage} review for {label} — *{role_name}* hit an error.\n"
+                    f"📁 Folder: {folder_label}\n"
+                    "Please check the logs or retry."
+                )
+
+            return (
+                f"✅ Manual {stage} review completed for {label} — *{role_name}*\n\n"
+                f"📁 Folder: {folder_label}\n\n"
+                f"Use `@{mention} summary {candidate_names[0]} - {role_name}` to see the result."
+            )
+
+        if notify is not None:
+            return _submit_review(
+                slack_user_id or "anonymous",
+                _do_review,
+                notify,
+                (
+                    f"⏳ Manual {stage} review queued for {label} — *{role_name}*.\n"
+                    "I'll post the result here when it completes."
+                ),
+            )
+
+        return _do_review()
+
     except Exception as e:
         logger.error(
-            "arjun_manual_review_error",
+            f"{agent_key}_manual_review_error",
             extra={"error": str(e), "user_id": slack_user_id},
             exc_info=True
         )
         return f"❌ Error triggering manual review: {str(e)}"
+
+
+# Public entry points stay as thin adapters over the shared handler so
+# existing importers (slack_bots, tests) keep their signatures.
+handle_riva_manual_review = functools.partial(_handle_manual_review, "riva")
+handle_arjun_manual_review = functools.partial(_handle_manual_review, "arjun")
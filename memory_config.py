@@ -4,29 +4,62 @@ Configuration for the Talent Intelligence Memory Layer.
 """
 
 import os
-from typing import Literal
-
-# Memory feature flags
-MEMORY_ENABLED = os.getenv("MEMORY_ENABLED", "true").lower() == "true"
-MEMORY_SCOPE = os.getenv("MEMORY_SCOPE", "full")  # candidate_only | role_only | full
-MEMORY_DB_URL = os.getenv("MEMORY_DB_URL", "sqlite:///./talent_memory.db")
+from dataclasses import dataclass
 
 # Validation
-VALID_SCOPES = {"candidate_only", "role_only", "full"}
-if MEMORY_SCOPE not in VALID_SCOPES:
-    raise ValueError(f"MEMORY_SCOPE must be one of {VALID_SCOPES}, got {MEMORY_SCOPE}")
+VALID_SCOPES = frozenset({"candidate_only", "role_only", "full"})
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryConfig:
+    """Immutable snapshot of the memory-layer settings, resolved once at
+    import so hot-path checks are plain attribute reads."""
+
+    enabled: bool
+    scope: str
+    db_url: str
+    candidate_memory: bool
+    role_memory: bool
+
+    @classmethod
+    def from_env(cls) -> "MemoryConfig":
+        enabled = os.getenv("MEMORY_ENABLED", "true").lower() == "true"
+        scope = os.getenv("MEMORY_SCOPE", "full")  # candidate_only | role_only | full
+        if scope not in VALID_SCOPES:
+            raise ValueError(f"MEMORY_SCOPE must be one of {VALID_SCOPES}, got {scope}")
+        return cls(
+            enabled=enabled,
+            scope=scope,
+            db_url=os.getenv("MEMORY_DB_URL", "sqlite:///./talent_memory.db"),
+            candidate_memory=enabled and scope in {"candidate_only", "full"},
+            role_memory=enabled and scope in {"role_only", "full"},
+        )
+
+
+CONFIG = MemoryConfig.from_env()
+
+# Kept as module constants for existing importers.
+MEMORY_ENABLED = CONFIG.enabled
+MEMORY_SCOPE = CONFIG.scope
+MEMORY_DB_URL = CONFIG.db_url
+
+# Hoisted once more into plain module booleans so the helpers below are a
+# single global load per call.
+_MEMORY_ACTIVE = CONFIG.enabled
+_CANDIDATE_MEMORY_ACTIVE = CONFIG.candidate_memory
+_ROLE_MEMORY_ACTIVE = CONFIG.role_memory
 
 
 def is_memory_enabled() -> bool:
     """Check if memory is enabled."""
-    return MEMORY_ENABLED
+    return _MEMORY_ACTIVE
 
 
 def should_use_candidate_memory() -> bool:
     """Check if candidate memory should be used."""
-    return MEMORY_ENABLED and MEMORY_SCOPE in {"candidate_only", "full"}
+    return _CANDIDATE_MEMORY_ACTIVE
 
 
 def should_use_role_memory() -> bool:
     """Check if role memory should be used."""
-    return MEMORY_ENABLED and MEMORY_SCOPE in {"role_only", "full"}
+    return _ROLE_MEMORY_ACTIVE
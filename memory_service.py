@@ -4,12 +4,19 @@ Talent Intelligence Memory Layer for persistent candidate and role memory.
 Provides context across evaluation runs for Riva (L1) and Arjun (L2).
 """
 
+import atexit
 import hashlib
-import json
 import logging
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 from sqlalchemy import (
     Column,
@@ -19,10 +26,16 @@ from sqlalchemy import (
     DateTime,
     Text,
     JSON,
+    bindparam,
     create_engine,
+    event,
     Index,
+    select,
+    tuple_,
 )
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker, Session
 
 from evaluation_models import (
     CandidateProfile as CandidateProfileModel,
@@ -60,7 +73,7 @@ class DBCandidateEvent(Base):
     __tablename__ = "candidate_events"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    candidate_id = Column(String(255), nullable=False, index=True)
+    candidate_id = Column(String(255), nullable=False)
     run_id = Column(String(255), nullable=False, index=True)
     stage = Column(String(10), nullable=False)  # L1 or L2
     agent = Column(String(50), nullable=False)  # riva or arjun
@@ -70,10 +83,17 @@ class DBCandidateEvent(Base):
     confidence = Column(Float, nullable=False)
     artifacts = Column(JSON, default=dict)
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-    
+
+    # Composite indexes match the get_candidate_events predicates
+    # (candidate_id [+ stage] ... ORDER BY timestamp DESC LIMIT n) so the
+    # newest rows come straight out of the index with no sort step. They
+    # also cover plain candidate_id lookups, so no single-column index.
     __table_args__ = (
-        Index('idx_candidate_stage', 'candidate_id', 'stage'),
+        Index('idx_events_cand_ts', candidate_id, timestamp.desc()),
+        Index('idx_events_cand_stage_ts', candidate_id, stage, timestamp.desc()),
         Index('idx_run_candidate', 'run_id', 'candidate_id'),
+        # Backs the ON CONFLICT DO NOTHING dedup in append_candidate_events
+        Index('uq_event_run_candidate_stage', 'run_id', 'candidate_id', 'stage', unique=True),
     )
 
 
@@ -112,7 +132,7 @@ class DBEvaluation(Base):
     __tablename__ = "evaluations"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    candidate_id = Column(String(255), nullable=False, index=True)
+    candidate_id = Column(String(255), nullable=False)
     stage = Column(String(10), nullable=False)  # L1 or L2
     engine = Column(String(50), nullable=False)  # RIVA or ARJUN
     scores = Column(JSON, default=dict)
@@ -127,7 +147,8 @@ class DBEvaluation(Base):
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
     
     __table_args__ = (
-        Index('idx_eval_candidate', 'candidate_id', 'stage'),
+        # Covers candidate_id [+ stage] lookups ordered by recency
+        Index('idx_eval_cand_stage_ts', candidate_id, stage, timestamp.desc()),
     )
 
 
@@ -145,6 +166,50 @@ class DBAuditLog(Base):
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
 
 
+# Hot-path statements built once at import: the compiled SQL is reused
+# from the engine's statement cache on every call instead of being
+# re-constructed and re-compiled per lookup.
+
+_SELECT_CANDIDATE_PROFILE = select(DBCandidateProfile).where(
+    DBCandidateProfile.candidate_id == bindparam("candidate_id")
+)
+_SELECT_ROLE_PROFILE = select(DBRoleProfile).where(
+    DBRoleProfile.role == bindparam("role")
+)
+_SELECT_LATEST_DECISION = (
+    select(DBCandidateEvent.decision, DBCandidateEvent.confidence)
+    .where(DBCandidateEvent.candidate_id == bindparam("candidate_id"))
+    .order_by(DBCandidateEvent.timestamp.desc())
+    .limit(1)
+)
+_SELECT_LATEST_DECISION_FOR_STAGE = _SELECT_LATEST_DECISION.where(
+    DBCandidateEvent.stage == bindparam("stage")
+)
+
+# Column sets for the event readers: Core row tuples skip ORM
+# instrumentation and identity-map bookkeeping entirely, and the summary
+# set leaves the JSON blob columns out of the SELECT.
+_EVENT_COLUMNS = (
+    DBCandidateEvent.candidate_id,
+    DBCandidateEvent.run_id,
+    DBCandidateEvent.stage,
+    DBCandidateEvent.agent,
+    DBCandidateEvent.inputs_hash,
+    DBCandidateEvent.scores,
+    DBCandidateEvent.decision,
+    DBCandidateEvent.confidence,
+    DBCandidateEvent.artifacts,
+)
+_EVENT_SUMMARY_COLUMNS = (
+    DBCandidateEvent.candidate_id,
+    DBCandidateEvent.run_id,
+    DBCandidateEvent.stage,
+    DBCandidateEvent.agent,
+    DBCandidateEvent.decision,
+    DBCandidateEvent.confidence,
+)
+
+
 # Memory Service
 
 class MemoryService:
@@ -173,19 +238,309 @@ class MemoryService:
         if not db_url:
             db_url = MEMORY_DB_URL
         
-        self.engine = create_engine(db_url, echo=False, future=True)
-        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
-        
+        # On Postgres, batch the multi-row INSERTs emitted by the bulk
+        # methods below at the driver level as well.
+        engine_kwargs = {}
+        if db_url.startswith("postgresql"):
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+
+        # query_cache_size keeps compiled SQL for the repo's statement set
+        # comfortably resident, so repeat calls skip compilation
+        self.engine = create_engine(
+            db_url, echo=False, future=True, query_cache_size=1200, **engine_kwargs
+        )
+
+        # WAL + relaxed fsync make the per-commit cost on SQLite a fraction
+        # of the default rollback-journal mode, which dominates the
+        # append-heavy paths here. MEMORY_SQLITE_TUNING=false restores
+        # stock behavior.
+        if (
+            self.engine.dialect.name == "sqlite"
+            and os.getenv("MEMORY_SQLITE_TUNING", "true").lower() == "true"
+        ):
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.execute("PRAGMA cache_size=-65536")
+                cursor.close()
+
+        # scoped_session hands the same thread-local session back on every
+        # checkout, so several operations in one thread share a connection
+        # instead of cycling the pool per call.
+        self.SessionLocal = scoped_session(
+            sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
+        )
+        self._txn_state = threading.local()
+
+        # TTL + LRU caches over the profile getters: role profiles change
+        # rarely but are read on every evaluation, and candidate profiles
+        # are re-read several times per run. Hits skip SQL, JSON parsing,
+        # and model construction; upserts invalidate their key.
+        self._profile_cache_ttl = float(os.getenv("MEMORY_PROFILE_CACHE_TTL", "300"))
+        self._profile_cache_maxsize = 1024
+        self._role_cache: "OrderedDict[str, Tuple[float, RoleProfileModel]]" = OrderedDict()
+        self._candidate_cache: "OrderedDict[str, Tuple[float, CandidateProfileModel]]" = OrderedDict()
+        self._cache_lock = threading.RLock()
+
+        # Audit and evaluation logs don't need durability before the
+        # caller continues, so they go through a bounded queue drained by
+        # a background thread that batches rows into single inserts —
+        # taking the commit fsync off the evaluation path entirely.
+        self._log_queue: "queue.Queue[Tuple[Any, List[Dict[str, Any]]]]" = queue.Queue(
+            maxsize=int(os.getenv("MEMORY_LOG_QUEUE_SIZE", "10000"))
+        )
+        self._log_writer_stop = threading.Event()
+        self._log_writer = threading.Thread(
+            target=self._drain_log_queue, name="memory-log-writer", daemon=True
+        )
+        self._log_writer.start()
+        atexit.register(self._shutdown_log_writer)
+
+        # Dialect-specific INSERT supporting ON CONFLICT for the upsert paths
+        self._insert = pg_insert if self.engine.dialect.name == "postgresql" else sqlite_insert
+
         # Create tables if they don't exist
         Base.metadata.create_all(self.engine)
-        
+        self._ensure_indexes()
+
         logger.info(f"Memory service initialized with database: {db_url}")
-    
-    def _get_session(self) -> Optional[Session]:
-        """Get database session if enabled."""
+
+    def _ensure_indexes(self) -> None:
+        """Add newer indexes to databases created before they existed.
+
+        create_all skips tables that already exist, so legacy files never
+        pick up indexes added after their creation. IF NOT EXISTS makes
+        this a no-op on fresh databases.
+        """
+        self._event_dedup_index_ok = self._ensure_event_dedup_index()
+
+        statements = (
+            # Composite recency indexes for the LIMIT-N event/evaluation reads
+            "CREATE INDEX IF NOT EXISTS idx_events_cand_ts "
+            "ON candidate_events (candidate_id, timestamp DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_events_cand_stage_ts "
+            "ON candidate_events (candidate_id, stage, timestamp DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_eval_cand_stage_ts "
+            "ON evaluations (candidate_id, stage, timestamp DESC)",
+        )
+
+        # GIN expression indexes let analytics filter on nested JSON keys
+        # without a full-table scan. Postgres only: SQLite has no GIN,
+        # and a plain B-tree over the JSON text would just add write cost.
+        if self.engine.dialect.name == "postgresql":
+            statements += (
+                "CREATE INDEX IF NOT EXISTS idx_profile_skills_gin "
+                "ON candidate_profiles USING gin ((skills::jsonb))",
+                "CREATE INDEX IF NOT EXISTS idx_events_scores_gin "
+                "ON candidate_events USING gin ((scores::jsonb))",
+                "CREATE INDEX IF NOT EXISTS idx_eval_risk_flags_gin "
+                "ON evaluations USING gin ((risk_flags::jsonb))",
+            )
+
+        for statement in statements:
+            try:
+                with self.engine.begin() as conn:
+                    conn.exec_driver_sql(statement)
+            except Exception as e:
+                logger.warning(f"Could not create index: {e}")
+
+    def _ensure_event_dedup_index(self) -> bool:
+        """Create the unique (run_id, candidate_id, stage) event index,
+        migrating legacy duplicates out of the way first.
+
+        A database written before the index existed may hold duplicate
+        rows; those are collapsed to the newest row per key and the index
+        creation retried. Returns True when the index exists afterwards.
+        False means append_candidate_events must use its pre-SELECT guard:
+        SQLite rejects INSERT ... ON CONFLICT clauses that match no unique
+        constraint, so emitting one without the index would make every
+        event write fail.
+        """
+        create = (
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_event_run_candidate_stage "
+            "ON candidate_events (run_id, candidate_id, stage)"
+        )
+        dedupe = (
+            "DELETE FROM candidate_events WHERE id NOT IN ("
+            "SELECT MAX(id) FROM candidate_events "
+            "GROUP BY run_id, candidate_id, stage)"
+        )
+        try:
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(create)
+            return True
+        except Exception:
+            try:
+                with self.engine.begin() as conn:
+                    deleted = conn.exec_driver_sql(dedupe).rowcount
+                    conn.exec_driver_sql(create)
+                logger.info(
+                    f"Collapsed {deleted} duplicate candidate event row(s) "
+                    "while creating the unique event index"
+                )
+                return True
+            except Exception as e:
+                logger.warning(f"Could not create unique event index: {e}")
+                return False
+
+    # Background log writer
+
+    _LOG_BATCH_MAX = 100
+    _LOG_FLUSH_INTERVAL = 0.2
+
+    def _write_log_rows(self, model, rows: List[Dict[str, Any]]) -> None:
+        """Hand log rows to the background writer when possible.
+
+        Inside a transaction() block the write stays synchronous so it
+        lands in the caller's transaction; a full queue also falls back
+        to a synchronous write rather than dropping rows.
+        """
+        if getattr(self._txn_state, "active", False) or not self._enqueue_log(model, rows):
+            self._bulk_insert(model, rows)
+
+    def _enqueue_log(self, model, rows: List[Dict[str, Any]]) -> bool:
+        """Queue rows for the background writer; False when the queue is
+        full (caller falls back to a synchronous write, so no rows are
+        dropped under backpressure)."""
+        try:
+            self._log_queue.put_nowait((model, rows))
+            return True
+        except queue.Full:
+            return False
+
+    def _drain_log_queue(self) -> None:
+        """Writer-thread loop: collect up to _LOG_BATCH_MAX rows (or
+        whatever arrives within the flush interval) and insert each
+        model's rows in one statement."""
+        while True:
+            try:
+                model, rows = self._log_queue.get(timeout=self._LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if self._log_writer_stop.is_set():
+                    return
+                continue
+
+            pending: Dict[Any, List[Dict[str, Any]]] = {model: list(rows)}
+            taken = 1
+            total = len(rows)
+            while total < self._LOG_BATCH_MAX:
+                try:
+                    model, rows = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.setdefault(model, []).extend(rows)
+                taken += 1
+                total += len(rows)
+
+            try:
+                for batch_model, batch_rows in pending.items():
+                    self._bulk_insert(batch_model, batch_rows)
+            finally:
+                for _ in range(taken):
+                    self._log_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued audit/evaluation row is persisted."""
+        if getattr(self, "_log_writer", None) is not None and self._log_writer.is_alive():
+            self._log_queue.join()
+
+    def _shutdown_log_writer(self) -> None:
+        """atexit hook: drain the queue, then stop the writer thread."""
+        self.flush()
+        self._log_writer_stop.set()
+
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Return a cached profile if present and fresh, else None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self._profile_cache_ttl:
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, key: str, value) -> None:
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            while len(cache) > self._profile_cache_maxsize:
+                cache.popitem(last=False)
+
+    def _cache_pop(self, cache: OrderedDict, key: str) -> None:
+        with self._cache_lock:
+            cache.pop(key, None)
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """Yield the thread-local session with commit/rollback handling.
+
+        Outside a transaction() block, commits on success, rolls back on
+        error, and returns the session to the registry. Inside one, the
+        shared session is yielded as-is so every operation lands in the
+        enclosing transaction and commits once at its end.
+        """
+        session = self.SessionLocal()
+        if getattr(self._txn_state, "active", False):
+            yield session
+            return
+
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.SessionLocal.remove()
+
+    @contextmanager
+    def transaction(self) -> Iterator["MemoryService"]:
+        """Group several memory operations into one session and one commit.
+
+        Usage::
+
+            with memory.transaction():
+                memory.append_candidate_event(event)
+                memory.log_evaluation(evaluation)
+
+        Every call inside the block reuses one thread-local session, so a
+        per-candidate burst of writes costs a single BEGIN/COMMIT (one
+        fsync on SQLite) instead of one per method call.
+        """
         if not self.enabled or not self.SessionLocal:
-            return None
-        return self.SessionLocal()
+            yield self
+            return
+
+        session = self.SessionLocal()
+        self._txn_state.active = True
+        try:
+            yield self
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._txn_state.active = False
+            self.SessionLocal.remove()
+
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]]) -> None:
+        """Insert many rows of one model in a single statement + commit.
+
+        Shared by the batched log/append methods: one round trip and one
+        fsync for the whole batch instead of one per row. Row dicts must
+        share the same key set so the batch stays a single executemany.
+        """
+        if not rows or not self.enabled or not self.SessionLocal:
+            return
+
+        try:
+            with self._session_scope() as session:
+                session.bulk_insert_mappings(model, rows, render_nulls=True)
+        except Exception as e:
+            logger.error(f"Error bulk inserting {model.__tablename__}: {e}", exc_info=True)
     
     # Candidate Profile Methods
     
@@ -199,32 +554,35 @@ class MemoryService:
         Returns:
             CandidateProfile or None if not found
         """
-        if not self.enabled:
-            return None
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return None
-        
+
+        cached = self._cache_get(self._candidate_cache, candidate_id)
+        if cached is not None:
+            return cached
+
         try:
-            db_profile = session.query(DBCandidateProfile).filter_by(candidate_id=candidate_id).first()
-            
-            if not db_profile:
-                return None
-            
-            return CandidateProfileModel(
-                candidate_id=db_profile.candidate_id,
-                name=db_profile.name,
-                role=db_profile.role,
-                skills=db_profile.skills or {},
-                experience_years=db_profile.experience_years,
-                final_outcome=db_profile.final_outcome,
-            )
+            with self._session_scope() as session:
+                db_profile = session.execute(
+                    _SELECT_CANDIDATE_PROFILE, {"candidate_id": candidate_id}
+                ).scalar_one_or_none()
+
+                if not db_profile:
+                    return None
+
+                profile = CandidateProfileModel(
+                    candidate_id=db_profile.candidate_id,
+                    name=db_profile.name,
+                    role=db_profile.role,
+                    skills=db_profile.skills or {},
+                    experience_years=db_profile.experience_years,
+                    final_outcome=db_profile.final_outcome,
+                )
+                self._cache_put(self._candidate_cache, candidate_id, profile)
+                return profile
         except Exception as e:
             logger.error(f"Error retrieving candidate profile {candidate_id}: {e}", exc_info=True)
             return None
-        finally:
-            session.close()
     
     def upsert_candidate_profile(self, profile: CandidateProfileModel) -> None:
         """
@@ -233,97 +591,137 @@ class MemoryService:
         Args:
             profile: CandidateProfile to save
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return
-        
+
         try:
-            db_profile = session.query(DBCandidateProfile).filter_by(
-                candidate_id=profile.candidate_id
-            ).first()
-            
-            if db_profile:
-                # Update existing
-                db_profile.name = profile.name
-                db_profile.role = profile.role
-                db_profile.skills = profile.skills
-                db_profile.experience_years = profile.experience_years
-                db_profile.final_outcome = profile.final_outcome
-                db_profile.updated_at = datetime.now(timezone.utc)
-            else:
-                # Create new
-                db_profile = DBCandidateProfile(
-                    candidate_id=profile.candidate_id,
-                    name=profile.name,
-                    role=profile.role,
-                    skills=profile.skills,
-                    experience_years=profile.experience_years,
-                    final_outcome=profile.final_outcome,
-                )
-                session.add(db_profile)
-            
-            session.commit()
+            # Single-statement upsert: no SELECT-then-branch round trip
+            now = datetime.now(timezone.utc)
+            stmt = self._insert(DBCandidateProfile).values(
+                candidate_id=profile.candidate_id,
+                name=profile.name,
+                role=profile.role,
+                skills=profile.skills,
+                experience_years=profile.experience_years,
+                final_outcome=profile.final_outcome,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["candidate_id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "role": stmt.excluded.role,
+                    "skills": stmt.excluded.skills,
+                    "experience_years": stmt.excluded.experience_years,
+                    "final_outcome": stmt.excluded.final_outcome,
+                    "updated_at": now,
+                },
+            )
+            with self._session_scope() as session:
+                session.execute(stmt)
+            self._cache_pop(self._candidate_cache, profile.candidate_id)
             logger.info(f"Upserted candidate profile: {profile.candidate_id}")
-            
+
         except Exception as e:
-            session.rollback()
             logger.error(f"Error upserting candidate profile {profile.candidate_id}: {e}", exc_info=True)
-        finally:
-            session.close()
     
     # Candidate Event Methods
     
     def append_candidate_event(self, event: CandidateEventModel) -> None:
         """
         Append a new evaluation event for a candidate.
-        
+
         Args:
             event: CandidateEvent to record
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        self.append_candidate_events([event])
+
+    def append_candidate_events(self, events: List[CandidateEventModel]) -> None:
+        """
+        Append many evaluation events in one transaction.
+
+        One duplicate probe and one multi-row INSERT cover the whole
+        batch, instead of a SELECT + INSERT + commit per event.
+
+        Args:
+            events: CandidateEvents to record
+        """
+        if not self.enabled or not events or not self.SessionLocal:
             return
-        
+
         try:
-            # Check for duplicate run_id + candidate_id (idempotency)
-            existing = session.query(DBCandidateEvent).filter_by(
-                run_id=event.run_id,
-                candidate_id=event.candidate_id,
-                stage=event.stage
-            ).first()
-            
-            if existing:
-                logger.warning(f"Event already exists for run_id={event.run_id}, candidate={event.candidate_id}, stage={event.stage}")
-                return
-            
-            db_event = DBCandidateEvent(
-                candidate_id=event.candidate_id,
-                run_id=event.run_id,
-                stage=event.stage,
-                agent=event.agent,
-                inputs_hash=event.inputs_hash,
-                scores=event.scores,
-                decision=event.decision,
-                confidence=event.confidence,
-                artifacts=event.artifacts,
-            )
-            
-            session.add(db_event)
-            session.commit()
-            logger.info(f"Appended event: stage={event.stage}, candidate={event.candidate_id}")
-            
+            # Duplicate run_id + candidate_id + stage rows are dropped by
+            # the unique index via ON CONFLICT DO NOTHING — no pre-SELECT,
+            # and no read-modify-write race under concurrent writers.
+            now = datetime.now(timezone.utc)
+            rows = [
+                {
+                    "candidate_id": event.candidate_id,
+                    "run_id": event.run_id,
+                    "stage": event.stage,
+                    "agent": event.agent,
+                    "inputs_hash": event.inputs_hash,
+                    "scores": event.scores,
+                    "decision": event.decision,
+                    "confidence": event.confidence,
+                    "artifacts": event.artifacts,
+                    "timestamp": now,
+                }
+                for event in events
+            ]
+
+            if self._event_dedup_index_ok:
+                stmt = self._insert(DBCandidateEvent).on_conflict_do_nothing(
+                    index_elements=["run_id", "candidate_id", "stage"]
+                )
+                with self._session_scope() as session:
+                    session.execute(stmt, rows)
+            else:
+                # The unique index could not be created on this database,
+                # and SQLite rejects ON CONFLICT clauses with no matching
+                # constraint — probe for existing keys and insert the rest,
+                # like the pre-index duplicate check did.
+                rows = self._filter_existing_events(rows)
+                if rows:
+                    with self._session_scope() as session:
+                        session.execute(self._insert(DBCandidateEvent), rows)
+            logger.info(f"Appended {len(rows)} candidate event(s)")
+
         except Exception as e:
-            session.rollback()
-            logger.error(f"Error appending candidate event: {e}", exc_info=True)
-        finally:
-            session.close()
-    
+            logger.error(f"Error appending candidate events: {e}", exc_info=True)
+
+    def _filter_existing_events(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop rows whose (run_id, candidate_id, stage) already exists.
+
+        Fallback duplicate guard for databases without the unique event
+        index; keeps the first row per key within the batch, matching what
+        ON CONFLICT DO NOTHING would do.
+        """
+        fresh: List[Dict[str, Any]] = []
+        seen = set()
+        keys = {(row["run_id"], row["candidate_id"], row["stage"]) for row in rows}
+        key_tuple = tuple_(
+            DBCandidateEvent.run_id,
+            DBCandidateEvent.candidate_id,
+            DBCandidateEvent.stage,
+        )
+        with self._session_scope() as session:
+            existing = set(
+                session.execute(
+                    select(
+                        DBCandidateEvent.run_id,
+                        DBCandidateEvent.candidate_id,
+                        DBCandidateEvent.stage,
+                    ).where(key_tuple.in_(keys))
+                )
+            )
+        for row in rows:
+            key = (row["run_id"], row["candidate_id"], row["stage"])
+            if key in existing or key in seen:
+                continue
+            seen.add(key)
+            fresh.append(row)
+        return fresh
+
     def get_candidate_events(
         self,
         candidate_id: str,
@@ -341,41 +739,135 @@ class MemoryService:
         Returns:
             List of CandidateEvents, most recent first
         """
-        if not self.enabled:
-            return []
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return []
-        
+
         try:
-            query = session.query(DBCandidateEvent).filter_by(candidate_id=candidate_id)
-            
-            if stage:
-                query = query.filter_by(stage=stage.upper())
-            
-            db_events = query.order_by(DBCandidateEvent.timestamp.desc()).limit(limit).all()
-            
-            return [
-                CandidateEventModel(
-                    candidate_id=e.candidate_id,
-                    run_id=e.run_id,
-                    stage=e.stage,
-                    agent=e.agent,
-                    inputs_hash=e.inputs_hash,
-                    scores=e.scores or {},
-                    decision=e.decision,
-                    confidence=e.confidence,
-                    artifacts=e.artifacts or {},
+            with self._session_scope() as session:
+                stmt = select(*_EVENT_COLUMNS).where(
+                    DBCandidateEvent.candidate_id == candidate_id
                 )
-                for e in db_events
-            ]
-            
+
+                if stage:
+                    stmt = stmt.where(DBCandidateEvent.stage == stage.upper())
+
+                rows = session.execute(
+                    stmt.order_by(DBCandidateEvent.timestamp.desc()).limit(limit)
+                ).all()
+
+                return [
+                    CandidateEventModel(
+                        candidate_id=row.candidate_id,
+                        run_id=row.run_id,
+                        stage=row.stage,
+                        agent=row.agent,
+                        inputs_hash=row.inputs_hash,
+                        scores=row.scores or {},
+                        decision=row.decision,
+                        confidence=row.confidence,
+                        artifacts=row.artifacts or {},
+                    )
+                    for row in rows
+                ]
+
         except Exception as e:
             logger.error(f"Error retrieving candidate events: {e}", exc_info=True)
             return []
-        finally:
-            session.close()
+
+    def get_candidate_events_summary(
+        self,
+        candidate_id: str,
+        stage: Optional[str] = None,
+        limit: int = 10
+    ) -> List[CandidateEventModel]:
+        """
+        Get recent events without loading the JSON blob columns.
+
+        Same shape as get_candidate_events, but scores/artifacts come
+        back empty and inputs_hash is None: the blob columns are left out
+        of the SELECT, so prompt-context callers that only read
+        stage/agent/decision/confidence avoid pulling and deserializing
+        the blobs.
+
+        Args:
+            candidate_id: Candidate Drive folder ID
+            stage: Filter by stage (L1 or L2), optional
+            limit: Maximum number of events to return
+
+        Returns:
+            List of CandidateEvents, most recent first
+        """
+        if not self.enabled or not self.SessionLocal:
+            return []
+
+        try:
+            with self._session_scope() as session:
+                stmt = select(*_EVENT_SUMMARY_COLUMNS).where(
+                    DBCandidateEvent.candidate_id == candidate_id
+                )
+
+                if stage:
+                    stmt = stmt.where(DBCandidateEvent.stage == stage.upper())
+
+                rows = session.execute(
+                    stmt.order_by(DBCandidateEvent.timestamp.desc()).limit(limit)
+                ).all()
+
+                return [
+                    CandidateEventModel(
+                        candidate_id=row.candidate_id,
+                        run_id=row.run_id,
+                        stage=row.stage,
+                        agent=row.agent,
+                        inputs_hash=None,
+                        scores={},
+                        decision=row.decision,
+                        confidence=row.confidence,
+                        artifacts={},
+                    )
+                    for row in rows
+                ]
+
+        except Exception as e:
+            logger.error(f"Error retrieving candidate event summaries: {e}", exc_info=True)
+            return []
+
+    def get_latest_decision(
+        self,
+        candidate_id: str,
+        stage: Optional[str] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Get the newest (decision, confidence) pair for a candidate.
+
+        Column-tuple query: no ORM row construction and no JSON columns
+        touched, for callers that only need the latest outcome.
+
+        Args:
+            candidate_id: Candidate Drive folder ID
+            stage: Filter by stage (L1 or L2), optional
+
+        Returns:
+            (decision, confidence) or None if no events exist
+        """
+        if not self.enabled or not self.SessionLocal:
+            return None
+
+        try:
+            with self._session_scope() as session:
+                if stage:
+                    stmt = _SELECT_LATEST_DECISION_FOR_STAGE
+                    params = {"candidate_id": candidate_id, "stage": stage.upper()}
+                else:
+                    stmt = _SELECT_LATEST_DECISION
+                    params = {"candidate_id": candidate_id}
+
+                row = session.execute(stmt, params).first()
+                return (row.decision, row.confidence) if row else None
+
+        except Exception as e:
+            logger.error(f"Error retrieving latest decision: {e}", exc_info=True)
+            return None
     
     # Role Profile Methods
     
@@ -389,33 +881,36 @@ class MemoryService:
         Returns:
             RoleProfile or None if not found
         """
-        if not self.enabled:
-            return None
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return None
-        
+
+        cached = self._cache_get(self._role_cache, role)
+        if cached is not None:
+            return cached
+
         try:
-            db_role = session.query(DBRoleProfile).filter_by(role=role).first()
-            
-            if not db_role:
-                return None
-            
-            return RoleProfileModel(
-                role=db_role.role,
-                rubric_version=db_role.rubric_version,
-                competency_weights=db_role.competency_weights or {},
-                common_rejection_reasons=db_role.common_rejection_reasons or [],
-                top_performer_patterns=db_role.top_performer_patterns or [],
-                notes=db_role.notes,
-            )
-            
+            with self._session_scope() as session:
+                db_role = session.execute(
+                    _SELECT_ROLE_PROFILE, {"role": role}
+                ).scalar_one_or_none()
+
+                if not db_role:
+                    return None
+
+                profile = RoleProfileModel(
+                    role=db_role.role,
+                    rubric_version=db_role.rubric_version,
+                    competency_weights=db_role.competency_weights or {},
+                    common_rejection_reasons=db_role.common_rejection_reasons or [],
+                    top_performer_patterns=db_role.top_performer_patterns or [],
+                    notes=db_role.notes,
+                )
+                self._cache_put(self._role_cache, role, profile)
+                return profile
+
         except Exception as e:
             logger.error(f"Error retrieving role profile {role}: {e}", exc_info=True)
             return None
-        finally:
-            session.close()
     
     def upsert_role_profile(self, profile: RoleProfileModel) -> None:
         """
@@ -424,44 +919,38 @@ class MemoryService:
         Args:
             profile: RoleProfile to save
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return
-        
+
         try:
-            db_role = session.query(DBRoleProfile).filter_by(role=profile.role).first()
-            
-            if db_role:
-                # Update existing
-                db_role.rubric_version = profile.rubric_version
-                db_role.competency_weights = profile.competency_weights
-                db_role.common_rejection_reasons = profile.common_rejection_reasons
-                db_role.top_performer_patterns = profile.top_performer_patterns
-                db_role.notes = profile.notes
-                db_role.updated_at = datetime.now(timezone.utc)
-            else:
-                # Create new
-                db_role = DBRoleProfile(
-                    role=profile.role,
-                    rubric_version=profile.rubric_version,
-                    competency_weights=profile.competency_weights,
-                    common_rejection_reasons=profile.common_rejection_reasons,
-                    top_performer_patterns=profile.top_performer_patterns,
-                    notes=profile.notes,
-                )
-                session.add(db_role)
-            
-            session.commit()
+            # Single-statement upsert: no SELECT-then-branch round trip
+            now = datetime.now(timezone.utc)
+            stmt = self._insert(DBRoleProfile).values(
+                role=profile.role,
+                rubric_version=profile.rubric_version,
+                competency_weights=profile.competency_weights,
+                common_rejection_reasons=profile.common_rejection_reasons,
+                top_performer_patterns=profile.top_performer_patterns,
+                notes=profile.notes,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["role"],
+                set_={
+                    "rubric_version": stmt.excluded.rubric_version,
+                    "competency_weights": stmt.excluded.competency_weights,
+                    "common_rejection_reasons": stmt.excluded.common_rejection_reasons,
+                    "top_performer_patterns": stmt.excluded.top_performer_patterns,
+                    "notes": stmt.excluded.notes,
+                    "updated_at": now,
+                },
+            )
+            with self._session_scope() as session:
+                session.execute(stmt)
+            self._cache_pop(self._role_cache, profile.role)
             logger.info(f"Upserted role profile: {profile.role}")
-            
+
         except Exception as e:
-            session.rollback()
             logger.error(f"Error upserting role profile {profile.role}: {e}", exc_info=True)
-        finally:
-            session.close()
     
     # Decision Override Methods
     
@@ -483,31 +972,23 @@ class MemoryService:
             to_decision: Manual override decision
             reason: Reason for override
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        if not self.enabled or not self.SessionLocal:
             return
-        
+
         try:
-            override = DBDecisionOverride(
-                candidate_id=candidate_id,
-                stage=stage.upper(),
-                from_decision=from_decision,
-                to_decision=to_decision,
-                reason=reason,
-            )
-            
-            session.add(override)
-            session.commit()
+            with self._session_scope() as session:
+                override = DBDecisionOverride(
+                    candidate_id=candidate_id,
+                    stage=stage.upper(),
+                    from_decision=from_decision,
+                    to_decision=to_decision,
+                    reason=reason,
+                )
+                session.add(override)
             logger.info(f"Logged override: {candidate_id} {stage} {from_decision}->{to_decision}")
-            
+
         except Exception as e:
-            session.rollback()
             logger.error(f"Error logging override: {e}", exc_info=True)
-        finally:
-            session.close()
 
     # Logging Methods
 
@@ -518,38 +999,38 @@ class MemoryService:
         Args:
             evaluation_data: Dictionary matching DBEvaluation fields
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        self.log_evaluations([evaluation_data])
+
+    def log_evaluations(self, evaluations: List[Dict[str, Any]]) -> None:
+        """
+        Log many evaluation records in one multi-row INSERT.
+
+        Args:
+            evaluations: Dictionaries matching DBEvaluation fields
+        """
+        if not self.enabled or not evaluations:
             return
-        
-        try:
-            db_eval = DBEvaluation(
-                candidate_id=evaluation_data["candidate_id"],
-                stage=evaluation_data["stage"],
-                engine=evaluation_data["engine"],
-                scores=evaluation_data.get("scores", {}),
-                risk_flags=evaluation_data.get("risk_flags", []),
-                reason_codes=evaluation_data.get("reason_codes", []),
-                raw_recommendation=evaluation_data.get("raw_recommendation"),
-                decision_outcome=evaluation_data["decision_outcome"],
-                prompt_version=evaluation_data.get("prompt_version"),
-                decision_logic_version=evaluation_data.get("decision_logic_version"),
-                model_version=evaluation_data.get("model_version"),
-                debug_payload_uri=evaluation_data.get("debug_payload_uri"),
-            )
-            
-            session.add(db_eval)
-            session.commit()
-            logger.info(f"Logged evaluation: {evaluation_data['candidate_id']} {evaluation_data['stage']}")
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error logging evaluation: {e}", exc_info=True)
-        finally:
-            session.close()
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "candidate_id": data["candidate_id"],
+                "stage": data["stage"],
+                "engine": data["engine"],
+                "scores": data.get("scores", {}),
+                "risk_flags": data.get("risk_flags", []),
+                "reason_codes": data.get("reason_codes", []),
+                "raw_recommendation": data.get("raw_recommendation"),
+                "decision_outcome": data["decision_outcome"],
+                "prompt_version": data.get("prompt_version"),
+                "decision_logic_version": data.get("decision_logic_version"),
+                "model_version": data.get("model_version"),
+                "debug_payload_uri": data.get("debug_payload_uri"),
+                "timestamp": now,
+            }
+            for data in evaluations
+        ]
+        self._write_log_rows(DBEvaluation, rows)
 
     def log_audit_event(
         self,
@@ -569,30 +1050,37 @@ class MemoryService:
             to_state: New state (optional)
             metadata: Additional context
         """
-        if not self.enabled:
-            return
-        
-        session = self._get_session()
-        if not session:
+        self.log_audit_events([{
+            "actor": actor,
+            "action": action,
+            "from_state": from_state,
+            "to_state": to_state,
+            "metadata": metadata,
+        }])
+
+    def log_audit_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Log many audit events in one multi-row INSERT.
+
+        Args:
+            events: Dictionaries with actor/action/from_state/to_state/metadata
+        """
+        if not self.enabled or not events:
             return
-        
-        try:
-            audit = DBAuditLog(
-                actor=actor,
-                action=action,
-                from_state=from_state,
-                to_state=to_state,
-                metadata_=metadata or {},
-            )
-            
-            session.add(audit)
-            session.commit()
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error logging audit event: {e}", exc_info=True)
-        finally:
-            session.close()
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "actor": data["actor"],
+                "action": data["action"],
+                "from_state": data.get("from_state"),
+                "to_state": data.get("to_state"),
+                "metadata_": data.get("metadata") or {},
+                "timestamp": now,
+            }
+            for data in events
+        ]
+        self._write_log_rows(DBAuditLog, rows)
     
     # Utility Methods
     
@@ -600,15 +1088,22 @@ class MemoryService:
     def compute_inputs_hash(inputs: Dict) -> str:
         """
         Compute a hash of evaluation inputs for deduplication.
-        
+
+        orjson canonicalizes (sorted keys, straight to bytes) much faster
+        than stdlib json, and BLAKE2b outpaces SHA-256 on CPUs without
+        SHA extensions. This is a dedup key, not a security boundary, so
+        a 128-bit digest (32 hex chars) is plenty.
+
         Args:
             inputs: Dictionary of input data
-            
+
         Returns:
-            SHA-256 hash string
+            BLAKE2b hash string (32 hex chars)
         """
-        serialized = json.dumps(inputs, sort_keys=True)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        serialized = orjson.dumps(
+            inputs, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        )
+        return hashlib.blake2b(serialized, digest_size=16).hexdigest()
 
 
 # Global instance
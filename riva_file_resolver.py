@@ -226,7 +226,7 @@ class RivaFileResolver:
         mime = (file_obj.get("mimeType") or "").lower()
 
         if mime == "application/vnd.google-apps.document":
-            return self.drive.export_google_doc_to_text(file_id)
+            return self.drive.export_google_doc_to_text(file_id, mime_type=mime)
 
         data = self.drive.download_file_bytes(file_id)
 
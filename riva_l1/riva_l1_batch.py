@@ -280,274 +280,10 @@ class RivaL1BatchProcessor:
                 )
                 continue
 
-            for candidate in candidate_folders:
-                folder_id = self.drive.get_real_folder_id(candidate)
-                folder_name = candidate["name"]
-                candidate_correlation_id = f"{self.correlation_id}::{folder_name}"
-                self.summary.total_seen += 1
-
-                logger.info(
-                    "Processing candidate: %s",
-                    folder_name,
-                    extra={
-                        "correlation_id": candidate_correlation_id,
-                        "candidate_name": folder_name,
-                        "candidate_folder_id": folder_id,
-                        "role": role,
-                    },
-                )
-
-                print("\n-------------------------------------")
-                print(f"👤 Processing Candidate: {folder_name}")
-                print(f"🔍 Candidate Correlation ID: {candidate_correlation_id}")
-                print("-------------------------------------\n")
-
-                try:
-                    files = self.drive.list_files(
-                        folder_id, correlation_id=candidate_correlation_id
-                    )
-                    artifacts = self._load_candidate_artifacts(
-                        files, candidate_correlation_id
-                    )
-                    if artifacts is None:
-                        self._mark_data_incomplete(
-                            folder_id,
-                            folder_name,
-                            role,
-                            candidate_correlation_id,
-                            reason="normalization_report_missing",
-                        )
-                        continue
-
-                    gating_status = self._apply_gating(
-                        artifacts,
-                        folder_id,
-                        folder_name,
-                        role,
-                        candidate_correlation_id,
-                    )
-                    if gating_status:
-                        continue
-
-                    bundle = self.file_resolver.load(
-                        folder_id,
-                        role_name=role,
-                        candidate_name=folder_name,
-                        correlation_id=candidate_correlation_id,
-                    )
-
-                    memory_context, _, _, role_profile = (
-                        self._prepare_memory_context(
-                            folder_id,
-                            role,
-                            folder_name,
-                            candidate_correlation_id,
-                        )
-                    )
-
-                    logger.info(
-                        "Running Riva L1 evaluation for candidate %s",
-                        folder_name,
-                        extra={
-                            "correlation_id": candidate_correlation_id,
-                            "candidate_name": folder_name,
-                        },
-                    )
-                    result = self.riva.evaluate(
-                        resume_text=bundle.resume_text,
-                        jd_text=bundle.jd_text,
-                        transcript_text=bundle.transcript_text,
-                        feedback_text=bundle.feedback_text,
-                        memory_context=memory_context,
-                    )
-
-                    bundle_meta = bundle.meta if hasattr(bundle, "meta") else {}
-                    preliminary_evaluation = convert_riva_result(
-                        candidate_id=folder_id,
-                        role=role,
-                        pipeline_decision="HOLD",
-                        result=result,
-                    )
-                    pipeline_decision, decision_reason, hold_type = self._determine_pipeline_decision(
-                        evaluation=preliminary_evaluation,
-                        result=result,
-                        bundle=bundle,
-                        evaluated_so_far=self.summary.evaluated,
-                    )
-                    hold_reason_code = self._resolve_hold_reason_code(hold_type)
-                    evaluation = convert_riva_result(
-                        candidate_id=folder_id,
-                        role=role,
-                        pipeline_decision=pipeline_decision,
-                        result=result,
-                    )
-                    human_decision = {
-                        "SEND_TO_L2": self.DECISION_MOVE_TO_L2,
-                        "REJECT_AT_L1": self.DECISION_REJECT,
-                    }.get(pipeline_decision, self.DECISION_HOLD)
-                    feedback_link = self._extract_meta_file_link(bundle_meta, "l1_feedback")
-                    logger.info(
-                        "[%s::%s] l1_decision=%s manual_review_reason=%s",
-                        candidate_correlation_id,
-                        folder_name,
-                        human_decision,
-                        decision_reason if human_decision == self.DECISION_HOLD else "",
-                        extra={
-                            "fit_score": result.fit_score,
-                            "confidence": evaluation.confidence,
-                            "pipeline_decision": pipeline_decision,
-                        },
-                    )
-                    self._record_candidate_result(
-                        candidate_name=folder_name,
-                        role=role,
-                        decision=human_decision,
-                        reason=decision_reason,
-                        hold_type=hold_type,
-                        hold_reason=hold_reason_code,
-                        candidate_folder_id=folder_id,
-                        feedback_link=feedback_link,
-                        dashboard_link=self._build_dashboard_link(role),
-                        risk_flags=evaluation.risk_flags or result.risk_flags,
-                    )
-
-                    logger.info(
-                        "Riva L1 evaluation completed for %s",
-                        folder_name,
-                        extra={
-                            "correlation_id": candidate_correlation_id,
-                            "candidate_name": folder_name,
-                            "decision": pipeline_decision,
-                            "fit_score": result.fit_score,
-                        },
-                    )
-
-                    # Log structured evaluation and audit event
-                    if self.memory_enabled and self.memory:
-                        try:
-                            # Create debug payload
-                            debug_payload = {
-                                "candidate_id": folder_id,
-                                "candidate_name": folder_name,
-                                "stage": "L1",
-                                "prompt": "RIVA_L1_PROMPT",  # Could extract from service
-                                "raw_response": result.model_dump(),
-                                "bundle_meta": bundle_meta,
-                                "decision_trace": {
-                                    "pipeline_decision": pipeline_decision,
-                                    "decision_reason": decision_reason,
-                                    "hold_type": hold_type,
-                                },
-                            }
-                            debug_storage = get_debug_storage()
-                            debug_uri = debug_storage.upload_debug_payload(
-                                debug_payload,
-                                prefix="riva_l1",
-                                run_id=self.correlation_id
-                            )
-                            
-                            # Log evaluation
-                            self.memory.log_evaluation({
-                                "candidate_id": folder_id,
-                                "stage": "L1",
-                                "engine": "RIVA",
-                                "scores": evaluation.scores,
-                                "risk_flags": evaluation.risk_flags or [],
-                                "reason_codes": [],  # Not available in current model
-                                "raw_recommendation": result.final_decision,
-                                "decision_outcome": pipeline_decision,
-                                "prompt_version": "v1.0",
-                                "decision_logic_version": "v2.0",  # Updated with new engine
-                                "model_version": "gpt-4",  # Could be dynamic
-                                "debug_payload_uri": debug_uri,
-                            })
-                            
-                            # Log audit event for state transition
-                            self.memory.log_audit_event(
-                                actor="RIVA",
-                                action="L1_EVALUATION_COMPLETE",
-                                from_state="PENDING_L1",
-                                to_state=pipeline_decision,
-                                metadata={
-                                    "candidate_id": folder_id,
-                                    "candidate_name": folder_name,
-                                    "role": role,
-                                    "fit_score": result.fit_score,
-                                }
-                            )
-                        except Exception as log_err:
-                            logger.warning(f"Failed to log evaluation/audit: {log_err}", exc_info=True)
-
-                    self._persist_l1_result(
-                        folder_id,
-                        result,
-                        evaluation,
-                        pipeline_decision,
-                        candidate_correlation_id,
-                    )
-
-                    RivaOutputWriter.generate_riva_report(folder_id, result)
-                    if pipeline_decision == "SEND_TO_L2":
-                        RivaOutputWriter.generate_l2_questionnaire(folder_id, result)
-
-                    artifacts = {
-                        "folder_id": folder_id,
-                        "l1_result_path": self.RESULT_FILENAME,
-                        "status_path": self.STATUS_FILENAME,
-                    }
-                    self._persist_memory_state(
-                        evaluation=evaluation,
-                        candidate_name=folder_name,
-                        bundle=bundle,
-                        artifacts=artifacts,
-                        role_profile=role_profile,
-                    )
-
-                    self._log_decision(
-                        candidate_name=folder_name,
-                        role=role,
-                        correlation_id=candidate_correlation_id,
-                        result=result,
-                        evaluation=evaluation,
-                        pipeline_recommendation=pipeline_decision,
-                        candidate_folder_id=folder_id,
-                        hold_reason_code=hold_reason_code,
-                        hold_type=hold_type,
-                        bundle_meta=bundle_meta,
-                    )
-
-                    self._route_candidate(
-                        pipeline_decision,
-                        folder_id,
-                        role,
-                        folder_name,
-                        candidate_correlation_id,
-                    )
-
-                    self.summary.evaluated += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Error processing candidate %s: %s",
-                        folder_name,
-                        str(e),
-                        extra={
-                            "correlation_id": candidate_correlation_id,
-                            "candidate_name": folder_name,
-                            "error": str(e),
-                        },
-                        exc_info=True,
-                    )
-                    print(f"❌ Error processing {folder_name}: {str(e)}")
-                    traceback.print_exc()
-                    self._record_batch_error(
-                        error_code=self._derive_error_code(e),
-                        error_message="Candidate processing failed; please review this folder manually.",
-                        candidate_name=folder_name,
-                        role=role,
-                        folder_id=folder_id,
-                        technical_detail=str(e),
-                    )
+            # One Sheets append per role instead of one per candidate
+            with self.decision_store.batch():
+                for candidate in candidate_folders:
+                    self._process_candidate(role, l1_folder_id, candidate)
 
         # ---------------------------------------------------
         # STEP 3 — SUMMARY
@@ -577,6 +313,331 @@ class RivaL1BatchProcessor:
 
         return self.summary
 
+    def _process_candidate(self, role: str, l1_folder_id: Optional[str], candidate: Dict) -> None:
+        """
+        Run the full L1 pipeline for one candidate folder entry.
+
+        Shared by the batch loop and process_single_candidate; errors are
+        recorded on the summary rather than raised.
+        """
+        folder_id = self.drive.get_real_folder_id(candidate)
+        folder_name = candidate["name"]
+        candidate_correlation_id = f"{self.correlation_id}::{folder_name}"
+        self.summary.total_seen += 1
+
+        logger.info(
+            "Processing candidate: %s",
+            folder_name,
+            extra={
+                "correlation_id": candidate_correlation_id,
+                "candidate_name": folder_name,
+                "candidate_folder_id": folder_id,
+                "role": role,
+            },
+        )
+
+        print("\n-------------------------------------")
+        print(f"👤 Processing Candidate: {folder_name}")
+        print(f"🔍 Candidate Correlation ID: {candidate_correlation_id}")
+        print("-------------------------------------\n")
+
+        try:
+            files = self.drive.list_files(
+                folder_id, correlation_id=candidate_correlation_id
+            )
+            artifacts = self._load_candidate_artifacts(
+                files, candidate_correlation_id
+            )
+            if artifacts is None:
+                self._mark_data_incomplete(
+                    folder_id,
+                    folder_name,
+                    role,
+                    candidate_correlation_id,
+                    reason="normalization_report_missing",
+                )
+                return
+
+            gating_status = self._apply_gating(
+                artifacts,
+                folder_id,
+                folder_name,
+                role,
+                candidate_correlation_id,
+            )
+            if gating_status:
+                return
+
+            bundle = self.file_resolver.load(
+                folder_id,
+                role_name=role,
+                candidate_name=folder_name,
+                correlation_id=candidate_correlation_id,
+            )
+
+            memory_context, _, _, role_profile = (
+                self._prepare_memory_context(
+                    folder_id,
+                    role,
+                    folder_name,
+                    candidate_correlation_id,
+                )
+            )
+
+            logger.info(
+                "Running Riva L1 evaluation for candidate %s",
+                folder_name,
+                extra={
+                    "correlation_id": candidate_correlation_id,
+                    "candidate_name": folder_name,
+                },
+            )
+            result = self.riva.evaluate(
+                resume_text=bundle.resume_text,
+                jd_text=bundle.jd_text,
+                transcript_text=bundle.transcript_text,
+                feedback_text=bundle.feedback_text,
+                memory_context=memory_context,
+            )
+
+            bundle_meta = bundle.meta if hasattr(bundle, "meta") else {}
+            preliminary_evaluation = convert_riva_result(
+                candidate_id=folder_id,
+                role=role,
+                pipeline_decision="HOLD",
+                result=result,
+            )
+            pipeline_decision, decision_reason, hold_type = self._determine_pipeline_decision(
+                evaluation=preliminary_evaluation,
+                result=result,
+                bundle=bundle,
+                evaluated_so_far=self.summary.evaluated,
+            )
+            hold_reason_code = self._resolve_hold_reason_code(hold_type)
+            evaluation = convert_riva_result(
+                candidate_id=folder_id,
+                role=role,
+                pipeline_decision=pipeline_decision,
+                result=result,
+            )
+            human_decision = {
+                "SEND_TO_L2": self.DECISION_MOVE_TO_L2,
+                "REJECT_AT_L1": self.DECISION_REJECT,
+            }.get(pipeline_decision, self.DECISION_HOLD)
+            feedback_link = self._extract_meta_file_link(bundle_meta, "l1_feedback")
+            logger.info(
+                "[%s::%s] l1_decision=%s manual_review_reason=%s",
+                candidate_correlation_id,
+                folder_name,
+                human_decision,
+                decision_reason if human_decision == self.DECISION_HOLD else "",
+                extra={
+                    "fit_score": result.fit_score,
+                    "confidence": evaluation.confidence,
+                    "pipeline_decision": pipeline_decision,
+                },
+            )
+            self._record_candidate_result(
+                candidate_name=folder_name,
+                role=role,
+                decision=human_decision,
+                reason=decision_reason,
+                hold_type=hold_type,
+                hold_reason=hold_reason_code,
+                candidate_folder_id=folder_id,
+                feedback_link=feedback_link,
+                dashboard_link=self._build_dashboard_link(role),
+                risk_flags=evaluation.risk_flags or result.risk_flags,
+            )
+
+            logger.info(
+                "Riva L1 evaluation completed for %s",
+                folder_name,
+                extra={
+                    "correlation_id": candidate_correlation_id,
+                    "candidate_name": folder_name,
+                    "decision": pipeline_decision,
+                    "fit_score": result.fit_score,
+                },
+            )
+
+            # Log structured evaluation and audit event
+            if self.memory_enabled and self.memory:
+                try:
+                    # Create debug payload
+                    debug_payload = {
+                        "candidate_id": folder_id,
+                        "candidate_name": folder_name,
+                        "stage": "L1",
+                        "prompt": "RIVA_L1_PROMPT",  # Could extract from service
+                        "raw_response": result.model_dump(),
+                        "bundle_meta": bundle_meta,
+                        "decision_trace": {
+                            "pipeline_decision": pipeline_decision,
+                            "decision_reason": decision_reason,
+                            "hold_type": hold_type,
+                        },
+                    }
+                    debug_storage = get_debug_storage()
+                    # Async: only the returned URI is consumed here, and the
+                    # filename is deterministic, so the upload itself can run
+                    # off the evaluation path.
+                    debug_uri = debug_storage.upload_debug_payload_async(
+                        debug_payload,
+                        prefix="riva_l1",
+                        run_id=self.correlation_id
+                    )
+
+                    # Log evaluation
+                    self.memory.log_evaluation({
+                        "candidate_id": folder_id,
+                        "stage": "L1",
+                        "engine": "RIVA",
+                        "scores": evaluation.scores,
+                        "risk_flags": evaluation.risk_flags or [],
+                        "reason_codes": [],  # Not available in current model
+                        "raw_recommendation": result.final_decision,
+                        "decision_outcome": pipeline_decision,
+                        "prompt_version": "v1.0",
+                        "decision_logic_version": "v2.0",  # Updated with new engine
+                        "model_version": "gpt-4",  # Could be dynamic
+                        "debug_payload_uri": debug_uri,
+                    })
+
+                    # Log audit event for state transition
+                    self.memory.log_audit_event(
+                        actor="RIVA",
+                        action="L1_EVALUATION_COMPLETE",
+                        from_state="PENDING_L1",
+                        to_state=pipeline_decision,
+                        metadata={
+                            "candidate_id": folder_id,
+                            "candidate_name": folder_name,
+                            "role": role,
+                            "fit_score": result.fit_score,
+                        }
+                    )
+                except Exception as log_err:
+                    logger.warning(f"Failed to log evaluation/audit: {log_err}", exc_info=True)
+
+            self._persist_l1_result(
+                folder_id,
+                result,
+                evaluation,
+                pipeline_decision,
+                candidate_correlation_id,
+            )
+
+            RivaOutputWriter.generate_riva_report(folder_id, result)
+            if pipeline_decision == "SEND_TO_L2":
+                RivaOutputWriter.generate_l2_questionnaire(folder_id, result)
+
+            artifacts = {
+                "folder_id": folder_id,
+                "l1_result_path": self.RESULT_FILENAME,
+                "status_path": self.STATUS_FILENAME,
+            }
+            self._persist_memory_state(
+                evaluation=evaluation,
+                candidate_name=folder_name,
+                bundle=bundle,
+                artifacts=artifacts,
+                role_profile=role_profile,
+            )
+
+            self._log_decision(
+                candidate_name=folder_name,
+                role=role,
+                correlation_id=candidate_correlation_id,
+                result=result,
+                evaluation=evaluation,
+                pipeline_recommendation=pipeline_decision,
+                candidate_folder_id=folder_id,
+                hold_reason_code=hold_reason_code,
+                hold_type=hold_type,
+                bundle_meta=bundle_meta,
+            )
+
+            self._route_candidate(
+                pipeline_decision,
+                folder_id,
+                role,
+                folder_name,
+                candidate_correlation_id,
+                source_folder_id=l1_folder_id,
+            )
+
+            self.summary.evaluated += 1
+
+        except Exception as e:
+            logger.error(
+                "Error processing candidate %s: %s",
+                folder_name,
+                str(e),
+                extra={
+                    "correlation_id": candidate_correlation_id,
+                    "candidate_name": folder_name,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            print(f"❌ Error processing {folder_name}: {str(e)}")
+            traceback.print_exc()
+            self._record_batch_error(
+                error_code=self._derive_error_code(e),
+                error_message="Candidate processing failed; please review this folder manually.",
+                candidate_name=folder_name,
+                role=role,
+                folder_id=folder_id,
+                technical_detail=str(e),
+            )
+
+    def process_single_candidate(
+        self,
+        role_name: str,
+        candidate_folder_id: str,
+        candidate_name: Optional[str] = None,
+    ) -> L1BatchSummary:
+        """
+        Evaluate one candidate folder directly, bypassing role enumeration.
+
+        Used by on-demand Slack reviews: the caller already knows the
+        candidate folder, so no role folders are listed and no
+        normalization pass runs.
+        """
+        candidate = {
+            "id": candidate_folder_id,
+            "name": candidate_name or candidate_folder_id,
+            "mimeType": "application/vnd.google-apps.folder",
+        }
+        self._process_candidate(role_name, L1_FOLDERS.get(role_name), candidate)
+        return self.summary
+
+    def process_candidates_batch(
+        self,
+        role_name: str,
+        folder_ids: List[str],
+        candidate_names: Optional[List[str]] = None,
+    ) -> L1BatchSummary:
+        """
+        Evaluate several candidate folders of one role in a single run.
+
+        Used by multi-candidate Slack reviews: the caller has already
+        resolved the folder ids, so one processor carries the shared
+        role context (prompts, role folder id) across all candidates
+        instead of rebuilding it per invocation.
+        """
+        names = candidate_names or folder_ids
+        l1_folder_id = L1_FOLDERS.get(role_name)
+        for folder_id, name in zip(folder_ids, names):
+            candidate = {
+                "id": folder_id,
+                "name": name or folder_id,
+                "mimeType": "application/vnd.google-apps.folder",
+            }
+            self._process_candidate(role_name, l1_folder_id, candidate)
+        return self.summary
+
     # -------------------------------------------------------
     # HELPERS
     # -------------------------------------------------------
@@ -988,7 +1049,9 @@ class RivaL1BatchProcessor:
 
         if self.use_candidate_memory:
             candidate_profile = self.memory.get_candidate_profile(candidate_id)
-            candidate_events = self.memory.get_candidate_events(candidate_id, limit=3)
+            # Summary variant: the prompt context below only reads
+            # stage/agent/decision/confidence, so skip the JSON blobs.
+            candidate_events = self.memory.get_candidate_events_summary(candidate_id, limit=3)
             if candidate_profile:
                 context_sections.append(
                     "Candidate profile: "
@@ -1122,6 +1185,7 @@ class RivaL1BatchProcessor:
         role: str,
         folder_name: str,
         correlation_id: str,
+        source_folder_id: Optional[str] = None,
     ) -> None:
         if recommendation == "SEND_TO_L2":
             target_folder = get_l2_folder(role)
@@ -1135,7 +1199,7 @@ class RivaL1BatchProcessor:
                     },
                 )
                 return
-            self.drive.move_folder(folder_id, target_folder)
+            self.drive.move_folder(folder_id, target_folder, source_folder_id)
             logger.info(
                 "candidate_moved_to_l2",
                 extra={
@@ -1158,7 +1222,7 @@ class RivaL1BatchProcessor:
                     },
                 )
                 return
-            self.drive.move_folder(folder_id, target_folder)
+            self.drive.move_folder(folder_id, target_folder, source_folder_id)
             logger.info(
                 "candidate_moved_to_l1_reject",
                 extra={
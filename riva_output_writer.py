@@ -1,6 +1,5 @@
 # riva_output_writer.py
 
-import io
 from googleapiclient.http import MediaIoBaseUpload
 
 from drive_service import DriveManager
@@ -20,9 +19,9 @@ class RivaOutputWriter:
     def __init__(self):
         self.drive = DriveManager()
 
-    def _upload_bytes(self, folder_id: str, filename: str, mime_type: str, data: bytes):
+    def _upload_stream(self, folder_id: str, filename: str, mime_type: str, stream):
         """
-        Upload raw bytes to Google Drive under a given filename.
+        Upload a seekable binary stream to Google Drive under a given filename.
         """
 
         file_metadata = {
@@ -30,7 +29,7 @@ class RivaOutputWriter:
             "parents": [folder_id]
         }
 
-        media = MediaIoBaseUpload(io.BytesIO(data), mimetype=mime_type, resumable=False)
+        media = MediaIoBaseUpload(stream, mimetype=mime_type, resumable=False)
 
         self.drive.service.files().create(
             body=file_metadata,
@@ -51,13 +50,13 @@ class RivaOutputWriter:
         Generate L1 evaluation report and upload into Drive.
         """
         writer = cls()
-        doc_bytes = build_riva_report_docx(result)
+        doc_stream = build_riva_report_docx(result)
 
-        writer._upload_bytes(
+        writer._upload_stream(
             folder_id=folder_id,
             filename=cls.REPORT_NAME,
             mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            data=doc_bytes
+            stream=doc_stream
         )
 
     @classmethod
@@ -66,11 +65,11 @@ class RivaOutputWriter:
         Generate a personalized L2 questionnaire based on the L1 evaluation.
         """
         writer = cls()
-        doc_bytes = build_l2_questionnaire(result)
+        doc_stream = build_l2_questionnaire(result)
 
-        writer._upload_bytes(
+        writer._upload_stream(
             folder_id=folder_id,
             filename=cls.QUESTIONNAIRE_NAME,
             mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            data=doc_bytes
+            stream=doc_stream
         )
@@ -0,0 +1,50 @@
+"""Process-wide cached Google service clients for standalone scripts.
+
+The maintenance scripts each built a fresh discovery client (and therefore a
+fresh TLS + auth handshake) on every run-through. These factories construct
+each client once per process and reuse the underlying authorized transport
+across calls.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+
+from google_auth_utils import load_service_account_credentials
+
+DEFAULT_SERVICE_ACCOUNT_FILE = "infrastructure/service_account.json"
+DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
+SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+
+@lru_cache(maxsize=None)
+def _authorized_http(scopes: tuple) -> google_auth_httplib2.AuthorizedHttp:
+    creds_tuple = load_service_account_credentials(list(scopes))
+    if creds_tuple:
+        creds = creds_tuple[0]
+    elif os.path.exists(DEFAULT_SERVICE_ACCOUNT_FILE):
+        # Same fallback the standalone scripts used before sharing clients.
+        creds = service_account.Credentials.from_service_account_file(
+            DEFAULT_SERVICE_ACCOUNT_FILE, scopes=list(scopes)
+        )
+    else:
+        raise RuntimeError("Service account credentials not configured")
+    return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+
+
+@lru_cache(maxsize=None)
+def sheets_service():
+    """Return the shared Sheets v4 client (one per process)."""
+    return build("sheets", "v4", http=_authorized_http(tuple(SHEETS_SCOPES)))
+
+
+@lru_cache(maxsize=None)
+def drive_service():
+    """Return the shared Drive v3 client (one per process)."""
+    return build("drive", "v3", http=_authorized_http(tuple(DRIVE_SCOPES)))
@@ -87,6 +87,49 @@ class SheetManager:
 
         self.service = build("sheets", "v4", credentials=creds)
 
+    # ------------------------------------------------------------------
+    # Append many rows to a sheet tab in one write
+    # ------------------------------------------------------------------
+    def append_rows(self, sheet_id: str, sheet_name: str, rows: List[List]):
+        """
+        Append multiple rows with a single values.append call.
+
+        One request for the whole batch instead of one per row keeps batch
+        runs inside the Sheets write quota.
+        """
+        if not rows:
+            return {}
+
+        # Make sure we don't exceed 26 columns (A–Z)
+        trimmed = [row[:26] if len(row) > 26 else row for row in rows]
+
+        range_name = f"{sheet_name}!A1:Z"
+
+        request = (
+            self.service.spreadsheets()
+            .values()
+            .append(
+                spreadsheetId=sheet_id,
+                range=range_name,
+                valueInputOption="USER_ENTERED",
+                insertDataOption="INSERT_ROWS",
+                body={"values": trimmed},
+            )
+        )
+
+        response = request.execute()
+        logger.info(
+            "sheet_rows_appended",
+            extra={
+                "correlation_id": self.correlation_id,
+                "sheet_id": sheet_id,
+                "sheet_name": sheet_name,
+                "row_count": len(trimmed),
+                "range": response.get("updates", {}).get("updatedRange"),
+            },
+        )
+        return response
+
 
 def get_sheets_service():
     creds_tuple = _load_service_account_credentials()
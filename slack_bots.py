@@ -277,7 +277,7 @@ class RivaSlackBot(BaseSlackBot):
             return self._dispatch_response(self._handle_last_run_summary(), channel_id)
 
         if lowered.startswith("review "):
-            return self._dispatch_response(self._handle_manual_review(text), channel_id)
+            return self._dispatch_response(self._handle_manual_review(text, channel_id), channel_id)
 
         if lowered in ("help", "commands"):
             return self._dispatch_response(self._help_text(), channel_id)
@@ -304,18 +304,28 @@ class RivaSlackBot(BaseSlackBot):
 
         return None
     
-    def _handle_manual_review(self, text: str) -> CommandResult:
+    def _handle_manual_review(self, text: str, channel_id: Optional[str] = None) -> CommandResult:
         """
         Handle manual L1 review trigger.
-        
+
+        When a channel is known, the long review work runs on a background
+        worker and only a quick ack is returned; the result is posted to
+        the channel when it completes.
+
         Args:
             text: Command text
-            
+            channel_id: Slack channel for the deferred result
+
         Returns:
-            Review result message
+            Review result (or ack) message
         """
         from manual_review_triggers import handle_riva_manual_review
-        return handle_riva_manual_review(text)
+
+        notify = None
+        if channel_id and self._slack_client:
+            client = self._slack_client
+            notify = lambda message: client.post_message(message, channel_id)
+        return handle_riva_manual_review(text, notify=notify)
     
     def _handle_chat(self, user_message: str, channel_id: Optional[str] = None) -> CommandResult:
         """
@@ -664,7 +674,7 @@ class ArjunSlackBot(BaseSlackBot):
             return self._dispatch_response(self._handle_last_run_summary(), channel_id)
 
         if lowered.startswith("review "):
-            return self._dispatch_response(self._handle_manual_review(text), channel_id)
+            return self._dispatch_response(self._handle_manual_review(text, channel_id), channel_id)
 
         if lowered in ("help", "commands"):
             return self._dispatch_response(self._help_text(), channel_id)
@@ -691,18 +701,28 @@ class ArjunSlackBot(BaseSlackBot):
 
         return None
     
-    def _handle_manual_review(self, text: str) -> CommandResult:
+    def _handle_manual_review(self, text: str, channel_id: Optional[str] = None) -> CommandResult:
         """
         Handle manual L2 review trigger.
-        
+
+        When a channel is known, the long review work runs on a background
+        worker and only a quick ack is returned; the result is posted to
+        the channel when it completes.
+
         Args:
             text: Command text
-            
+            channel_id: Slack channel for the deferred result
+
         Returns:
-            Review result message
+            Review result (or ack) message
         """
         from manual_review_triggers import handle_arjun_manual_review
-        return handle_arjun_manual_review(text)
+
+        notify = None
+        if channel_id and self._slack_client:
+            client = self._slack_client
+            notify = lambda message: client.post_message(message, channel_id)
+        return handle_arjun_manual_review(text, notify=notify)
 
     # --------------------------------------------------
     def _handle_summary(self, payload: str) -> CommandResult:
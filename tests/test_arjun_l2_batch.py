@@ -122,7 +122,7 @@ def test_l2_routing_and_result_generation(mock_arjun_result):
     assert summary.data_incomplete == 0
     assert summary.candidates[0].risk_flags == ["Risk"]
 
-    drive.move_folder.assert_called_once_with("cand1", "final_folder")
+    drive.move_folder.assert_called_once_with("cand1", "final_folder", "role_folder")
     result_payloads = [data for _, filename, data in written if filename == "l2_result.json"]
     assert result_payloads
     payload = result_payloads[0]
@@ -182,7 +182,7 @@ def test_reject_routes_to_profiles_l2_rejected():
     )
 
     assert summary.rejects == 1
-    drive.move_folder.assert_called_once_with("cand1", "l2_reject_folder")
+    drive.move_folder.assert_called_once_with("cand1", "l2_reject_folder", "role_folder")
     payload = [data for _, filename, data in written if filename == "l2_result.json"][0]
     assert payload["final_recommendation"] == "REJECT"
     assert payload["l1_l2_comparison"] == "REGRESSED"
@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from decision_store import DecisionStore
+
+
+def _make_store():
+    sheet_manager = MagicMock()
+    store = DecisionStore(
+        sheet_manager=sheet_manager,
+        default_sheet_title="Decisions",
+        sheet_id="sheet-123",
+    )
+    return store, sheet_manager
+
+
+def _log_decision(store, candidate_id):
+    return store.log_l1_decision(
+        candidate_id=candidate_id,
+        candidate_name=f"Candidate {candidate_id}",
+        role_name="IT Support",
+        l1_score=80.0,
+        l1_decision="MOVE_TO_L2",
+        l1_strengths="strengths",
+        l1_concerns="concerns",
+    )
+
+
+def test_batch_buffers_rows_and_flushes_once():
+    store, sheet_manager = _make_store()
+
+    with store.batch():
+        first = _log_decision(store, "cand-1")
+        second = _log_decision(store, "cand-2")
+        sheet_manager.append_rows.assert_not_called()
+
+    assert first == {"buffered": True, "pending": 1}
+    assert second == {"buffered": True, "pending": 2}
+
+    sheet_manager.append_rows.assert_called_once()
+    sheet_id, sheet_name, rows = sheet_manager.append_rows.call_args.args
+    assert sheet_id == "sheet-123"
+    assert sheet_name == "Decisions"
+    assert len(rows) == 2
+    assert rows[0][0] == "cand-1" and rows[1][0] == "cand-2"
+
+
+def test_batch_discards_buffer_on_error():
+    store, sheet_manager = _make_store()
+
+    try:
+        with store.batch():
+            _log_decision(store, "cand-1")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    sheet_manager.append_rows.assert_not_called()
+    assert store._buffer == []
+
+
+def test_flush_failure_does_not_propagate():
+    store, sheet_manager = _make_store()
+    sheet_manager.append_rows.side_effect = RuntimeError("quota")
+
+    with store.batch():
+        _log_decision(store, "cand-1")
+
+    sheet_manager.append_rows.assert_called_once()
+
+
+def test_single_write_uses_append_rows_signature():
+    store, sheet_manager = _make_store()
+
+    _log_decision(store, "cand-1")
+
+    sheet_manager.append_rows.assert_called_once()
+    sheet_id, sheet_name, rows = sheet_manager.append_rows.call_args.args
+    assert sheet_id == "sheet-123"
+    assert sheet_name == "Decisions"
+    assert len(rows) == 1
@@ -0,0 +1,52 @@
+import io
+import sys
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import docx_builder
+
+
+def _result():
+    return SimpleNamespace(
+        match_summary="Strong match.",
+        strengths=["Python"],
+        concerns=["Notice period"],
+        red_flags=[],
+        communication_signals="Clear",
+        behavioral_signals="Calm",
+        compensation_alignment="Within band",
+        joining_feasibility="30 days",
+        final_decision="MOVE_TO_L2",
+    )
+
+
+def test_build_riva_report_docx_fast_path_is_valid_zip():
+    stream = docx_builder.build_riva_report_docx(_result())
+
+    with zipfile.ZipFile(stream) as zf:
+        assert "word/document.xml" in zf.namelist()
+        assert b"Strong match." in zf.read("word/document.xml")
+
+
+def test_fallback_resets_stream_after_partial_fast_path_write():
+    # Regression test: a fast-path failure after zipfile had already
+    # written bytes used to leave them in the stream, so the python-docx
+    # fallback appended to a corrupt prefix.
+    def _dirty_failure(paragraphs, out):
+        out.write(b"partial zip bytes")
+        raise RuntimeError("boom")
+
+    out = io.BytesIO()
+    with patch.object(docx_builder, "_write_fast_docx", _dirty_failure):
+        stream = docx_builder.build_riva_report_docx(_result(), out=out)
+
+    assert stream is out
+    assert not stream.getvalue().startswith(b"partial zip bytes")
+    with zipfile.ZipFile(stream) as zf:
+        assert "word/document.xml" in zf.namelist()
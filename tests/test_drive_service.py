@@ -0,0 +1,227 @@
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+import drive_service
+from drive_service import RETRY_TOTAL, DriveListingError, DriveManager
+
+
+def _make_drive_manager(export_bytes=b"exported text"):
+    """Build a DriveManager without credentials: only the attributes the
+    export path touches are populated."""
+    drive = DriveManager.__new__(DriveManager)
+    drive.correlation_id = "test"
+
+    response = MagicMock()
+    response.content = export_bytes
+    response.raise_for_status.return_value = None
+    session = MagicMock()
+    session.get.return_value.__enter__.return_value = response
+    drive._session = session
+    return drive
+
+
+def test_export_google_doc_to_text_returns_content():
+    # Regression test: a bad internal call signature used to raise a
+    # TypeError that the except-all swallowed, turning every single-file
+    # export into "" without any test noticing.
+    drive = _make_drive_manager(b"resume body")
+
+    text = drive.export_google_doc_to_text(
+        "doc-1", mime_type="application/vnd.google-apps.document"
+    )
+
+    assert text == "resume body"
+    drive._session.get.assert_called_once()
+    assert "doc-1" in drive._session.get.call_args.args[0]
+
+
+def test_export_google_doc_to_text_returns_empty_for_non_doc():
+    drive = _make_drive_manager()
+
+    text = drive.export_google_doc_to_text("pdf-1", mime_type="application/pdf")
+
+    assert text == ""
+    drive._session.get.assert_not_called()
+
+
+class _FakeRequest:
+    """Scripted discovery request: yields one (response, exception) pair
+    per execution attempt."""
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+
+    def next_outcome(self):
+        return self._outcomes.pop(0)
+
+
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest: feeds each added request's scripted
+    outcome to the callback on execute()."""
+
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._items = []
+
+    def add(self, request, request_id=None):
+        self._items.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._items:
+            response, exception = request.next_outcome()
+            self._callback(request_id, response, exception)
+
+
+def _drive_with_fake_listings(outcomes_by_parent):
+    """DriveManager whose files().list goes through _FakeBatch, scripted
+    per parent id with a list of (response, exception) outcomes."""
+    drive = DriveManager.__new__(DriveManager)
+    drive.correlation_id = "test"
+
+    requests = {
+        parent_id: _FakeRequest(outcomes)
+        for parent_id, outcomes in outcomes_by_parent.items()
+    }
+
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = _FakeBatch
+    service.files.return_value.list.side_effect = (
+        lambda q=None, **kwargs: requests[q.split("'")[1]]
+    )
+    drive.service = service
+    return drive
+
+
+def test_list_many_returns_items_per_parent():
+    drive = _drive_with_fake_listings(
+        {
+            "p1": [({"files": [{"id": "f1", "name": "A", "mimeType": "text/plain"}]}, None)],
+            "p2": [({"files": []}, None)],
+        }
+    )
+
+    results = drive.list_many(["p1", "p2"])
+
+    assert [item["id"] for item in results["p1"]] == ["f1"]
+    assert results["p2"] == []
+
+
+class _FakeHttpError(Exception):
+    """HttpError stand-in exposing the resp.status shape the retry
+    predicate checks."""
+
+    def __init__(self, status):
+        super().__init__(f"status {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+def test_list_many_retries_throttled_members():
+    # A 429 on an individual batch member gets no retry from num_retries;
+    # the member must be re-enqueued in a follow-up batch instead of
+    # failing the listing.
+    drive = _drive_with_fake_listings(
+        {
+            "p1": [
+                (None, _FakeHttpError(429)),
+                (None, _FakeHttpError(503)),
+                ({"files": [{"id": "f1", "name": "A", "mimeType": "text/plain"}]}, None),
+            ],
+        }
+    )
+
+    with patch.object(drive_service.time, "sleep") as fake_sleep:
+        results = drive.list_many(["p1"])
+
+    assert [item["id"] for item in results["p1"]] == ["f1"]
+    assert fake_sleep.call_count == 2
+
+
+def test_list_many_gives_up_after_bounded_retries():
+    drive = _drive_with_fake_listings(
+        {"p1": [(None, _FakeHttpError(429))] * (RETRY_TOTAL + 1)}
+    )
+
+    with patch.object(drive_service.time, "sleep"):
+        with pytest.raises(DriveListingError) as exc_info:
+            drive.list_many(["p1"])
+
+    assert set(exc_info.value.failures) == {"p1"}
+
+
+def test_get_mimetypes_retries_throttled_members():
+    drive = DriveManager.__new__(DriveManager)
+    drive.correlation_id = "test"
+    request = _FakeRequest(
+        [(None, _FakeHttpError(503)), ({"mimeType": "application/pdf"}, None)]
+    )
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = _FakeBatch
+    service.files.return_value.get.side_effect = lambda fileId=None, **kwargs: request
+    drive.service = service
+
+    with patch.object(drive_service.time, "sleep"):
+        assert drive.get_mimetypes(["f1"]) == {"f1": "application/pdf"}
+
+
+def test_list_many_raises_when_a_parent_listing_fails():
+    # A failed sub-request must not surface as an empty folder: empty
+    # listings route candidates into missing-document handling downstream.
+    drive = _drive_with_fake_listings(
+        {
+            "ok": [({"files": []}, None)],
+            "bad": [(None, RuntimeError("backend error"))],
+        }
+    )
+
+    with pytest.raises(DriveListingError) as exc_info:
+        drive.list_many(["ok", "bad"])
+
+    assert set(exc_info.value.failures) == {"bad"}
+
+
+def test_correlation_id_is_thread_local():
+    # A shared manager must not let concurrent Slack commands cross-label
+    # each other's log records: each thread carries its own label.
+    drive = DriveManager.__new__(DriveManager)
+    drive.correlation_id = "main-thread"
+
+    seen = {}
+
+    def _worker():
+        seen["initial"] = drive.correlation_id
+        drive.set_correlation_id("worker-thread")
+        seen["labelled"] = drive.correlation_id
+
+    worker = threading.Thread(target=_worker)
+    worker.start()
+    worker.join()
+
+    assert seen["initial"] == "no-correlation-id"
+    assert seen["labelled"] == "worker-thread"
+    assert drive.correlation_id == "main-thread"
+
+
+def test_service_override_is_respected():
+    # Assigning a mock client (as debug scripts do) must bypass the
+    # per-thread discovery client construction in every thread.
+    drive = DriveManager.__new__(DriveManager)
+    fake_client = MagicMock()
+    drive.service = fake_client
+
+    assert drive.service is fake_client
+
+    from_worker = []
+    worker = threading.Thread(target=lambda: from_worker.append(drive.service))
+    worker.start()
+    worker.join()
+
+    assert from_worker[0] is fake_client
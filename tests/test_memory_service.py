@@ -1,3 +1,5 @@
+import sqlite3
+
 from evaluation_models import CandidateEvent, CandidateProfile, RoleProfile
 from memory_service import MemoryService
 
@@ -60,4 +62,75 @@ def test_role_profile_upsert():
 
     fetched = service.get_role_profile("Engineering Manager")
     assert fetched is not None
-    assert fetched.rubric_version == "v2"
\ No newline at end of file
+    assert fetched.rubric_version == "v2"
+
+
+def _legacy_events_db(path) -> str:
+    """Create a pre-unique-index candidate_events table with duplicate rows."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE candidate_events ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, candidate_id VARCHAR(255) NOT NULL, "
+        "run_id VARCHAR(255) NOT NULL, stage VARCHAR(10) NOT NULL, "
+        "agent VARCHAR(50) NOT NULL, inputs_hash VARCHAR(64), scores JSON, "
+        "decision VARCHAR(50) NOT NULL, confidence FLOAT NOT NULL, "
+        "artifacts JSON, timestamp DATETIME)"
+    )
+    for decision in ("hold", "hold", "pass"):
+        conn.execute(
+            "INSERT INTO candidate_events "
+            "(candidate_id, run_id, stage, agent, decision, confidence) "
+            "VALUES ('folder-9', 'run-legacy', 'L1', 'riva', ?, 0.5)",
+            (decision,),
+        )
+    conn.commit()
+    conn.close()
+    return f"sqlite:///{path}"
+
+
+def test_legacy_duplicate_rows_are_migrated(tmp_path):
+    # A database written before the unique event index existed may hold
+    # duplicate (run_id, candidate_id, stage) rows; startup must collapse
+    # them (keeping the newest) so the index — and the ON CONFLICT dedup
+    # that depends on it — can be created.
+    db_path = tmp_path / "legacy.db"
+    service = MemoryService(db_url=_legacy_events_db(db_path), enabled=True)
+
+    assert service._event_dedup_index_ok
+
+    events = service.get_candidate_events("folder-9")
+    assert len(events) == 1
+    assert events[0].decision == "pass"
+
+    # Appends keep deduplicating through the freshly created index
+    event = CandidateEvent(
+        candidate_id="folder-9",
+        run_id="run-legacy",
+        stage="L1",
+        agent="riva",
+        decision="pass",
+        confidence=0.9,
+    )
+    service.append_candidate_event(event)
+    assert len(service.get_candidate_events("folder-9")) == 1
+
+
+def test_append_falls_back_without_unique_index():
+    # When the unique index could not be created, the append path must not
+    # emit ON CONFLICT (SQLite rejects it) and instead use the pre-SELECT
+    # guard, deduplicating both against the table and within the batch.
+    service = build_memory_service()
+    service._event_dedup_index_ok = False
+
+    event = CandidateEvent(
+        candidate_id="folder-10",
+        run_id="run-456",
+        stage="L1",
+        agent="riva",
+        decision="pass",
+        confidence=0.8,
+    )
+    service.append_candidate_events([event, event])
+    service.append_candidate_event(event)
+
+    assert len(service.get_candidate_events("folder-10")) == 1
\ No newline at end of file
@@ -150,8 +150,8 @@ def test_routing_and_l1_result_generation(mock_file_resolver, mock_normalizer):
     assert summary.data_incomplete == 0
 
     move_calls = [call.args for call in drive.move_folder.call_args_list]
-    assert ("Cand_L2", "l2_parent") in move_calls
-    assert ("Cand_REJECT", "reject_parent") in move_calls
+    assert ("Cand_L2", "l2_parent", "role_folder") in move_calls
+    assert ("Cand_REJECT", "reject_parent", "role_folder") in move_calls
 
     l1_result_payloads = [data for _, filename, data in written_files if filename == "l1_result.json"]
     assert len(l1_result_payloads) == 3